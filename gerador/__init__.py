@@ -0,0 +1,8 @@
+"""
+Motor de geração de contratos, independente do Streamlit.
+"""
+
+from gerador.contexto import usar_dados
+from gerador.motor import gerar_contrato
+
+__all__ = ["gerar_contrato", "usar_dados"]
@@ -0,0 +1,272 @@
+"""
+Backend em memória que imita o subconjunto do cliente Supabase usado
+pelo gerador (table/select/eq/ilike/order/range/insert/upsert/delete/rpc).
+
+Serve como substituto local para testes e desenvolvimento sem banco:
+as funções de gerador.persistencia rodam sem alteração contra ele.
+Reproduz também a unique constraint (imobiliaria, numero_contrato, versao)
+e a função salvar_contrato_nova_versao (snapshot/delta/hash) das migrations
+em supabase/.
+"""
+
+import copy
+import re
+import threading
+import uuid
+from datetime import datetime, timezone
+
+from postgrest.exceptions import APIError
+
+from gerador.persistencia import BASE_DESATUALIZADA, UNIQUE_VIOLATION
+
+# unique constraints reproduzidas (tabela -> colunas)
+CHAVES_UNICAS = {
+    "contratos": ("imobiliaria", "numero_contrato", "versao"),
+}
+
+
+def _like_para_regex(padrao: str) -> str:
+    """
+    LIKE do Postgres -> regex: % e _ viram curingas, \\ escapa o próximo.
+    """
+    partes, i = [], 0
+    while i < len(padrao):
+        c = padrao[i]
+        if c == "\\" and i + 1 < len(padrao):
+            partes.append(re.escape(padrao[i + 1]))
+            i += 2
+            continue
+        partes.append(".*" if c == "%" else "." if c == "_" else re.escape(c))
+        i += 1
+    return "".join(partes)
+
+
+class _Resposta:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class _Consulta:
+    """
+    Query builder encadeável: cada método devolve a própria consulta e
+    execute() aplica tudo sobre as linhas da tabela.
+    """
+
+    def __init__(self, backend: "SupabaseMemoria", tabela: str):
+        self._backend = backend
+        self._tabela = tabela
+        self._operacao = "select"
+        self._payload = None
+        self._colunas = None
+        self._filtros = []
+        self._ordem = []
+        self._limite = None
+        self._inicio = 0
+        self._contar = False
+
+    # ---------------- operação ----------------
+    def select(self, colunas: str = "*", count=None):
+        self._operacao = "select"
+        self._colunas = None if colunas.strip() == "*" else [c.strip() for c in colunas.split(",")]
+        self._contar = count is not None
+        return self
+
+    def insert(self, payload, **opcoes):
+        self._operacao, self._payload = "insert", payload
+        return self
+
+    def upsert(self, payload, **opcoes):
+        self._operacao, self._payload = "upsert", payload
+        return self
+
+    def update(self, payload):
+        self._operacao, self._payload = "update", payload
+        return self
+
+    def delete(self):
+        self._operacao = "delete"
+        return self
+
+    # ---------------- filtros ----------------
+    def eq(self, coluna: str, valor):
+        self._filtros.append(lambda r: r.get(coluna) == valor)
+        return self
+
+    def ilike(self, coluna: str, padrao: str):
+        regex = re.compile(_like_para_regex(padrao), re.IGNORECASE | re.DOTALL)
+        self._filtros.append(lambda r: r.get(coluna) is not None and regex.fullmatch(str(r.get(coluna))) is not None)
+        return self
+
+    def gte(self, coluna: str, valor):
+        self._filtros.append(lambda r: r.get(coluna) is not None and r.get(coluna) >= valor)
+        return self
+
+    def lte(self, coluna: str, valor):
+        self._filtros.append(lambda r: r.get(coluna) is not None and r.get(coluna) <= valor)
+        return self
+
+    def in_(self, coluna: str, valores):
+        valores = list(valores)
+        self._filtros.append(lambda r: r.get(coluna) in valores)
+        return self
+
+    def order(self, coluna: str, desc: bool = False):
+        self._ordem.append((coluna, desc))
+        return self
+
+    def limit(self, n: int):
+        self._limite = n
+        return self
+
+    def range(self, inicio: int, fim: int):
+        self._inicio, self._limite = inicio, fim - inicio + 1
+        return self
+
+    # ---------------- execução ----------------
+    def _filtrar(self, linhas):
+        return [r for r in linhas if all(f(r) for f in self._filtros)]
+
+    def execute(self) -> _Resposta:
+        with self._backend._lock:
+            linhas = self._backend._tabelas.setdefault(self._tabela, [])
+
+            if self._operacao in ("insert", "upsert"):
+                itens = self._payload if isinstance(self._payload, list) else [self._payload]
+                out = [self._backend._gravar(self._tabela, dict(i), upsert=(self._operacao == "upsert")) for i in itens]
+                return _Resposta(copy.deepcopy(out))
+
+            alvo = self._filtrar(linhas)
+
+            if self._operacao == "update":
+                for r in alvo:
+                    r.update(copy.deepcopy(self._payload))
+                return _Resposta(copy.deepcopy(alvo))
+
+            if self._operacao == "delete":
+                ids = {id(r) for r in alvo}
+                linhas[:] = [r for r in linhas if id(r) not in ids]
+                return _Resposta(copy.deepcopy(alvo))
+
+            total = len(alvo)
+            for coluna, desc in reversed(self._ordem):
+                alvo = sorted(alvo, key=lambda r: (r.get(coluna) is None, r.get(coluna)), reverse=desc)
+            fim = None if self._limite is None else self._inicio + self._limite
+            alvo = alvo[self._inicio:fim]
+            if self._colunas:
+                alvo = [{c: r.get(c) for c in self._colunas} for r in alvo]
+            return _Resposta(copy.deepcopy(alvo), count=total if self._contar else None)
+
+
+class _ChamadaRpc:
+    def __init__(self, func, params):
+        self._func = func
+        self._params = params
+
+    def execute(self) -> _Resposta:
+        return _Resposta(self._func(**self._params))
+
+
+class SupabaseMemoria:
+    """
+    Substituto local do supabase.Client. Thread-safe: um lock protege
+    todas as tabelas, como uma transação serializável.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._tabelas: dict[str, list[dict]] = {}
+        self._funcoes = {
+            "salvar_contrato_nova_versao": self._rpc_salvar_contrato_nova_versao,
+        }
+
+    def table(self, nome: str) -> _Consulta:
+        return _Consulta(self, nome)
+
+    def rpc(self, nome: str, params: dict) -> _ChamadaRpc:
+        if nome not in self._funcoes:
+            raise APIError({"code": "PGRST202", "message": f"função {nome} não existe"})
+        return _ChamadaRpc(self._funcoes[nome], params)
+
+    # ---------------- internos ----------------
+    def _gravar(self, tabela: str, linha: dict, upsert: bool) -> dict:
+        linhas = self._tabelas.setdefault(tabela, [])
+
+        if upsert and linha.get("id"):
+            for r in linhas:
+                if r.get("id") == linha["id"]:
+                    r.update(copy.deepcopy(linha))
+                    return r
+
+        chave = CHAVES_UNICAS.get(tabela)
+        if chave:
+            valor = tuple(linha.get(c) for c in chave)
+            if any(tuple(r.get(c) for c in chave) == valor for r in linhas):
+                raise APIError({
+                    "code": UNIQUE_VIOLATION,
+                    "message": f"duplicate key value violates unique constraint on {tabela} {chave}",
+                })
+
+        linha.setdefault("id", str(uuid.uuid4()))
+        linha = copy.deepcopy(linha)
+        linhas.append(linha)
+        return linha
+
+    def _rpc_salvar_contrato_nova_versao(
+        self,
+        p_imobiliaria: str,
+        p_numero_contrato: str,
+        p_dados: dict = None,
+        p_patch: list = None,
+        p_base_versao: int = None,
+        p_intervalo_snapshot: int = 20,
+        p_hash: str = None,
+    ):
+        with self._lock:
+            linhas = self._tabelas.setdefault("contratos", [])
+            ultima = max(
+                (r for r in linhas
+                 if r.get("imobiliaria") == p_imobiliaria and r.get("numero_contrato") == p_numero_contrato),
+                key=lambda r: r["versao"],
+                default=None,
+            )
+
+            if p_hash is not None and ultima and ultima.get("hash_conteudo") == p_hash:
+                return [{
+                    "id": ultima["id"],
+                    "versao": ultima["versao"],
+                    "numero_versao_label": ultima["numero_versao_label"],
+                    "formato": ultima["formato"],
+                    "inalterado": True,
+                }]
+
+            versao = (ultima["versao"] if ultima else 0) + 1
+
+            if p_patch is not None and p_base_versao == versao - 1 and (versao - 1) % p_intervalo_snapshot != 0:
+                formato = "delta"
+            elif p_dados is not None:
+                formato = "snapshot"
+            else:
+                raise APIError({"code": BASE_DESATUALIZADA, "message": f"base_desatualizada: versão atual é {versao - 1}"})
+
+            agora = datetime.now(timezone.utc).isoformat()
+            nova = self._gravar("contratos", {
+                "imobiliaria": p_imobiliaria,
+                "numero_contrato": p_numero_contrato,
+                "versao": versao,
+                "numero_versao_label": f"versao_{versao}",
+                "formato": formato,
+                "dados": p_dados if formato == "snapshot" else None,
+                "patch": p_patch if formato == "delta" else None,
+                "base_versao": p_base_versao if formato == "delta" else None,
+                "hash_conteudo": p_hash,
+                "created_at": agora,
+                "updated_at": agora,
+            }, upsert=False)
+            return [{
+                "id": nova["id"],
+                "versao": versao,
+                "numero_versao_label": nova["numero_versao_label"],
+                "formato": formato,
+                "inalterado": False,
+            }]
@@ -0,0 +1,121 @@
+"""
+Cache em disco (SQLite) das consultas externas, compartilhado por todas
+as sessões e processos da máquina.
+
+Guarda respostas positivas e negativas ("CEP não existe") com TTL
+próprio; falha de rede não é guardada. O diretório vem da variável de
+ambiente GERADOR_CACHE_DIR (padrão: .cache/ na pasta do app). Qualquer
+erro do SQLite ou do disco (disco cheio, permissão, diretório que não pode
+ser criado) vira "não achei" — o cache nunca derruba a consulta.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DIR_CACHE_PADRAO = ".cache"
+ARQUIVO_CACHE = "consultas.sqlite3"
+
+
+def diretorio_cache() -> str:
+    return os.environ.get("GERADOR_CACHE_DIR", "").strip() or DIR_CACHE_PADRAO
+
+
+class CacheConsultas:
+    """
+    (tipo, chave) -> valor JSON (ou None = resposta negativa) com validade.
+
+    Uma conexão por thread (sqlite3 não compartilha conexão entre
+    threads); WAL permite leitores e um escritor ao mesmo tempo entre
+    processos.
+    """
+
+    def __init__(self, caminho: str = None, relogio=time.time):
+        self._caminho = caminho
+        self._relogio = relogio
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.acertos_negativos = 0
+        self.falhas = 0
+        self.erros = 0
+
+    @property
+    def caminho(self) -> str:
+        return self._caminho or os.path.join(diretorio_cache(), ARQUIVO_CACHE)
+
+    def _conexao(self) -> sqlite3.Connection:
+        con = getattr(self._local, "con", None)
+        if con is None:
+            os.makedirs(os.path.dirname(self.caminho) or ".", exist_ok=True)
+            con = sqlite3.connect(self.caminho, timeout=2.0, isolation_level=None)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS consultas ("
+                " tipo TEXT NOT NULL, chave TEXT NOT NULL, valor TEXT, expira REAL NOT NULL,"
+                " PRIMARY KEY (tipo, chave))"
+            )
+            self._local.con = con
+        return con
+
+    def _contar(self, campo: str):
+        with self._lock:
+            setattr(self, campo, getattr(self, campo) + 1)
+
+    def obter(self, tipo: str, chave: str) -> tuple[bool, object]:
+        """
+        (achou, valor). achou=True com valor None é resposta negativa em cache.
+        """
+        try:
+            linha = self._conexao().execute(
+                "SELECT valor, expira FROM consultas WHERE tipo = ? AND chave = ?", (tipo, chave)
+            ).fetchone()
+        except (sqlite3.Error, OSError):
+            self._contar("erros")
+            return False, None
+
+        if linha is None or linha[1] <= self._relogio():
+            self._contar("falhas")
+            return False, None
+        if linha[0] is None:
+            self._contar("acertos_negativos")
+            return True, None
+        self._contar("acertos")
+        return True, json.loads(linha[0])
+
+    def gravar(self, tipo: str, chave: str, valor, ttl_s: float):
+        """
+        valor=None grava resposta negativa.
+        """
+        bruto = None if valor is None else json.dumps(valor, ensure_ascii=False)
+        try:
+            self._conexao().execute(
+                "INSERT OR REPLACE INTO consultas (tipo, chave, valor, expira) VALUES (?, ?, ?, ?)",
+                (tipo, chave, bruto, self._relogio() + ttl_s),
+            )
+        except (sqlite3.Error, OSError):
+            self._contar("erros")
+
+    def limpar_expirados(self) -> int:
+        try:
+            cur = self._conexao().execute("DELETE FROM consultas WHERE expira <= ?", (self._relogio(),))
+            return cur.rowcount
+        except (sqlite3.Error, OSError):
+            self._contar("erros")
+            return 0
+
+    def estatisticas(self) -> dict:
+        with self._lock:
+            return {
+                "acertos": self.acertos,
+                "acertos_negativos": self.acertos_negativos,
+                "falhas": self.falhas,
+                "erros": self.erros,
+            }
+
+
+# ✅ único por processo; o arquivo SQLite é compartilhado entre processos
+CACHE_CONSULTAS = CacheConsultas()
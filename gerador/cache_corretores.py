@@ -0,0 +1,88 @@
+"""
+Cache de corretores por imobiliária, compartilhado por todas as sessões
+do processo.
+
+Antes cada sessão consultava a tabela inteira de corretores da sua
+imobiliária e guardava uma cópia. Aqui há uma lista por imobiliária,
+com TTL e invalidação explícita nas gravações; cada imobiliária tem um
+contador de versão, e a sessão só troca sua referência quando a versão
+muda.
+
+O que fica guardado é o que carregar() devolver; o app guarda um
+IndiceCorretores (gerador.indice_corretores), então o índice também é
+montado uma vez por versão e não a cada sessão/rerun.
+"""
+
+import threading
+import time
+
+TTL_CORRETORES_S = 300.0
+
+
+class CacheCorretores:
+    """
+    imobiliária -> (versão, corretores, instante da carga).
+
+    O valor entregue é compartilhado: quem lê não deve alterá-lo.
+    """
+
+    def __init__(self, ttl_s: float = TTL_CORRETORES_S, relogio=time.monotonic):
+        self.ttl_s = ttl_s
+        self._relogio = relogio
+        self._itens: dict[str, tuple[int, object, float]] = {}
+        self._versoes: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, tenant: str, carregar) -> tuple[int, object]:
+        """
+        (versão, valor) da imobiliária; chama carregar() se não houver
+        entrada válida. Exceções de carregar() sobem sem gravar nada.
+        """
+        agora = self._relogio()
+        with self._lock:
+            item = self._itens.get(tenant)
+            if item and agora - item[2] < self.ttl_s:
+                self.acertos += 1
+                return item[0], item[1]
+            self.falhas += 1
+            versao_na_carga = self._versoes.get(tenant, 0)
+
+        # consulta fora do lock (não segura as outras imobiliárias)
+        valor = carregar()
+
+        with self._lock:
+            # invalidado durante a consulta: entrega, mas não guarda dado velho
+            if self._versoes.get(tenant, 0) != versao_na_carga:
+                return self._versoes[tenant], valor
+            versao = versao_na_carga + 1
+            self._versoes[tenant] = versao
+            self._itens[tenant] = (versao, valor, self._relogio())
+            return versao, valor
+
+    def versao(self, tenant: str) -> int:
+        with self._lock:
+            return self._versoes.get(tenant, 0)
+
+    def invalidar(self, tenant: str):
+        """
+        Chamar após gravar/excluir corretor: a próxima leitura recarrega e
+        todas as sessões da imobiliária passam a ver a nova versão.
+        """
+        with self._lock:
+            self._itens.pop(tenant, None)
+            self._versoes[tenant] = self._versoes.get(tenant, 0) + 1
+
+    def limpar(self):
+        with self._lock:
+            for tenant in self._itens:
+                self._versoes[tenant] = self._versoes.get(tenant, 0) + 1
+            self._itens.clear()
+
+    def __len__(self):
+        return len(self._itens)
+
+
+# ✅ único por processo (compartilhado por todas as sessões)
+CACHE_CORRETORES = CacheCorretores()
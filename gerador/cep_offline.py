@@ -0,0 +1,257 @@
+"""
+Base de CEPs offline: índice binário ordenado, lido por mmap.
+
+Um arquivo de CEPs (texto delimitado, como os dumps públicos dos
+Correios/DNE convertidos para CSV) é compilado uma vez para um índice
+compacto; as consultas fazem busca binária direto no arquivo mapeado em
+memória, então todos os processos compartilham a mesma cópia somente
+leitura (page cache do sistema) e nada depende da internet.
+
+Formato do índice (little-endian):
+    cabeçalho   MAGICO (8 bytes) | n (uint32) | início dos textos (uint32)
+    registros   n x (cep uint32, deslocamento do texto uint32), ordenados por CEP
+    textos      uint16 tamanho + "logradouro␟bairro␟cidade␟uf" em UTF-8
+                (textos iguais são gravados uma vez só)
+
+Compilar:
+    python -m gerador.cep_offline ceps.csv [destino.idx]
+
+Por padrão o índice fica em GERADOR_CEP_INDICE ou, se não definido,
+em <GERADOR_CACHE_DIR>/ceps.idx.
+"""
+
+import argparse
+import csv
+import io
+import itertools
+import mmap
+import os
+import struct
+import sys
+import threading
+
+from gerador.cache_consultas import diretorio_cache
+from gerador.mascaras import mask_cep, normalizar_nome, so_digitos
+
+MAGICO = b"CEPIDX1\0"
+_CABECALHO = struct.Struct("<8sII")
+_REGISTRO = struct.Struct("<II")
+_TAMANHO = struct.Struct("<H")
+SEPARADOR = "\x1f"
+
+# cabeçalho do arquivo de origem (normalizado) -> campo
+COLUNAS_CEP = {
+    "cep": "cep",
+    "logradouro": "logradouro",
+    "log_no": "logradouro",
+    "endereco": "logradouro",
+    "bairro": "bairro",
+    "bai_no": "bairro",
+    "cidade": "cidade",
+    "localidade": "cidade",
+    "municipio": "cidade",
+    "loc_no": "cidade",
+    "uf": "uf",
+    "estado": "uf",
+    "ufe_sg": "uf",
+}
+# arquivo sem cabeçalho: colunas nesta ordem
+ORDEM_PADRAO = ("cep", "logradouro", "bairro", "cidade", "uf")
+
+
+def caminho_indice_padrao() -> str:
+    return os.environ.get("GERADOR_CEP_INDICE", "").strip() or os.path.join(diretorio_cache(), "ceps.idx")
+
+
+# ============================================================
+# COMPILAÇÃO
+# ============================================================
+
+def _ler_origem(caminho: str):
+    """
+    Gera (cep, logradouro, bairro, cidade, uf) de um arquivo delimitado
+    por '@' (DNE), ';', ',' ou tab, com ou sem cabeçalho.
+    """
+    with open(caminho, "rb") as f:
+        bruto = f.read()
+    try:
+        texto = bruto.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        texto = bruto.decode("cp1252", errors="replace")
+
+    amostra = texto[:8192]
+    try:
+        dialeto = csv.Sniffer().sniff(amostra, delimiters="@;,\t")
+    except csv.Error:
+        dialeto = csv.excel
+    leitor = csv.reader(io.StringIO(texto), dialeto)
+
+    primeira = next(leitor, None)
+    if primeira is None:
+        return
+    mapa = {i: COLUNAS_CEP.get(normalizar_nome(c).replace(" ", "_")) for i, c in enumerate(primeira)}
+    if "cep" in mapa.values():
+        linhas = leitor
+    else:
+        mapa = dict(enumerate(ORDEM_PADRAO))
+        linhas = itertools.chain([primeira], leitor)
+
+    for linha in linhas:
+        r = {campo: (linha[i].strip() if i < len(linha) else "") for i, campo in mapa.items() if campo}
+        cep = so_digitos(r.get("cep", ""))
+        if len(cep) != 8:
+            continue
+        yield int(cep), r.get("logradouro", ""), r.get("bairro", ""), r.get("cidade", ""), r.get("uf", "").upper()
+
+
+def compilar_indice(origem: str, destino: str = None) -> int:
+    """
+    Compila `origem` para o índice binário em `destino` (troca atômica:
+    processos com o índice antigo aberto continuam lendo o antigo).
+    CEP repetido: vale a última linha. Devolve quantos CEPs foram gravados.
+    """
+    destino = destino or caminho_indice_padrao()
+
+    por_cep = {}
+    for cep, logradouro, bairro, cidade, uf in _ler_origem(origem):
+        por_cep[cep] = SEPARADOR.join((logradouro, bairro, cidade, uf))
+
+    textos = bytearray()
+    deslocamentos = {}
+    registros = []
+    for cep in sorted(por_cep):
+        t = por_cep[cep]
+        if t not in deslocamentos:
+            # corta em fronteira de caractere (não no meio de um UTF-8 multibyte)
+            b = t.encode("utf-8")[:0xFFFF].decode("utf-8", errors="ignore").encode("utf-8")
+            deslocamentos[t] = len(textos)
+            textos += _TAMANHO.pack(len(b)) + b
+        registros.append((cep, deslocamentos[t]))
+
+    inicio_textos = _CABECALHO.size + len(registros) * _REGISTRO.size
+    os.makedirs(os.path.dirname(os.path.abspath(destino)), exist_ok=True)
+    tmp = f"{destino}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_CABECALHO.pack(MAGICO, len(registros), inicio_textos))
+        f.write(b"".join(_REGISTRO.pack(c, d) for c, d in registros))
+        f.write(textos)
+    os.replace(tmp, destino)
+    return len(registros)
+
+
+# ============================================================
+# CONSULTA
+# ============================================================
+
+class IndiceCep:
+    """
+    Índice compilado aberto por mmap (somente leitura). buscar() faz
+    busca binária sobre os registros de tamanho fixo.
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        with open(caminho, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magico, self.n, self._inicio_textos = _CABECALHO.unpack_from(self._mm, 0)
+        if magico != MAGICO:
+            self._mm.close()
+            raise ValueError(f"{caminho} não é um índice de CEP.")
+
+    def __len__(self):
+        return self.n
+
+    def _cep_em(self, i: int) -> int:
+        return _REGISTRO.unpack_from(self._mm, _CABECALHO.size + i * _REGISTRO.size)[0]
+
+    def buscar(self, cep: str):
+        """
+        Endereço no formato do ViaCEP (cep, logradouro, bairro,
+        localidade, uf) ou None se o CEP não está na base.
+        """
+        d = so_digitos(cep)
+        if len(d) != 8:
+            return None
+        try:
+            return self._buscar(int(d), d)
+        except ValueError:
+            # fechado por indice_cep_offline() ao reabrir o arquivo recompilado
+            if self._mm.closed:
+                return None
+            raise
+
+    def _buscar(self, alvo: int, d: str):
+
+        lo, hi = 0, self.n
+        while lo < hi:
+            meio = (lo + hi) // 2
+            if self._cep_em(meio) < alvo:
+                lo = meio + 1
+            else:
+                hi = meio
+        if lo == self.n:
+            return None
+        cep_achado, desloc = _REGISTRO.unpack_from(self._mm, _CABECALHO.size + lo * _REGISTRO.size)
+        if cep_achado != alvo:
+            return None
+
+        pos = self._inicio_textos + desloc
+        (tam,) = _TAMANHO.unpack_from(self._mm, pos)
+        partes = self._mm[pos + 2:pos + 2 + tam].decode("utf-8").split(SEPARADOR)
+        # texto cortado no limite de 64 KiB pode ter perdido os últimos campos
+        logradouro, bairro, cidade, uf = (partes + ["", "", ""])[:4]
+        return {"cep": mask_cep(d), "logradouro": logradouro, "bairro": bairro, "localidade": cidade, "uf": uf}
+
+    def fechar(self):
+        self._mm.close()
+
+
+_ABERTOS: dict[str, tuple[float, IndiceCep]] = {}
+_LOCK = threading.Lock()
+
+
+def indice_cep_offline():
+    """
+    Índice do caminho padrão, aberto uma vez por processo (reaberto se o
+    arquivo for recompilado). None se não existe índice.
+    """
+    caminho = caminho_indice_padrao()
+    try:
+        mtime = os.stat(caminho).st_mtime
+    except OSError:
+        return None
+    with _LOCK:
+        aberto = _ABERTOS.get(caminho)
+        if aberto and aberto[0] == mtime:
+            return aberto[1]
+        try:
+            indice = IndiceCep(caminho)
+        except (OSError, ValueError, struct.error):
+            return None
+        if aberto:
+            aberto[1].fechar()
+        _ABERTOS[caminho] = (mtime, indice)
+        return indice
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m gerador.cep_offline",
+        description="Compila um arquivo de CEPs (CSV / DNE '@') para o índice binário offline.",
+    )
+    parser.add_argument("origem", help="arquivo de CEPs (cep, logradouro, bairro, cidade, uf)")
+    parser.add_argument("destino", nargs="?", default=None, help=f"índice gerado (padrão: {caminho_indice_padrao()})")
+    args = parser.parse_args(argv)
+
+    destino = args.destino or caminho_indice_padrao()
+    n = compilar_indice(args.origem, destino)
+    print(f"{n} CEPs -> {destino} ({os.path.getsize(destino) / 1024:.0f} KiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1791 @@
+"""
+Cláusulas e qualificações do contrato (motor de texto).
+
+Todas as funções deste módulo leem os dados do contrato através de
+get()/get_list() de gerador.contexto, que apontam para o snapshot de dados
+ativo (ver gerador.contexto.usar_dados). Nada aqui depende do Streamlit.
+
+Os textos não levam HTML: uma cláusula devolve str (um parágrafo) ou uma
+lista de blocos de gerador.documento (vários parágrafos, data à direita,
+assinaturas); cada formato de saída decide como desenhar.
+"""
+
+from datetime import date
+
+from gerador.contexto import get, get_list
+from gerador.documento import DIREITA, assinatura, negrito, numerar, paragrafo
+from gerador.memo import memoizada
+
+
+# ============================================================
+# DATA POR EXTENSO (LOCAL E DATA DO CONTRATO)
+# ============================================================
+
+MESES_PT = [
+    "janeiro", "fevereiro", "março", "abril", "maio", "junho",
+    "julho", "agosto", "setembro", "outubro", "novembro", "dezembro"
+]
+
+def data_por_extenso(dt: date) -> str:
+    """
+    Retorna a data no formato: 04 de janeiro de 2026
+    """
+    return f"{dt.day:02d} de {MESES_PT[dt.month - 1]} de {dt.year}"
+
+def linha_local_data() -> str:
+    """
+    Monta linha do tipo:
+    Guarulhos/SP, 04 de janeiro de 2026.
+
+    Pega cidade/UF do endereço do imóvel:
+    - imovel__end__cidade
+    - imovel__end__uf
+
+    Se não existir cidade/UF, retorna só a data.
+    """
+    cidade = get("imovel__end__cidade", "").strip()
+    uf = get("imovel__end__uf", "").strip()
+
+    hoje = date.today()
+    dt_txt = data_por_extenso(hoje)
+
+    if cidade and uf:
+        return f"{cidade}/{uf}, {dt_txt}."
+    elif cidade:
+        return f"{cidade}, {dt_txt}."
+    else:
+        return f"{dt_txt}."
+
+
+# ============================================================
+# CLÁUSULAS: ENTREGA DE CHAVES (GERADOR + EDITOR)
+# ============================================================
+
+def clausulas_padrao_entrega_chaves() -> dict:
+    """
+    Retorna o dicionário PADRÃO (original) de textos para cada opção de entrega de chaves.
+    """
+    return {
+        "30 dias após crédito em conta": (
+            "Em até 30 (trinta) dias corridos após o valor total do IMÓVEL seja disponibilizado "
+            "ou creditado na conta corrente da PARTE VENDEDORA ou na conta de quem esta indicar expressamente."
+        ),
+        "30 dias após assinatura no Banco": (
+            "Em até 30 (trinta) dias corridos após assinatura da escritura definitiva perante "
+            "instituição financeira competente."
+        ),
+        "30 dias após assinatura do CCV": (
+            "Em até 30 (trinta) dias corridos após assinatura da PARTE COMPRADORA do presente instrumento."
+        ),
+        "No ato da assinatura no Banco": (
+            "No ato da assinatura da escritura definitiva perante instituição financeira competente."
+        ),
+        "No ato da assinatura do CCV": (
+            "No ato da assinatura da PARTE COMPRADORA do presente instrumento."
+        ),
+        "24 horas do crédito em conta": (
+            "Em até 24 (vinte e quatro) horas após o valor total do IMÓVEL seja disponibilizado "
+            "ou creditado na conta corrente da PARTE VENDEDORA ou na conta de quem esta indicar expressamente."
+        ),
+        "Escrever no contrato": (
+            "⚠️ Texto a ser redigido manualmente no contrato final (campo específico)."
+        ),
+    }
+
+
+def obter_clausula_entrega_chaves() -> str:
+    """
+    Retorna o texto final da cláusula de entrega de chaves com base na escolha do usuário.
+    Se o contrato não trouxer o dicionário editado, usa o PADRÃO.
+    """
+    escolha = get("entrega_chaves", "").strip()
+    if not escolha:
+        return ""
+
+    if escolha == "Escrever no contrato":
+        return get("entrega_chaves_texto", "").strip()
+
+    mapa = get("clausulas_entrega_chaves", {}) or clausulas_padrao_entrega_chaves()
+    return mapa.get(escolha, "")
+
+# ============================================================
+# TAGS PARA CONTRATO (injeção em Word/HTML/Texto)
+# ============================================================
+
+def tag_dias_entrega_chaves() -> str:
+    """
+    Retorna o texto que substitui a tag <DIAS_ENTREGA_DE_CHAVES> no contrato.
+
+    - Se a entrega for "Escrever no contrato", retorna o texto digitado no campo.
+    - Caso contrário, retorna o texto padrão (ou editado no admin) conforme o selectbox.
+    """
+    return obter_clausula_entrega_chaves().strip()
+
+# ============================================================
+# REGRAS DO CONTRATO (derivações por tipo)
+# ============================================================
+
+def papel_parte_vendedora_ou_cedente() -> str:
+    """
+    Decide automaticamente qual termo usar:
+    - "PARTE VENDEDORA" se for Compromisso de Compra e Venda
+    - "PARTE CEDENTE" se for Cessão de Posse e Direitos
+    """
+    tipo = get("contrato__tipo", "").strip().lower()
+
+    # ✅ ajuste seguro para variações de escrita
+    if "cessão" in tipo or "posse" in tipo:
+        return "PARTE CEDENTE"
+
+    # padrão: compromisso compra e venda
+    return "PARTE VENDEDORA"
+
+def tipo_juridico_contrato() -> str:
+    """
+    Define automaticamente o título jurídico do contrato.
+    - Compra e venda com financiamento -> "Compromisso de Venda e Compra de Imóvel com Financiamento"
+    - Compra e venda sem financiamento -> "Compromisso de Compra e Venda de Imóvel"
+    - Cessão de posse -> mantém o texto original (não existe financiamento)
+    """
+
+    tipo_raw = get("contrato__tipo", "").strip()
+    tipo_lower = tipo_raw.lower()
+
+    financiamento = get("preco_financiamento", "").strip()
+
+    # Cessão não muda e não tem financiamento
+    if "cessão" in tipo_lower or "posse" in tipo_lower:
+        return tipo_raw
+
+    # Compra e venda
+    if financiamento:
+        return "Compromisso de Venda e Compra de Imóvel com Financiamento"
+    return "Compromisso de Compra e Venda de Imóvel"
+
+
+def frase_adiante_designado() -> str:
+    """
+    Monta a frase variável conforme o tipo do contrato.
+    Exemplo:
+    'Adiante simplesmente designado como PARTE VENDEDORA'
+    """
+    papel = papel_parte_vendedora_ou_cedente()
+    return f"Adiante simplesmente designado como {papel}:"
+
+def papel_parte_compradora_ou_cessionaria() -> str:
+    """
+    Decide automaticamente qual termo usar:
+    - "PARTE COMPRADORA" se for Compromisso de Venda e Compra
+    - "PARTE CESSIONÁRIA" se for Cessão de Posse e Direitos
+    """
+    tipo = get("contrato__tipo", "").strip().lower()
+
+    if "cessão" in tipo or "posse" in tipo:
+        return "PARTE CESSIONÁRIA"
+
+    return "PARTE COMPRADORA"
+
+
+def frase_adiante_designado_compradora() -> str:
+    """
+    Monta a frase variável conforme o tipo do contrato.
+    Exemplo:
+    'Adiante simplesmente designado como PARTE COMPRADORA:'
+    """
+    papel = papel_parte_compradora_ou_cessionaria()
+    return f"Adiante simplesmente designado como {papel}:"
+
+# ============================================================
+# QUALIFICAÇÃO DAS PARTES (VENDEDOR / CEDENTE)
+# ============================================================
+
+def eh_feminino_pela_nacionalidade(nacionalidade: str) -> bool:
+    """
+    Determina o gênero presumido pelo termo da nacionalidade:
+    - 'brasileira' -> feminino
+    - 'brasileiro' -> masculino
+    Se não for possível inferir, retorna False (masculino por padrão).
+    """
+    nat = (nacionalidade or "").strip().lower()
+    return nat.endswith("a")  # brasileira, portuguesa, italiana...
+
+
+def ajustar_estado_civil_genero(estado_civil: str, nacionalidade: str) -> str:
+    """
+    Ajusta automaticamente solteiro/divorciado/viúvo conforme gênero inferido da nacionalidade.
+    Somente aplica quando:
+    - estado_civil estiver no formato com (a)
+    - e a nacionalidade for claramente masculina/feminina (termina com 'o' ou 'a')
+    """
+    ec = (estado_civil or "").strip().lower()
+    nat = (nacionalidade or "").strip().lower()
+
+    # Se não tiver o padrão (a), não mexe
+    if "(a)" not in ec:
+        return ec
+
+    feminino = eh_feminino_pela_nacionalidade(nat)
+
+    mapa = {
+        "solteiro(a)": ("solteiro", "solteira"),
+        "divorciado(a)": ("divorciado", "divorciada"),
+        "viúvo(a)": ("viúvo", "viúva"),
+        "casado(a)": ("casado", "casada"),
+    }
+
+    if ec in mapa:
+        masc, fem = mapa[ec]
+        return fem if feminino else masc
+
+    return ec
+
+def qualificar_pf(prefix: str) -> str:
+    """
+    Qualificação PF no padrão jurídico solicitado.
+
+    Regras:
+    - Se SOLTEIRO(A), DIVORCIADO(A) ou VIÚVO(A):
+        -> estado civil aparece na qualificação individual
+        -> ordem: NOME, NACIONALIDADE, ESTADO CIVIL, PROFISSÃO, RG, CPF, ENDEREÇO.
+    - Se CASADO(A) ou UNIÃO ESTÁVEL:
+        -> qualificação conjunta quando houver cônjuge/companheiro(a)
+        -> inclui "ambos casados entre si" / "conviventes em união estável entre si"
+        -> regime de bens aparece apenas uma vez
+        -> endereço aparece apenas uma vez no final
+    - Endereço sempre aparece ao final.
+    - ✅ Corrige automaticamente solteiro/divorciado/viúvo/casado conforme gênero inferido da nacionalidade.
+    """
+
+    # ============================
+    # Dados da pessoa principal
+    # ============================
+    nome = get(f"{prefix}__nome", "").strip().upper()
+    nacionalidade = get(f"{prefix}__nacionalidade", "").strip()
+    profissao = get(f"{prefix}__profissao", "").strip()
+    rg = get(f"{prefix}__rg", "").strip()
+    cpf = get(f"{prefix}__cpf", "").strip()
+    estado_civil_raw = get(f"{prefix}__estado_civil", "").strip()
+    regime_bens = get(f"{prefix}__regime_bens", "").strip()
+    endereco = get(f"{prefix}__end__texto", "").strip()
+
+    # ✅ estado civil ajustado por gênero (solteira/divorciada/viúva etc.)
+    estado_civil_ajustado = ajustar_estado_civil_genero(estado_civil_raw, nacionalidade)
+
+    # ============================
+    # Dados do cônjuge/companheiro(a)
+    # ============================
+    conj_nome = get(f"{prefix}__conj_nome", "").strip().upper()
+    conj_nacionalidade = get(f"{prefix}__conj_nacionalidade", "").strip()
+    conj_profissao = get(f"{prefix}__conj_profissao", "").strip()
+    conj_rg = get(f"{prefix}__conj_rg", "").strip()
+    conj_cpf = get(f"{prefix}__conj_cpf", "").strip()
+
+    # ============================
+    # Função auxiliar de qualificação individual
+    # ============================
+    def qual_individual(nome, nacionalidade, estado_civil, profissao, rg, cpf):
+        if not nome:
+            return ""
+
+        detalhes = []
+
+        if nacionalidade:
+            detalhes.append(nacionalidade)
+
+        # ✅ estado civil vem logo após nacionalidade quando for informado
+        if estado_civil:
+            detalhes.append(estado_civil)
+
+        if profissao:
+            detalhes.append(profissao)
+
+        if rg:
+            detalhes.append(f"RG n.º {rg}")
+
+        if cpf:
+            detalhes.append(f"CPF n.º {cpf}")
+
+        return f"{nome}, " + ", ".join(detalhes) if detalhes else nome
+
+    # ============================
+    # 1) SEM cônjuge/companheiro(a)
+    # ============================
+    if not conj_nome:
+        # ✅ inclui estado civil no corpo individual
+        texto = qual_individual(
+            nome, nacionalidade, estado_civil_ajustado, profissao, rg, cpf
+        )
+
+        # ✅ regime de bens apenas se CASADO(A) ou UNIÃO ESTÁVEL
+        if estado_civil_raw in ("casado(a)", "união estável") and regime_bens:
+            texto += f", sob o regime de {regime_bens}"
+
+        # ✅ endereço sempre no final
+        if endereco:
+            texto += f", com residência e domicílio em {endereco}."
+        else:
+            texto += "."
+
+        return texto
+
+    # ============================
+    # 2) COM cônjuge/companheiro(a)
+    # ============================
+    # ✅ quando há cônjuge, não repete estado civil individualmente
+    p1 = qual_individual(nome, nacionalidade, "", profissao, rg, cpf)
+    p2 = qual_individual(conj_nome, conj_nacionalidade, "", conj_profissao, conj_rg, conj_cpf)
+
+    # ✅ frase padrão do casal conforme estado civil
+    if estado_civil_raw == "união estável":
+        uniao_txt = "conviventes em união estável entre si"
+    else:
+        uniao_txt = "ambos casados entre si"
+
+    # ✅ regime de bens aparece apenas uma vez para o casal
+    regime_txt = f", sob o regime de {regime_bens}" if regime_bens else ""
+
+    # ✅ endereço aparece apenas uma vez para o casal
+    if endereco:
+        return f"{p1}, e {p2}, {uniao_txt}{regime_txt} e com residência e domicílio em {endereco}."
+
+    return f"{p1}, e {p2}, {uniao_txt}{regime_txt}."
+
+
+
+def qualificar_pj(prefix: str) -> str:
+    """
+    Monta a qualificação completa de uma Pessoa Jurídica, para uso no contrato.
+    """
+    razao = get(f"{prefix}__razao_social", "").strip().upper()
+    cnpj = get(f"{prefix}__cnpj", "").strip()
+    endereco = get(f"{prefix}__end__texto", "").strip()
+
+    rep_nome = get(f"{prefix}__rep_nome", "").strip().upper()
+    rep_cpf = get(f"{prefix}__rep_cpf", "").strip()
+
+    partes = []
+    if razao:
+        partes.append(razao)
+
+    detalhes = []
+    if cnpj:
+        detalhes.append(f"CNPJ n.º {cnpj}")
+    if endereco:
+        detalhes.append(f"com sede em {endereco}")
+
+    if rep_nome:
+        rep = f"neste ato representada por {rep_nome}"
+        if rep_cpf:
+            rep += f", CPF n.º {rep_cpf}"
+        rep += ", na forma de dua situação cadastral de pessoa jurídica da Receita Federal ou contrato social"
+        detalhes.append(rep)
+
+    if detalhes:
+        partes.append(", " + ", ".join(detalhes) + ".")
+
+    return "".join(partes).strip()
+
+
+@memoizada
+def qualificar_parte(prefix: str) -> str:
+    """
+    Decide automaticamente se a parte é PF ou PJ e chama a função correta.
+    """
+    tipo = get(f"{prefix}__tipo", "Pessoa Física").strip()
+
+    if tipo == "Pessoa Jurídica":
+        return qualificar_pj(prefix)
+
+    return qualificar_pf(prefix)
+
+
+def bloco_qualificacao_vendedores() -> list[dict]:
+    """
+    Gera o texto completo da qualificação da PARTE VENDEDORA / CEDENTE,
+    considerando 1 ou mais pessoas na lista "vendedores".
+
+    Retorna um parágrafo por pessoa.
+    """
+    vendedores = get_list("vendedores")
+    if not vendedores:
+        return []
+
+    textos = []
+    for pfx in vendedores:
+        t = qualificar_parte(pfx)
+        if t:
+            textos.append(t)
+
+    # cada pessoa em seu parágrafo (linha em branco entre elas, como no seu modelo)
+    return [paragrafo(t) for t in textos]
+
+def frase_adiante_designado_comprador() -> str:
+    """
+    Monta a frase variável conforme o tipo do contrato para comprador/cessionária.
+    """
+    papel = papel_parte_compradora_ou_cessionaria()
+    return f"Adiante simplesmente designado como {papel}:"
+
+
+def bloco_qualificacao_compradores() -> list[dict]:
+    """
+    Gera o texto completo da qualificação da PARTE COMPRADORA / CESSIONÁRIA,
+    considerando 1 ou mais pessoas na lista "compradores".
+
+    Retorna um parágrafo por pessoa.
+    """
+    compradores = get_list("compradores")
+    if not compradores:
+        return []
+
+    textos = []
+    for pfx in compradores:
+        t = qualificar_parte(pfx)
+        if t:
+            textos.append(t)
+
+    return [paragrafo(t) for t in textos]
+
+def bloco_intermediadora() -> str:
+    """
+    Retorna o texto FIXO da INTERMEDIADORA para o contrato.
+    Mais adiante, poderá virar dinâmico (lista de imobiliárias).
+    """
+    return (
+        "IMOBILIÁRIA MONTE SIÃO LTDA, pessoa jurídica de direito privado, "
+        "CNPJ n.º 30.177.724/0001-76, CRECI n.º 33.150-J, com sede na Rua Roberto, n.º 14, "
+        "Jardim Santa Mena, Guarulhos/SP - CEP: 07096-070, representada por "
+        "JOSIVAN MOURA DA SILVA, brasileiro, corretor de imóveis, RG n.º 55.786.890-7 SSP, "
+        "CPF n.º 343.173.968-74."
+    )
+
+def pagamento_juridico() -> list[dict]:
+    """
+    Monta automaticamente o texto jurídico (itens a-i) da forma de pagamento,
+    com base nos valores preenchidos no wizard (preco_sinal, preco_entrada, etc.).
+    Um parágrafo por item.
+    """
+
+    sinal = get("preco_sinal", "").strip()
+    entrada = get("preco_entrada", "").strip()
+    financiamento = get("preco_financiamento", "").strip()
+    fgts = get("preco_fgts", "").strip()
+    subsidio = get("preco_subsidio", "").strip()
+    recurso_proprio = get("preco_recurso_proprio", "").strip()
+    carta_credito = get("preco_carta_credito", "").strip()
+    parcelamento_total = get("preco_parcelamento_total", "").strip()
+    outros = get("preco_outros", "").strip()
+    outros_desc = get("preco_outros_descricao", "").strip()
+
+    # ✅ Se houver financiamento, o texto muda (instituição financeira)
+    ha_financiamento = bool(financiamento)
+
+    # Tag variável: se tem financiamento, "instituição financeira competente", senão "tabelião de notas competente"
+    destino_escritura = "instituição financeira competente" if ha_financiamento else "tabelião de notas competente"
+
+    itens = []
+
+    # a) SINAL
+    if sinal:
+        itens.append(
+            f"a) {sinal}, em moeda corrente nacional, como sinal e princípio de pagamento, "
+            f"que, com ciência e anuência da PARTE VENDEDORA, serão pagos diretamente à INTERMEDIADORA "
+            f"na assinatura deste instrumento em sua conta bancária ou a conta de quem indicar;"
+        )
+
+    # b) ENTRADA
+    if entrada:
+        itens.append(
+            f"b) {entrada}, em moeda corrente nacional, a serem pagos à PARTE VENDEDORA em sua conta bancária "
+            f"ou na conta de quem indicar no dia da assinatura da escritura perante {destino_escritura};"
+        )
+
+    # c) FINANCIAMENTO
+    if financiamento:
+        itens.append(
+            f"c) {financiamento}, através de financiamento bancário, a serem pagos à PARTE VENDEDORA;"
+        )
+
+    # d) FGTS
+    if fgts:
+        itens.append(
+            f"d) {fgts}, através de valores vinculados à conta do Fundo de Garantia do Tempo de Serviço - FGTS, "
+            f"a serem pagos à PARTE VENDEDORA;"
+        )
+
+    # e) SUBSÍDIO
+    if subsidio:
+        itens.append(
+            f"e) {subsidio}, mediante subsídio governamental a serem pagos à PARTE VENDEDORA;"
+        )
+
+    # f) RECURSO PRÓPRIO
+    if recurso_proprio:
+        itens.append(
+            f"f) {recurso_proprio}, em moeda corrente nacional, a serem transferidos à PARTE VENDEDORA em sua conta bancária "
+            f"ou a conta de quem indicar no dia da assinatura da escritura perante instituição financeira competente;"
+        )
+
+    # g) CARTA DE CRÉDITO
+    if carta_credito:
+        itens.append(
+            f"g) {carta_credito}, por intermédio de carta de crédito contemplada de titularidade da PARTE COMPRADORA;"
+        )
+
+    # h) PARCELAMENTO
+    if parcelamento_total:
+        itens.append(
+            f"h) {parcelamento_total} em parcelas, sob os seguintes pagamentos:"
+        )
+
+        # ✅ se você tiver tela detalhada, encaixa o texto aqui
+        if get("parcelamento_ativado", False) and get("parcelamento_descricao", "").strip():
+            itens.append(get("parcelamento_descricao", "").strip())
+
+    # i) OUTROS
+    if outros:
+        txt = f"i) {outros}, OUTROS"
+        if outros_desc:
+            txt += f": {outros_desc}"
+        txt += ";"
+        itens.append(txt)
+
+    return [paragrafo(t) for t in itens]
+
+def bloco_objeto() -> dict:
+    """
+    Retorna:
+    - objeto: itens que devem ficar dentro do box "DO OBJETO DO CONTRATO"
+    - secoes: itens que devem aparecer em boxes separados abaixo
+    """
+
+    # ============================
+    # Dados do imóvel
+    # ============================
+    tipo_imovel = get("imovel__tipo", "").strip()  # ✅ NOVO (já existe no seu wizard)
+    endereco_imovel = get("imovel__end__texto", "").strip()
+    matricula = get("imovel__matricula", "").strip()
+    cartorio = get("imovel__cartorio", "").strip()
+    comarca = get("imovel__cidade_cartorio", "").strip()
+    descricao_matricula = get("imovel__descricao_matricula", "").strip()
+    contribuinte = get("imovel__contribuinte", "").strip()
+
+    preco_total = get("preco_total", "").strip()
+
+    # ============================
+    # Helpers simples (gênero + preposição)
+    # ============================
+    def sufixo_situado(tipo: str) -> str:
+        t = (tipo or "").lower()
+        # feminino mais comum no seu conjunto
+        if t.startswith("casa"):
+            return "a"  # situada
+        return "o"      # situado
+
+    def preposicao_endereco(endereco: str) -> str:
+        e = (endereco or "").strip().lower()
+        # heurística: se começar por tipos comuns de logradouro, usar "na"
+        if e.startswith(("rua ", "avenida ", "alameda ", "travessa ", "estrada ", "rodovia ")):
+            return "na"
+        # fallback seguro
+        return "em"
+
+    # ============================
+    # Forma de pagamento (inalterado)
+    # ============================
+    texto_pagamento = pagamento_juridico()
+
+    # ============================
+    # Entrega de chaves (inalterado)
+    # ============================
+    texto_entrega = obter_clausula_entrega_chaves().strip()
+
+    # ============================
+    # OBJETO DO CONTRATO (um box único)
+    # ============================
+    linhas_objeto = []
+
+    # ✅ PRIMEIRA LINHA: tipo + endereço (como você pediu)
+    if endereco_imovel:
+        tipo_txt = (tipo_imovel or "imóvel").strip()
+        artigo_situado = sufixo_situado(tipo_txt)        # "o" ou "a"
+        prep = preposicao_endereco(endereco_imovel)      # "na" ou "em"
+        linhas_objeto.append(f"01 (um) {tipo_txt} situad{artigo_situado} {prep} {endereco_imovel}.")
+
+    # ✅ Matrícula / Cartório / Comarca (dentro do bloco)
+    linha_cartorio = []
+    if matricula:
+        linha_cartorio.append(f"MATRÍCULA: {matricula}")
+    if cartorio:
+        linha_cartorio.append(f"N.º DO CARTÓRIO: {cartorio}")
+    if comarca:
+        linha_cartorio.append(f"COMARCA DO CARTÓRIO: {comarca}")
+
+    if linha_cartorio:
+        linhas_objeto.append(" | ".join(linha_cartorio))
+
+    # ✅ Descrição na matrícula (dentro do bloco)
+    if descricao_matricula:
+        linhas_objeto.append(descricao_matricula)
+
+    # ✅ Nº do contribuinte (dentro do bloco)
+    if contribuinte:
+        linhas_objeto.append(f"Nº DO CONTRIBUINTE: {contribuinte}")
+
+    texto_objeto = [paragrafo(t) for t in linhas_objeto]
+
+    # ============================
+    # SEÇÕES SEPARADAS (cada uma em um box)
+    # ============================
+    secoes = {}
+
+    if preco_total:
+        secoes["DO VALOR DO IMÓVEL"] = preco_total
+
+    if texto_pagamento:
+        secoes["DA FORMA DE PAGAMENTO DO PREÇO"] = texto_pagamento
+
+
+    if texto_entrega:
+        secoes["DO PRAZO DE ENTREGA DAS CHAVES DO IMÓVEL"] = texto_entrega
+
+    return {
+        "objeto": texto_objeto,
+        "secoes": secoes
+    }
+
+def clausula_preambulo_clausulas_condicoes() -> str:
+    """
+    Texto imediatamente após o título 'DAS CLÁUSULAS E CONDIÇÕES'.
+    Varia se houver financiamento ou não.
+    """
+
+    financiamento = get("preco_financiamento", "").strip()
+    ha_financiamento = bool(financiamento)
+
+    # ✅ variável conforme financiamento
+    preambulo = "instituição financeira competente" if ha_financiamento else "tabelião de notas competente"
+
+    return (
+        "As partes qualificadas no quadro resumo pactuam entre si o presente compromisso de compra e venda "
+        "do IMÓVEL, o qual será oportunamente aperfeiçoado mediante instrumento celebrado perante "
+        f"{preambulo}, mediante as seguintes cláusulas e condições, a saber:"
+    )
+
+def nome_parte_assinatura(prefix: str) -> str:
+    """
+    Retorna o nome principal da parte para assinatura.
+    - Se PF: retorna prefix__nome
+    - Se PJ: retorna prefix__razao_social
+    """
+    tipo = get(f"{prefix}__tipo", "Pessoa Física").strip()
+
+    if tipo == "Pessoa Jurídica":
+        return get(f"{prefix}__razao_social", "").strip().upper()
+
+    return get(f"{prefix}__nome", "").strip().upper()
+
+
+def bloco_assinaturas_partes(titulo: str, lista_prefixos: list[str]) -> list[dict]:
+    """
+    Gera bloco de assinatura para N partes (PF ou PJ) com o formato:
+    TITULO:
+    ______________________
+    NOME
+    """
+    if not lista_prefixos:
+        return []
+
+    blocos = [paragrafo(negrito(f"{titulo}:"))]
+
+    for pfx in lista_prefixos:
+        nome = nome_parte_assinatura(pfx)
+        if not nome:
+            continue
+        blocos.append(assinatura(nome))
+
+    return blocos
+
+# ============================================================
+# CLÁUSULA (PLANILHA A FINAL!BH2 / BI2 / DW2)
+# DECLARAÇÕES INICIAIS
+# ============================================================
+
+def titulo_clausula_01() -> str:
+    return "DAS DECLARAÇÕES INICIAIS"
+
+def clausula_bh2_abertura_matricula() -> str:
+    """
+    Replica exatamente a lógica da planilha A FINAL!BH2.
+
+    Excel:
+    =SE(OU(IMÓVEL!E7=IMÓVEL!M7; IMÓVEL!E7=IMÓVEL!P7; IMÓVEL!E7=IMÓVEL!S7); TEXTO; "")
+
+    No seu sistema:
+    - Aplica quando o tipo do imóvel contém "matrícula em área maior"
+    """
+
+    tipo_imovel = get("imovel__tipo", "").strip().lower()
+
+    if "matrícula em área maior" in tipo_imovel:
+        return (
+            "A PARTE VENDEDORA declara que, na forma e sob as penas da lei, em relação à regularização da unidade "
+            "perante o registro de imóveis competente, providenciará abertura da matrícula da unidade do empreendimento "
+            "dentro de um prazo aproximado de até 90 (noventa) dias a partir da presente data, suportando o ônus de "
+            "todas as despesas pertinentes para tanto."
+        )
+
+    return ""
+
+def clausula_bi2_resilicao_por_forca_maior() -> str:
+    """
+    Replica exatamente a lógica da planilha A FINAL!BI2.
+
+    Excel:
+    =SE(OU(IMÓVEL!E7=IMÓVEL!M7; IMÓVEL!E7=IMÓVEL!P7; IMÓVEL!E7=IMÓVEL!S7); TEXTO; "")
+
+    No seu sistema:
+    - Aplica quando o tipo do imóvel contém "matrícula em área maior"
+    """
+
+    tipo_imovel = get("imovel__tipo", "").strip().lower()
+
+    if "matrícula em área maior" in tipo_imovel:
+        return (
+            "Se, por caso fortuito e força maior, a PARTE VENDEDORA não conseguir providenciar a "
+            "regularização da referida matrícula da unidade no prazo de até 90 (noventa) dias, este instrumento "
+            "será extinto mediante resilição, ficando as partes contratantes isentas de multa contratual entre si, "
+            "devendo assinar o instrumento extintivo do negócio ajustado num prazo máximo de até 5 (cinco) dias do "
+            "vencimento do mencionado prazo de validade, comprometendo-se a PARTE VENDEDORA, ainda, se houver "
+            "recebido ou se beneficiado de quaisquer valores e a qualquer título pagos ou desembolsados pela "
+            "PARTE COMPRADORA, restituí-los no prazo de até 30 (trinta) dias a partir dos citados 90 (noventa) dias, "
+            "sob pena de multa por infração contratual."
+        )
+
+    return ""
+
+def clausula_dw2_alienacao_fiduciaria() -> str:
+    """
+    Replica exatamente a lógica da planilha (DW2).
+
+    Excel:
+    =SE(IMÓVEL!I31="NÃO";"";SE('PREÇO E ENTREGA DE CHAVES'!E17<>""; TEXTO_A; TEXTO_B))
+
+    Aqui:
+    - IMÓVEL!I31 -> get("imovel__alienado")  ("SIM"/"NÃO")
+    - PREÇO E ENTREGA DE CHAVES!E17 -> get("preco_financiamento")
+    """
+
+    if get("imovel__alienado", "NÃO") != "SIM":
+        return ""
+
+    tem_financiamento = bool(get("preco_financiamento", "").strip())
+
+    if tem_financiamento:
+        return (
+            "A PARTE COMPRADORA declara plena ciência de que o IMÓVEL ora se encontra alienado fiduciariamente a uma "
+            "instituição financeira em razão de financiamento quando da aquisição da PARTE VENDEDORA, sendo que a quitação "
+            "do financiamento contratado pela PARTE VENDEDORA será realizada por intermédio da instituição financeira "
+            "competente ao financiamento a ser contratado pela PARTE COMPRADORA (interveniente quitante), conforme a forma "
+            "de pagamento estipulada neste instrumento."
+        )
+
+    return (
+        "A PARTE COMPRADORA declara plena ciência de que o IMÓVEL ora se encontra alienado fiduciariamente a uma instituição "
+        "financeira em razão de financiamento quando da aquisição pela PARTE VENDEDORA, sendo que a quitação do financiamento "
+        "contratado pela PARTE VENDEDORA será realizada por intermédio dos valores mencionados nas cláusulas seguintes."
+    )
+
+def clausula_bi2_propr_ou_posse() -> str:
+    """
+    Replica exatamente a lógica da planilha (BI2).
+
+    Excel:
+    =SE(DW2<>""; TEXTO_POSSE; TEXTO_PROPRIEDADE)
+
+    Aqui:
+    - DW2 equivale à cláusula de ALIENAÇÃO FIDUCIÁRIA (clausula_dw2_alienacao_fiduciaria()).
+    - Se DW2 existir (não vazio) => retorna texto de POSSE.
+    - Se DW2 não existir => retorna texto de PROPRIEDADE.
+    """
+
+    dw2 = clausula_dw2_alienacao_fiduciaria().strip()
+
+    if dw2:
+        return (
+            "A PARTE VENDEDORA declara que é legítima possuidora do IMÓVEL com justo título, o qual está livre e "
+            "desembaraçado de qualquer ônus ou gravame judicial, inclusive de natureza cível, trabalhista e/ou tributária; "
+            "que não tem contra si qualquer protesto, ação e execução cível, criminal ou trabalhista cuja garantia pode vir "
+            "a ser o IMÓVEL; que inexiste, a seu encargo, responsabilidade oriunda de tutela, curatela ou testamentária; "
+            "que desconhece algo que possa impedir a presente transação, tanto ao IMÓVEL quanto à sua pessoa."
+        )
+
+    return (
+        "A PARTE VENDEDORA declara que é proprietária e legítima possuidora do IMÓVEL com justo título, o qual está livre "
+        "e desembaraçado de qualquer ônus ou gravame, judicial ou extrajudicial, inclusive de natureza cível, trabalhista "
+        "e/ou tributária; que não tem contra si qualquer débito, protesto, ação e execução cível, criminal ou trabalhista "
+        "cuja garantia pode vir a ser o IMÓVEL; que inexiste, a seu encargo, responsabilidade oriunda de tutela, curatela "
+        "ou testamentária; que desconhece algo que possa impedir a presente transação, tanto ao IMÓVEL quanto à sua pessoa."
+    )
+
+def clausula_bi2_documentacao_processos() -> str:
+    """
+    Texto fixo (nível 3).
+    Deve vir sempre imediatamente após clausula_bi2_propr_ou_posse().
+
+    Conceito:
+    - Se houver apontamento de ação, execução, protesto ou dívidas relativas ao imóvel,
+      a PARTE VENDEDORA deve esclarecer e comprovar documentalmente até o prazo de validade,
+      sob pena de multa por inadimplemento.
+    """
+
+    return (
+        "Na hipótese de haver apontamento de distribuição de ação, execução judicial ou protesto "
+        "contra a PARTE VENDEDORA, ou ainda débitos e/ou dívidas relativas ao IMÓVEL, a PARTE VENDEDORA "
+        "compromete-se a prestar os esclarecimentos necessários à PARTE COMPRADORA ou à INTERMEDIADORA, "
+        "mediante apresentação de cópias integrais dos processos, acesso aos autos digitais e/ou certidões "
+        "negativas que comprovem inexistirem óbices à presente transação, tudo até o término do prazo de "
+        "validade deste instrumento, sob pena de multa contratual por inadimplemento."
+    )
+
+def clausula_preço_forma_pagamento() -> str:
+    
+    return (
+        "Pela presente transação, a PARTE VENDEDORA se compromete em transferir a propriedade do IMÓVEL à PARTE COMPRADORA mediante o recebimento de preço certo, líquido e exigível, conforme o preço do IMÓVEL e forma de pagamento do preço indicado no quadro resumo."
+    )
+    
+def clausula_02_2_notas_pro() -> str:
+    """
+    Cláusula 2.2 («notas_pro»)
+
+    Regra:
+    - Se houver valor em preco_parcelamento_total, exibe o texto.
+    - Se estiver vazio, retorna "".
+    """
+
+    parcelamento_total = get("preco_parcelamento_total", "").strip()
+
+    if not parcelamento_total:
+        return ""
+
+    return (
+        "As mencionadas parcelas no quadro resumo serão pagas mediante transferência bancária dos valores "
+        "relativos a cada parcela em seu específico vencimento, na seguinte conta: "
+        "Banco _________, Agência __________, conta ________________________, PIX: "
+        "________________________., de titularidade de "
+        "______________________________________________."
+    )
+
+def clausula_02_3_atraso() -> str:
+    
+    parcelamento_total = get("preco_parcelamento_total", "").strip()
+
+    if not parcelamento_total:
+        return ""
+
+    return (
+        "Em caso de mora nos pagamentos das parcelas no quadro resumo, as importâncias"
+        "devidas serão acrescidas de multa moratória de 10% (dez por cento), mais juros de 0,033% (trinta e três milésimas por cento) ao dia"
+        ", sendo tudo desde a data do vencimento até a data da liquidação da dívida."
+        
+        " Caso seja necessária a intervenção de advogado para eventuais cobranças extrajudiciais, a "
+        "PARTE COMPRADORA será responsável pelos honorários advocatícios contratuais no importe de 10% (dez por cento) sobre os valores totais da dívida. "
+        
+        " Todavia, caso haja necessidade da PARTE VENDEDORA"
+        " ou da INTERMEDIADORA ingressar com ação judicial para ver tutelado os seus direitos, serão devidos honorários advocatícios contratuais de 20% (vinte por cento), também, sobre os valores totais da dívida,"
+        " a serem suportados integralmente pela PARTE COMPRADORA."
+    )
+
+def clausula_02_4_sinal() -> str:
+    
+    preco_sinal = get("preco_sinal", "").strip()
+
+    if not preco_sinal:
+        return ""
+
+    return (
+        "Com exceção das possibilidades do presente negócio ser desfeito por acordo entre as partes conforme previsão neste instrumento, "
+        "as partes declaram plena ciência de que, em caso de descumprimento contratual pela PARTE VENDEDORA, ou qualquer outro ato impeditivo à conclusão do presente negócio por sua culpa exclusiva, "
+        "esta parte ficará obrigada a pagar os valores ofertados a título de sinal e princípio de pagamento em dobro à PARTE COMPRADORA como indenização, "
+        "nos termos dos artigos 417 até 419 do Código Civil, "
+        "excluindo-se, neste caso, a eventual aplicação de multa por infração contratual."
+    )
+
+def clausula_02_5_sinal() -> str:
+    
+    preco_sinal = get("preco_sinal", "").strip()
+
+    if not preco_sinal:
+        return ""
+
+    return (
+        " Também, com exceção das possibilidades do presente negócio ser desfeito por acordo entre as partes conforme previsão neste instrumento,"
+        " em caso de descumprimento contratual pela PARTE COMPRADORA, "
+        "ou qualquer outro ato impeditivo à conclusão do presente negócio por sua culpa exclusiva,"
+        " esta parte perderá o sinal em favor da PARTE VENDEDORA como indenização,"
+        " nos termos dos artigos 417 até 419 do Código Civil, excluindo-se, neste caso, a eventual aplicação de multa por infração contratual."
+    )
+
+def clausula_03_1_financiamento_fgts() -> str:
+    
+    preco_financiamento = get("preco_financiamento", "").strip()
+
+    if not preco_financiamento:
+        return "As partes declaram pleno conhecimento de que o presente contrato será oportunamente aperfeiçoado, mediante novo instrumento celebrado perante o tabelião de notas, obrigando-se, desde já, a apresentarem todos os documentos exigidos às partes no momento oportuno à celebração de tal instrumento."
+
+    return (
+        "As partes declaram pleno conhecimento de que o presente contrato será oportunamente aperfeiçoado, "
+        "mediante novo instrumento celebrado perante instituição financeira competente, obrigando-se, desde já, a apresentarem todos os documentos"
+        " exigidos às partes no momento oportuno à celebração de tal instrumento."
+    )
+
+def clausula_03_2_financiamento_fgts() -> str:
+    
+    preco_financiamento = get("preco_financiamento", "").strip()
+
+    if not preco_financiamento:
+        return "As partes se obrigam a comparecer perante o tabelião de notas para a celebração e assinatura da respectiva escritura definitiva, em data e hora preestabelecida, sob a pena de multa de R$ 500,00 (quinhentos reais), os quais serão devidos à parte que cumpriu com a sua obrigação, salvo se o não comparecimento for dado em razão de casos fortuitos ou forças maiores, impossíveis de evitar ou impedir."
+
+    return (
+        "As partes se obrigam a comparecer perante instituição financeira competente para a celebração e assinatura da respectiva escritura definitiva, em data e hora preestabelecida, sob a pena de multa de R$ 500,00 (quinhentos reais) em face da parte que não comparecer, a qual será paga à parte que cumpriu com a sua obrigação, salvo se o não comparecimento for dado em razão de casos fortuitos ou forças maiores, impossíveis de evitar ou impedir."
+    )
+
+def clausula_03_3_inadimplencia() -> str:
+
+    return (
+        "A inadimplência da PARTE COMPRADORA em promover a lavratura da escritura definitiva de compra e venda no prazo pactuado isenta a PARTE VENDEDORA e eventualmente a INTERMEDIADORA da obrigação de apresentar novas certidões ou o seu teor."
+    )
+
+def clausula_03_4_1_financiamento_fgts() -> str:
+    
+    preco_financiamento = get("preco_financiamento", "").strip()
+
+    if not preco_financiamento:
+        return " pelo tabelião de notas competente "
+
+    return (
+        " pela instituição financeira competente "
+    )
+
+def clausula_03_4_2_financiamento_fgts() -> str:
+    
+    preco_financiamento = get("preco_financiamento", "").strip()
+
+    if not preco_financiamento:
+        return ""
+
+    pela_pelo = clausula_03_4_1_financiamento_fgts()
+
+    return (
+        f"A PARTE COMPRADORA se obriga em protocolar o registro da escritura definitiva de venda e compra do IMÓVEL "
+        f"lavrada{pela_pelo}em até 48 horas da sua respectiva posse deste documento, sob pena de multa diária no valor "
+        f"de 0,5% (cinco décimas por cento) sobre o valor do IMÓVEL, salvo se tal protocolo de registro for intermediado ou procedido diretamente pela assessoria contratada pela PARTE COMPRADORA."
+    )
+
+def clausula_03_4_3_ITBI() -> str:
+    
+    preco_financiamento = get("preco_financiamento", "").strip()
+
+    if not preco_financiamento:
+        return "A PARTE COMPRADORA declara, neste ato, que lhe foram prestados amplos esclarecimentos acerca do presente contrato com relação a toda documentação, notadamente sobre as despesas com escrituração, como, também, Imposto de Transmissão de Bens Imóveis – ITBI, custas e emolumentos cartorários."
+
+    pela_pelo = clausula_03_4_1_financiamento_fgts()
+
+    return (
+        f"A PARTE COMPRADORA se obriga em protocolar o registro da escritura definitiva de venda e compra do IMÓVEL "
+        f"lavrada{pela_pelo}em até 48 horas da sua respectiva posse deste documento, sob pena de multa diária no valor "
+        f"de 0,5% (cinco décimas por cento) sobre o valor do IMÓVEL, salvo se tal protocolo de registro for intermediado ou procedido diretamente pela assessoria contratada pela PARTE COMPRADORA."
+    )
+
+def titulo_04_financiamento_fgts() -> str:
+    preco_financiamento = get("preco_financiamento", "").strip()
+    preco_fgts = get("preco_fgts", "").strip()
+
+    if preco_financiamento:
+        return " DO FINANCIAMENTO" + (" E LIBERAÇÃO DO FGTS" if preco_fgts else "")
+
+    return " DA LIBERAÇÃO DO FGTS" if preco_fgts else ""
+
+def clausula_04_1_esclarecimentos_financiamento_fgts() -> str:
+    preco_financiamento = get("preco_financiamento", "").strip()
+    preco_fgts = get("preco_fgts", "").strip()
+
+    # Parte fixa final (aparece em financiamento e fgts)
+    final_comum = (
+        " inclusive, sobre as despesas com assessoria, escrituração e/ou taxas da instituição financeira competente, "
+        "como, também, Imposto de Transmissão de Bens Imóveis – ITBI, custas e emolumentos cartorários"
+    )
+
+    # Caso A: tem financiamento
+    if preco_financiamento:
+        meio = " as condições para o financiamento"
+        if preco_fgts:
+            meio += " e saque do FGTS, bem como, sobre as exigências do Sistema Financeiro de Habitação – SFH"
+        return (
+            " A PARTE COMPRADORA declara, neste ato, que lhe foi prestado amplos esclarecimentos acerca do presente contrato "
+            "com relação a toda documentação, notadamente sobre" + meio + "," + final_comum
+        )
+
+    # Caso B: não tem financiamento, mas tem FGTS
+    if preco_fgts:
+        return (
+            "A PARTE COMPRADORA declara, neste ato, que lhe foi prestado amplos esclarecimentos acerca do presente contrato "
+            "com relação a toda documentação, notadamente sobre as condições para o saque do FGTS, "
+            "bem como, sobre as exigências do Sistema Financeiro de Habitação – SFH," + final_comum
+        )
+
+    # Caso C: nenhum dos dois
+    return (
+        "A PARTE COMPRADORA declara, neste ato, que lhe foram prestados amplos esclarecimentos acerca do presente contrato "
+        "com relação a toda documentação, notadamente sobre as despesas com escrituração, como, também, "
+        "Imposto de Transmissão de Bens Imóveis – ITBI, custas e emolumentos cartorários"
+    )
+
+def clausula_04__2_qualidade_financiamento_fgts() -> str:
+    preco_financiamento = get("preco_financiamento", "").strip()
+    preco_fgts = get("preco_fgts", "").strip()
+
+    if preco_financiamento:
+        return (
+            "A PARTE COMPRADORA declara que tem conhecimento da sistemática e exigências estabelecidas pela instituição financeira " "competente para a concessão do crédito pretendido, como, também, tem qualidade para cumprir integralmente todas as condições "
+            "exigidas pela instituição financeira para a obtenção do financiamento"
+            + (", bem como, para a obtenção dos valores vinculados à conta do Fundo de Garantia do Tempo de Serviço - FGTS."
+               if preco_fgts else ".")
+        )
+
+    if preco_fgts:
+        return (
+            "A PARTE COMPRADORA declara que tem conhecimento da sistemática e exigências estabelecidas pela instituição financeira " "competente para a concessão do crédito pretendido, bem como, declara que tem qualidade para cumprir integralmente todas as condições "
+            "exigidas para a obtenção dos valores vinculados à conta do Fundo de Garantia do Tempo de Serviço - FGTS."
+        )
+        
+    return ""
+
+def clausula_04__3_qualidade_financiamento_fgts() -> str:
+    preco_financiamento = get("preco_financiamento", "").strip()
+    preco_fgts = get("preco_fgts", "").strip()
+
+    if preco_financiamento:
+        return (
+            "A PARTE COMPRADORA declara que tem conhecimento das atuais condições de resgate do financiamento a ser obtido, e reconhece e aceita o fato de que tais condições poderão sofrer"
+            " modificações em razão de regulamentações supervenientes estabelecidas pelas autoridades governamentais ou pelo próprio órgão financiador que intervier na operação." + " A PARTE COMPRADORA se compromete, desde já, a suportar todos os ônus decorrentes de tais mudanças, em especial, no tocante à taxa nominal de juros ou outras condições econômico-financeiras, "
+            "praticadas quando se der a assinatura do contrato perante órgão financiador, "
+            "bem como, arcar com todo e qualquer tributo ou despesa que, por razões diversas, seja ou venha a ser cobrada, ou lançada, a qualquer título, em seu(s) nome(s)."
+            )
+        
+    if preco_fgts:
+        return (
+            "A PARTE COMPRADORA declara que tem conhecimento das atuais condições de resgate do FGTS a ser obtido, e reconhece e aceita o fato de que tais condições poderão sofrer"
+            " modificações em razão de regulamentações supervenientes estabelecidas pelas autoridades governamentais ou pela instituição financeira que intervier na operação."
+        )
+        
+    return ""
+
+def clausula_04__4_juizo_financiamento_fgts():
+    preco_financiamento = get("preco_financiamento", "").strip()
+    preco_fgts = get("preco_fgts", "").strip()
+
+    if preco_financiamento:
+        texto = (
+            "As partes declaram ciência de que a instituição financeira competente, querendo, pode se reservar no direito de, ao seu juízo, não conceder os valores pretendidos caso a PARTE COMPRADORA"
+            " não possua condições jurídicas ou socioeconômicas exigidas à época da análise à concessão do financiamento"
+        )
+        if not preco_fgts:
+            return texto + "."
+
+        # ✅ com FGTS: segundo parágrafo sobre a falta de acordo
+        return [
+            paragrafo(
+                texto
+                + ",  e levantamento dos valores vinculados à conta do Fundo de Garantia do Tempo de Serviço - FGTS"
+                ", ficando quaisquer diferença de valores sob ônus da PARTE COMPRADORA a serem pagos em moeda corrente nacional ou qualquer outro meio capaz de complementar os valores faltantes, a critério da PARTE VENDEDORA."
+            ),
+            paragrafo(
+                "Caso não haja acordo entre as partes, o presente negócio será extinto sem quaisquer ônus aos envolvidos nesta transação, comprometendo-se a PARTE VENDEDORA,"
+                " ainda, se houver recebido ou se beneficiado de quaisquer valores e a qualquer título pagos ou desembolsados pela PARTE COMPRADORA,"
+                " restituí-los no prazo de até 30 (trinta) dias da não concessão dos valores pretendidos pela PARTE COMPRADORA nos termos acima, sob pena de multa por infração contratual."
+            ),
+        ]
+
+    return ""
+
+def clausula_05__1_juizo_entrega_chaves() -> str:
+    
+    return "A PARTE VENDEDORA se obriga a entregar a(s) chave(s) e o extrato das contas de consumo quitadas do IMÓVEL à PARTE COMPRADORA conforme o prazo indicado no quadro resumo, sob pena de multa diária no valor de R$ 100,00 (cem reais) à PARTE COMPRADORA, até a data efetiva da entrega da(s) referida(s) chave(s) e contas de consumo."
+
+def clausula_05_2_livre_desocupado() -> str:
+    
+    return (
+        "A PARTE VENDEDORA se compromete, ainda, a entregar o IMÓVEL livre e desocupado de pessoas e coisas, bem como, que arcará com as eventuais despesas de consumo de energia, água, gás, condomínio e IPTU até a entrega do IMÓVEL à PARTE COMPRADORA, "
+        "sob pena de indenizá-la em caso de quaisquer prejuízos que venham a ocorrer em razão do não cumprimento ou satisfação de suas obrigações."
+    )
+
+def clausula_05_3_condominio() -> str:
+    tipo_imovel = get("imovel__tipo", "").strip().lower()
+
+    if tipo_imovel in ("casa", "terreno", "sobrado"):
+        return ""
+
+    return (
+        "Caso seja IMÓVEL de condomínio, a PARTE VENDEDORA se compromete em apresentar a declaração de quitação de débito "
+        "de taxas condominiais, com firma reconhecida do síndico (ou assinatura eletrônica pelo GOV.BR) e cópia autenticada da ata que elegeu o síndico ou "
+        "administradora e, ainda, cópia da convenção e regulamento interno do condomínio, na assinatura do presente contrato, sob pena de multa por infração contratual."
+    )
+
+def clausula_06_1_transferencia_concessionaria() -> str:
+    
+    return (
+        "A PARTE COMPRADORA se obriga a efetuar as transferências de titularidades das contas de consumo do IMÓVEL "
+        "nas concessionárias de energia, água e gás, caso existam, no prazo máximo de 10 (dez) dias após receber a(s) chave(s) do IMÓVEL, sob pena de multa diária de R$ 50,00 (cinquenta reais), em favor da PARTE VENDEDORA."
+    )
+
+def clausula_06_1_transferencia_iptu() -> str:
+    
+    return (
+        "A PARTE COMPRADORA se obriga, também, a providenciar a transferência do IPTU na prefeitura do município do IMÓVEL (caso esteja individualizado) no prazo máximo de 60 (sessenta) dias, "
+        "a partir da data do registro da escritura, conforme a Lei n.º 10.819, de 28/12/1989 e Decreto n.º 28.494, de 09/01/1990, também, sob pena de multa diária de R$ 50,00 (cinquenta reais), "
+        "em favor da PARTE VENDEDORA, até a data da apresentação dos protocolos de transferência perante prefeitura do município do IMÓVEL."
+    )
+
+def clausula_07_1_honorarios() -> str:
+    quem_paga_comissao = get("quem_paga_comissao", "").strip()
+
+    if quem_paga_comissao in ("PARTE VENDEDORA"):
+        return (
+            "Fica convencionado que a  PARTE VENDEDORA pagará a comissão pelos trabalhos ora praticados pela INTERMEDIADORA e seus corretores associados, nos termos do contrato de corretagem apresentado à PARTE VENDEDORA juntamente com este instrumento.")
+    
+    if quem_paga_comissao in ("PARTE COMPRADORA"):
+        return (
+            "Fica convencionado que a PARTE COMPRADORA pagará a comissão pelos trabalhos ora praticados pela INTERMEDIADORA e seus corretores associados, nos termos do contrato de corretagem apresentado à PARTE COMPRADORA juntamente com este instrumento.")              
+    
+    #if quem_paga_comissao in ("AMBAS AS PARTES"):
+        #return (
+            #"Fica convencionado que a comissão devida à INTERMEDIADORA pelos trabalhos oferecidos e praticados a ambas as partes do presente negócio, fixada nos valores de ";$AU$2;", será rateada entre a PARTE VENDEDORA e a PARTE COMPRADORA, na seguinte forma:")              
+    
+    return ""
+
+def clausula_07_2_honorarios() -> str:
+    quem_paga_comissao = get("quem_paga_comissao", "").strip()
+
+    if quem_paga_comissao in ("PARTE VENDEDORA"):
+        return (
+            "A INTERMEDIADORA terá direito ao recebimento da comissão independentemente do referido contrato de corretagem. "
+            "Caso a PARTE VENDEDORA não assine o referido contrato de corretagem com a INTERMEDIADORA, desde já, responsabilizar-se-á pelo pagamento da comissão com base na tabela mínima estabelecida pelo CRECI, "
+            "sendo 6% (seis por cento) sobre o valor do IMÓVEL.")
+    
+    if quem_paga_comissao in ("PARTE COMPRADORA"):
+        return (
+            "A INTERMEDIADORA terá direito ao recebimento da comissão independentemente do referido contrato de corretagem. "
+            "Caso a PARTE COMPRADORA não assine o referido contrato de corretagem com a INTERMEDIADORA, desde já, responsabilizar-se-á pelo pagamento da comissão com base na tabela mínima estabelecida pelo CRECI, "
+            "sendo 6% (seis por cento) sobre o valor do IMÓVEL.")
+    
+    return ""
+
+def clausula_07_3_honorarios() -> str:
+    quem_paga_comissao = get("quem_paga_comissao", "").strip()
+
+    if quem_paga_comissao in ("PARTE VENDEDORA"):
+        return (
+            "Caso seja necessária a intervenção de advogado para eventuais cobranças extrajudiciais, a PARTE VENDEDORA será responsável pelos honorários advocatícios contratuais no importe de 10% (dez por cento) sobre os valores totais da dívida. Todavia, caso haja necessidade de a INTERMEDIADORA ingressar com ação judicial para ver tutelado os seus direitos, serão devidos honorários advocatícios contratuais de 20% (vinte por cento), também, sobre os valores totais da dívida, a serem suportados integralmente pela PARTE VENDEDORA.")
+    
+    if quem_paga_comissao in ("PARTE COMPRADORA"):
+        return (
+            "Caso seja necessária a intervenção de advogado para eventuais cobranças extrajudiciais, a PARTE COMPRADORA será responsável pelos honorários advocatícios contratuais no importe de 10% (dez por cento) sobre os valores totais da dívida. Todavia, caso haja necessidade de a INTERMEDIADORA ingressar com ação judicial para ver tutelado os seus direitos, serão devidos honorários advocatícios contratuais de 20% (vinte por cento), também, sobre os valores totais da dívida, a serem suportados integralmente pela PARTE COMPRADORA.")
+    
+    return ""
+    
+def clausula_07_4_honorarios() -> str:
+    
+    return "A falta de qualquer pagamento por si só constituirá a PARTE responsável em mora, independentemente de qualquer aviso ou interpelação judicial ou extrajudicial."
+
+def clausula_08_1_prazo_conclusao() -> str:
+    
+    parcelamento = get("preco_parcelamento_total", "").strip()  # V2
+    financiamento = get("preco_financiamento", "").strip()      # L3
+    fgts = get("preco_fgts", "").strip()                        # N3
+    tipo_imovel = get("tipo_imovel", "").strip().lower()        # IMÓVEL!E7
+
+    # Se existe parcelamento -> retorna vazio (como no Excel)
+    if parcelamento:
+        return ""
+
+    # Tipos de imóvel que são "matrícula em área maior"
+    tipos_matricula_area_maior = {
+        "apartamento (matrícula em área maior)",
+        "sobrado em condomínio (matrícula em área maior)",
+        "casa em condomínio (matrícula em área maior)",
+    }
+
+    eh_matricula_area_maior = tipo_imovel in tipos_matricula_area_maior
+
+    # Textos (equivalentes aos CONCATENAR do Excel)
+    texto_60_area_maior = (
+        " O presente instrumento tem o prazo de validade de 60 (sessenta) dias à sua conclusão e/ou integral "
+        "cumprimento em seus termos dispostos a contar da data da efetiva regularização da referida matricula da "
+        "unidade conforme estipulado na cláusula 1.1, podendo as partes, se vencido tal prazo sem o integral "
+        "cumprimento deste instrumento e sem culpa de qualquer delas, manifestarem-se sobre a resilição do presente "
+        "negócio em até 24 (vinte quatro) horas, sob a possibilidade deste instrumento se prorrogar automaticamente "
+        "pelo período de mais 30 (trinta) dias."
+    )
+
+    texto_120_area_maior = (
+        " O presente instrumento tem o prazo de validade de 120 (cento e vinte) dias à sua conclusão e/ou integral "
+        "cumprimento em seus termos dispostos a contar da data da efetiva regularização da referida matricula da "
+        "unidade conforme estipulado na cláusula 1.1, podendo as partes, se vencido tal prazo sem o integral "
+        "cumprimento deste instrumento e sem culpa de qualquer delas, manifestarem-se sobre a resilição do presente "
+        "negócio em até 24 (vinte quatro) horas, sob a possibilidade deste instrumento se prorrogar automaticamente "
+        "pelo período de mais 60 (sessenta) dias."
+    )
+
+    texto_60_normal = (
+        " O presente instrumento tem o prazo de validade de 60 (sessenta) dias à sua conclusão e/ou integral "
+        "cumprimento, em seus termos dispostos, a contar da data indicada no final do presente contrato, com "
+        "respectivas assinaturas das partes, podendo as partes, se vencido tal prazo sem o integral cumprimento deste "
+        "instrumento e sem culpa de qualquer delas, manifestarem-se sobre a resilição do presente negócio em até 24 "
+        "(vinte quatro) horas, sob a possibilidade deste instrumento se prorrogar automaticamente pelo período de "
+        "mais 30 (trinta) dias."
+    )
+
+    texto_120_normal = (
+        " O presente instrumento tem o prazo de validade de 120 (cento e vinte) dias à sua conclusão e/ou integral "
+        "cumprimento em seus termos dispostos, a contar da data indicada no final do presente contrato, com "
+        "respectivas assinaturas das partes, podendo as partes, se vencido tal prazo sem o integral cumprimento deste "
+        "instrumento e sem culpa de qualquer delas, manifestarem-se sobre a resilição do presente negócio em até 24 "
+        "(vinte quatro) horas, sob a possibilidade deste instrumento se prorrogar automaticamente pelo período de "
+        "mais 60 (sessenta) dias."
+    )
+
+    # ✅ 1) Se L3 e N3 vazios e tipo é matrícula em área maior -> 60 dias (área maior)
+    if (not financiamento) and (not fgts) and eh_matricula_area_maior:
+        return texto_60_area_maior
+
+    # ✅ 2) Se L3 e N3 preenchidos e tipo é matrícula em área maior -> 120 dias (área maior)
+    if financiamento and fgts and eh_matricula_area_maior:
+        return texto_120_area_maior
+
+    # ✅ 3) Se L3 e N3 vazios -> 60 dias (normal)
+    if (not financiamento) and (not fgts):
+        return texto_60_normal
+
+    # ✅ 4) Caso contrário -> 120 dias (normal)
+    return texto_120_normal
+
+def clausula_08_2_resilicao_por_prazo() -> str:
+    parcelamento = get("preco_parcelamento_total", "").strip()  # V2
+
+    if parcelamento:
+        return ""
+
+    return (
+        " Vencendo este último prazo, também, sem a conclusão e/ou integral cumprimento "
+        "do presente compromisso de compra e venda do IMÓVEL em seus termos e sem qualquer culpa das partes, "
+        "este instrumento poderá ser extinto mediante resilição, ficando a PARTE VENDEDORA e PARTE COMPRADORA "
+        "isentas de qualquer penalidade ou multa contratual entre si, devendo assinar o instrumento extintivo "
+        "do negócio ajustado num prazo máximo de até 5 (cinco) dias do vencimento do mencionado prazo de validade."
+    )
+
+def clausula_08_3_resilicao_por_prazo() -> str:
+    parcelamento = get("preco_parcelamento_total", "").strip()  # V2
+
+    if parcelamento:
+        return ""
+
+    return (
+        "Nesta hipótese, a PARTE VENDEDORA se comprometendo, ainda, se houver recebido ou se beneficiado de quaisquer "
+        "valores e a qualquer título pagos ou desembolsados pela PARTE COMPRADORA, restituí-los no prazo de até "
+        "30 (trinta) dias da assinatura do referido instrumento extintivo, sob pena de multa por infração contratual."
+    )
+
+def clausula_09_1_resolucao() -> str:
+    preco_sinal = get("preco_sinal", "").strip()  # J3
+
+    if preco_sinal:
+        return (
+            " Com exceção das possibilidades do presente negócio ser desfeito por acordo entre as partes conforme previsão "
+            "neste instrumento, a parte que sofrer lesão por inadimplemento e culpa da outra parte poderá, além de ter os "
+            "valores equivalentes de sinal como verbas indenizatórias, pedir a resolução do contrato, bem como, indenização "
+            "suplementar."
+        )
+
+    return (
+        "  Com exceção das possibilidades do presente negócio ser desfeito por acordo entre as partes conforme previsão "
+        "neste instrumento, a parte que sofrer lesão por inadimplemento e culpa da outra parte poderá pedir a resolução do "
+        "contrato, se não preferir lhe exigir o seu integral cumprimento, cabendo, ainda, em qualquer dos casos, multa de "
+        "6% (seis por cento) sobre o valor total do IMÓVEL, além de indenização por perdas e danos se provar maior prejuízo."
+    )
+
+def clausula_09_2_desist_com_sinal() -> str:
+    preco_sinal = get("preco_sinal", "").strip()  # J3
+
+    if preco_sinal:
+        return "Caso a desistência seja realizada pela PARTE VENDEDORA, deverá a PARTE COMPRADORA ser reembolsada na integralidade de valores pagos a este título, sem prejuízo do exposto acima e multa por infração contratual."
+
+    return ""
+
+def clausula_09_3_desist_com_sinal() -> str:
+    preco_sinal = get("preco_sinal", "").strip()  # J3
+
+    if preco_sinal:
+        return "Caso a parte inocente preferir exigir o integral cumprimento do presente compromisso da parte o infringiu, poderá, ainda, requerer indenização por perdas e danos, valendo, também, as arras como o mínimo da indenização."
+
+    return ""
+
+def clausula_09_4_desist_com_sinal() -> str:
+    preco_sinal = get("preco_sinal", "").strip()  # J3
+
+    if preco_sinal:
+        return "A parte que der causa à resolução do presente contrato, será, também, responsável pelo pagamento dos honorários à INTERMEDIADORA, do presente contrato, bem como, todas as suas despesas com documentações e honorários advocatícios contratuais, desde já, estabelecidos em 20% (vinte por cento) do valor do débito."
+
+    return ""
+
+def clausula_10_1_irretratabilidade() -> str:
+    preco_financiamento = get("preco_financiamento", "").strip()
+    preco_fgts = get("preco_fgts", "").strip()
+
+    if preco_financiamento:
+        return "O presente contrato é celebrado em caráter irretratável e irrevogável, obrigando não só as partes, mas, também, seus herdeiros e sucessores, não se admitindo o arrependimento de quaisquer das partes por quaisquer tipos de pretextos ou alegações, salvo o disposto na cláusula que trata sobre o prazo de validade deste compromisso, bem como, outras possibilidades do presente negócio ser desfeito por acordo entre as partes conforme previsão neste instrumento."
+
+    if preco_fgts:
+        return "O presente contrato é celebrado em caráter irretratável e irrevogável, obrigando não só as partes, mas, também, seus herdeiros e sucessores, não se admitindo o arrependimento de quaisquer das partes por quaisquer tipos de pretextos ou alegações, salvo o disposto na cláusula que trata sobre o prazo de validade deste compromisso, bem como, outras possibilidades do presente negócio ser desfeito por acordo entre as partes conforme previsão neste instrumento."
+    
+    return "O presente contrato é celebrado em caráter irretratável e irrevogável, obrigando não só as partes, mas, também, seus herdeiros e sucessores, não se admitindo o arrependimento de quaisquer das partes por quaisquer tipos de pretextos ou alegações, salvo eventuais possibilidades do presente negócio ser desfeito por acordo entre as partes conforme previsão neste instrumento."
+
+def clausula_11_1_vicios() -> str:
+        
+    return "A PARTE VENDEDORA declara, na forma e sob as penas da lei, que responde pela evicção de direito, quando chamada à autoria em demandas judiciais e administrativas, e pelos vícios redibitórios em relação ao IMÓVEL ora transacionado, desde que seja constatado que tais vícios se originaram antes do presente negócio."
+
+def clausula_11_2_vicios() -> str:
+        
+    return "Quaisquer dívidas da PARTE VENDEDORA que venham, eventualmente e a qualquer tempo, atingir o IMÓVEL, causando-lhe constrição judicial, bloqueio ou anulação do presente negócio, dá à PARTE COMPRADORA o direito quitar eventuais dívidas, de modo que não perca o IMÓVEL, podendo, ainda, pleitear judicialmente quaisquer perdas e danos sofridas em razão destes fatos."
+
+def clausula_12_titulo_declaracoes() -> str:
+    
+    imovel__ficara_bens = get("imovel__ficara_bens", "").strip().upper()  # IMÓVEL!I33
+
+    if imovel__ficara_bens == "SIM":
+        return " DAS DECLARAÇÕES DAS PARTES EM RELAÇÃO AO IMÓVEL"
+
+    if imovel__ficara_bens in ("NÃO", "NAO", ""):
+        return " DA DECLARAÇÃO DA PARTE COMPRADORA EM RELAÇÃO AS CONDIÇÕES DO IMÓVEL"
+
+    return ""
+
+def clausula_12_1_ficara_bens() -> str:
+    
+    return "A PARTE COMPRADORA declara que visitou o IMÓVEL ora transacionado, aceitando-o no estado em que se encontra, estando ciente que após a assinatura deste compromisso não poderá reivindicar quaisquer reparos, com exceção à evicção de direito e vícios redibitórios."    
+
+def clausula_12_2_ficara_bens() -> str:
+    
+    return "As partes convencionam que a presente venda do IMÓVEL é feita na forma “AD CORPUS”, ou seja, assim como está, independentemente das medidas."
+
+def clausula_12_3_ficara_bens() -> str:
+    imovel__ficara_bens = get("imovel__ficara_bens", "").strip().upper()   # I33
+    imovel__bens = get("imovel__bens", "").strip()             # I35
+
+    # Se for "NÃO" ou estiver vazio -> não exibe a cláusula
+    if imovel__ficara_bens in ("NÃO", "NAO", ""):
+        return ""
+
+    # Se chegou aqui, presume-se que é "SIM" (ou equivalente)
+    return (
+        " A PARTE VENDEDORA declara que ficará integrado ao IMÓVEL e vinculado ao presente negócio: "
+        f"{imovel__bens.lower()}."
+    )
+
+def clausula_13_1_termino_pretacao() -> str:
+    preco_financiamento = get("preco_financiamento", "").strip()  # L3
+    preco_fgts = get("preco_fgts", "").strip()                    # N3
+
+    if preco_financiamento or preco_fgts:
+        return (
+            " Fica devidamente esclarecido às partes, ora contratantes, "
+            "que a prestação de serviço da INTERMEDIADORA se aperfeiçoa com a assinatura do presente instrumento, contudo, "
+            "acompanhará e auxiliará perante o competente cartório de registro de imóveis e o desbloqueio dos valores "
+            "dos recursos na conta da PARTE VENDEDORA, "
+            "não assumindo, neste segundo momento, qualquer responsabilidade ou encargo, tendo em vista que a sua prestação de serviço já fora "
+            "totalmente concluída, em razão o fechamento da transação imobiliária."
+        )
+
+    return (
+        " Fica devidamente esclarecido às partes, ora contratantes, que a prestação de serviço da "
+        "INTERMEDIADORA se aperfeiçoa com a assinatura do presente instrumento, contudo, "
+        "acompanhará e auxiliará perante o competente cartório de registro de imóveis, não assumindo, "
+        "neste segundo momento, qualquer responsabilidade ou encargo, "
+        "tendo em vista que a sua prestação de serviço já fora totalmente concluída, "
+        "em razão o fechamento da transação imobiliária."
+    )
+
+def clausula_13_2_termino_pretacao() -> str:
+    
+    return (
+        "As partes declaram que a INTERMEDIADORA lhes prestou todos os esclarecimentos necessários à presente transação, prestando-lhes, também, toda assistência necessária sob o devido zelo para que este negócio jurídico se realize com segurança, informando-lhes, ainda, sobre a necessidade de extrações das certidões necessárias por vias próprias e particulares, bem como, sobre eventuais riscos e toda situação documental apresentada das partes e do IMÓVEL."
+    )
+    
+def Clausula_13_3_responsabilidade_intermediadora() -> str:
+    preco_financiamento = get("preco_financiamento", "").strip()  # DA26
+    preco_fgts = get("preco_fgts", "").strip()                    # DA28
+    preco_carta_credito = get("preco_carta_credito", "").strip()        # DA30
+
+    tem_fin = bool(preco_financiamento)
+    tem_fgts = bool(preco_fgts)
+    tem_carta = bool(preco_carta_credito)
+
+    # Caso 0: nenhum meio especial => não exibe cláusula
+    if not (tem_fin or tem_fgts or tem_carta):
+        return ""
+
+    # Textos por combinação (fiel à fórmula)
+    if tem_fin and (not tem_fgts) and (not tem_carta):
+        return (
+            " A INTERMEDIADORA não será responsável por quaisquer resultados negativos quanto à obtenção do financiamento ou qualquer "
+            "outra impossibilidade que venha a surgir em razão deste meio de pagamento que possa atrasar ou extinguir o presente negócio, "
+            "sendo de total responsabilidade das partes o preenchimento e atendimento das condições impostas pela instituição financeira "
+            "ou empresa competente."
+        )
+
+    if tem_fin and tem_fgts and (not tem_carta):
+        return (
+            " A INTERMEDIADORA não será responsável por quaisquer resultados negativos quanto à obtenção do financiamento e resgate do FGTS, "
+            "bem como, por qualquer outra impossibilidade que venha a surgir em razão destes meios de pagamentos que possam atrasar ou extinguir "
+            "o presente negócio, sendo de total responsabilidade das partes o preenchimento e atendimento das condições impostas pela instituição "
+            "financeira ou empresa competente."
+        )
+
+    if tem_fin and tem_fgts and tem_carta:
+        return (
+            " A INTERMEDIADORA não será responsável por quaisquer resultados negativos quanto à obtenção do financiamento, resgate do FGTS "
+            "ou utilização ou transferência dos valores ou direitos da carta crédito mencionada neste instrumento, bem como, por qualquer "
+            "outra impossibilidade que venha a surgir em razão destes meios de pagamentos que possam atrasar ou extinguir o presente negócio, "
+            "sendo de total responsabilidade das partes o preenchimento e atendimento das condições impostas pela instituição financeira ou "
+            "empresa competente."
+        )
+
+    if (not tem_fin) and tem_fgts and tem_carta:
+        return (
+            " A INTERMEDIADORA não será responsável por quaisquer resultados negativos quanto ao resgate do FGTS ou utilização ou transferência "
+            "dos valores ou direitos da carta crédito mencionada neste instrumento, bem como, por qualquer outra impossibilidade que venha a surgir "
+            "em razão destes meios de pagamentos que possam atrasar ou extinguir o presente negócio, sendo de total responsabilidade das partes o "
+            "preenchimento e atendimento das condições impostas pela instituição financeira ou empresa competente."
+        )
+
+    if (not tem_fin) and (not tem_fgts) and tem_carta:
+        return (
+            " A INTERMEDIADORA não será responsável por quaisquer resultados negativos quanto à utilização ou transferência dos valores ou direitos "
+            "da carta crédito mencionada neste instrumento, bem como, por qualquer outra impossibilidade que venha a surgir em razão destes meios "
+            "de pagamentos que possam atrasar ou extinguir o presente negócio, sendo de total responsabilidade das partes o preenchimento e "
+            "atendimento das condições impostas pela instituição financeira ou empresa competente."
+        )
+
+    if tem_fin and (not tem_fgts) and tem_carta:
+        return (
+            " A INTERMEDIADORA não será responsável por quaisquer resultados negativos quanto à obtenção do financiamento ou à utilização ou "
+            "transferência dos valores ou direitos da carta crédito mencionada neste instrumento, bem como, por qualquer outra impossibilidade "
+            "que venha a surgir em razão destes meios de pagamentos que possam atrasar ou extinguir o presente negócio, sendo de total "
+            "responsabilidade das partes o preenchimento e atendimento das condições impostas pela instituição financeira ou empresa competente."
+        )
+
+    # Cobertura extra: se cair em uma combinação não prevista, não mostra nada
+    return ""
+
+def Clausula_13_4_responsabilidade_intermediadora() -> str:
+        
+    return "Porventura houver quaisquer tipos de problemas posteriores a conclusão do presente negócio, as partes poderão providenciar nova tratativa de prestação de serviços perante a INTERMEDIADORA, seja no setor imobiliário ou no setor jurídico."
+
+def Clausula_13_5_responsabilidade_intermediadora() -> str:
+        
+    return "Caso o presente negócio não se conclua por qualquer que seja o motivo ou por arrependimento de qualquer das partes e, posteriormente, as partes realizem a compra e venda diretamente entre si e sem a participação da INTERMEDIADORA, ser-lhe-ão devidos os honorários ajustados de 6% (seis por cento) sobre o valor do IMÓVEL, a qual será suportada solidariamente entre a PARTE VENDEDORA e a PARTE COMPRADORA, além de suportarem, também, solidariamente, as custas e despesas processuais e honorários advocatícios que, desde já, ficam estabelecidos em 20% sobre o valor total devido."
+
+def clausula_14_1_disposicoes_gerais() -> str:
+        
+    return "Caso a PARTE COMPRADORA tenha interesse em registrar este compromisso junto ao competente Cartório de Registro de Imóveis, tais despesas correrão exclusivamente por sua conta."
+
+def clausula_14_2_procuracao_vendedora() -> str:
+    vendedores = get_list("vendedores")
+    if len(vendedores) <= 1:
+        return ""
+
+    return (
+        "Todos os integrantes da PARTE VENDEDORA se nomeiam e se constituem reciprocamente "
+        "procuradores, bastante para receberem citações, intimações ou interpelações provenientes "
+        "de eventual ação judicial ou extrajudicial, movida a qualquer um deles em razão do presente negócio."
+    )
+
+def clausula_14_3_procuracao_compradora() -> str:
+    compradores = get_list("compradores")
+    if len(compradores) <= 1:
+        return ""
+
+    return (
+        "Todos os integrantes da PARTE COMPRADORA se nomeiam e se constituem reciprocamente "
+        "procuradores, bastante para receberem citações, intimações ou interpelações provenientes "
+        "de eventual ação judicial ou extrajudicial, movida a qualquer um deles em razão do presente negócio."
+    )
+
+def clausula_14_4_intimacoes() -> str:
+    
+    return (
+        "Todos os integrantes da PARTE VENDEDORA se nomeiam e se constituem reciprocamente "
+        "procuradores, bastante para receberem citações, intimações ou interpelações provenientes "
+        "de eventual ação judicial ou extrajudicial, movida a qualquer um deles em razão do presente negócio."
+    )
+
+def clausula_14_5_comunicar_endereco() -> str:
+    
+    return (
+        "A PARTE COMPRADORA e a PARTE VENDEDORA se obrigam mutuamente em comunicar eventuais mudanças de endereço, telefone celular, inclusive, correio eletrônico, presumindo-se válidas as citações, intimações ou notificações ao endereço constante neste instrumento ou ao endereço do IMÓVEL, ainda que não recebidas pessoalmente pelo interessado, se a modificação temporária ou definitiva não tiver sido devidamente comunicada nos termos expostos."
+    )
+
+def clausula_14_6_alterar_endereco() -> str:
+    
+    return (
+        "Qualquer alteração de condição deste instrumento deverá ser formalizada via aditamento contratual devidamente assinado pelas partes em conjunto com duas testemunhas, sendo qualquer outro acordo realizado pelas partes de modo extracontratual considerados como mera tolerância e sem o efeito de novar o disposto neste instrumento."
+    )
+
+def clausula_15_1_foro() -> list[dict]:
+    vendedores = get_list("vendedores")
+    compradores = get_list("compradores")
+
+    # ✅ Títulos automáticos conforme tipo do contrato
+    titulo_vendedor = papel_parte_vendedora_ou_cedente()          # "PARTE VENDEDORA" ou "PARTE CEDENTE"
+    titulo_comprador = papel_parte_compradora_ou_cessionaria()     # "PARTE COMPRADORA" ou "PARTE CESSIONÁRIA"
+
+    return [
+        paragrafo(
+            "Fica eleito o foro da situação do IMÓVEL, com expressa renúncia a qualquer outro, por mais privilegiado que seja, "
+            "para dirimir quaisquer questões oriundas do presente contrato."
+        ),
+        paragrafo(
+            "Por estarem assim justas e contratadas, sob declaração da expressão da verdade de todo o exposto acima, inclusive "
+            "de seus dados e informações pessoais, as partes assinam o presente contrato em 03 (três) vias de igual teor e forma, "
+            "na presença de duas testemunhas, para que produza seus normais efeitos de direito."
+        ),
+
+        # ✅ DATA À DIREITA
+        paragrafo(linha_local_data(), alinhamento=DIREITA),
+
+        # ✅ ASSINATURAS: PARTE VENDEDORA/CEDENTE
+        *bloco_assinaturas_partes(titulo_vendedor, vendedores),
+
+        # ✅ ASSINATURAS: PARTE COMPRADORA/CESSIONÁRIA
+        *bloco_assinaturas_partes(titulo_comprador, compradores),
+
+        # ✅ TESTEMUNHAS
+        paragrafo(negrito("TESTEMUNHAS:")),
+        assinatura(linhas=("Nome:", "CPF:")),
+        assinatura(linhas=("Nome:", "CPF:")),
+    ]
+
+
+# ============================================================
+# ÍNDICE DE CLÁUSULAS (dinâmico)
+# ============================================================
+
+def tem_financiamento():
+    return bool(get("preco_financiamento", "").strip())
+
+def tem_fgts():
+    return bool(get("preco_fgts", "").strip())
+
+def imovel_alienado():
+    return get("imovel__alienado", "NÃO") == "SIM"
+
+def numerar_subclausulas(numero_clausula_principal: int, textos: list) -> list[list[dict]]:
+    """
+    Numera as subcláusulas dinamicamente:
+      1.1, 1.2, 1.3...
+    conforme os textos efetivamente presentes (não vazios).
+    Cada texto (str ou lista de blocos) vira a lista de blocos da subcláusula.
+    """
+    out = []
+    contador = 1
+    for t in textos:
+        if not t or (isinstance(t, str) and not t.strip()):
+            continue
+        out.append(numerar(f"{numero_clausula_principal}.{contador}. ", t))
+        contador += 1
+    return out
+
+# Cada cláusula: título (texto ou função) + regra de visibilidade + textos das subcláusulas.
+# "variante": True => o texto depende apenas da assinatura da variante do contrato
+# (gerador.variantes.assinatura_variante) e pode ser compartilhado entre contratos.
+CLAUSULAS = [
+    {
+        "id": "cl01",
+        "variante": True,
+        "titulo": "DAS DECLARAÇÕES INICIAIS",
+        "visivel": lambda: True,
+        "textos": lambda: [
+            clausula_bh2_abertura_matricula(),
+            clausula_bi2_resilicao_por_forca_maior(),
+            clausula_bi2_propr_ou_posse(),
+            clausula_bi2_documentacao_processos(),
+            clausula_dw2_alienacao_fiduciaria(),
+        ],
+    },
+    {
+        "id": "cl02",
+        "variante": True,
+        "titulo": "DO PREÇO E FORMA DE PAGAMENTO",
+        "visivel": lambda: True,
+        "textos": lambda: [
+            clausula_preço_forma_pagamento(),
+            clausula_02_2_notas_pro(),
+            clausula_02_3_atraso(),
+            clausula_02_4_sinal(),
+            clausula_02_5_sinal(),
+        ],
+    },
+    {
+        "id": "cl03",
+        "variante": True,
+        "titulo": "DA ESCRITURA DEFINITIVA",
+        "visivel": lambda: True,
+        "textos": lambda: [
+            clausula_03_1_financiamento_fgts(),
+            clausula_03_2_financiamento_fgts(),
+            clausula_03_3_inadimplencia(),
+            clausula_03_4_2_financiamento_fgts(),
+            clausula_03_4_3_ITBI(),
+        ],
+    },
+    {
+        "id": "cl04",
+        "variante": True,
+        "titulo": titulo_04_financiamento_fgts,
+        "visivel": lambda: tem_financiamento() or tem_fgts(),
+        "textos": lambda: [
+            clausula_04_1_esclarecimentos_financiamento_fgts(),
+            clausula_04__2_qualidade_financiamento_fgts(),
+            clausula_04__3_qualidade_financiamento_fgts(),
+            clausula_04__4_juizo_financiamento_fgts(),
+        ],
+    },
+    {
+        "id": "cl05",
+        "variante": True,
+        "titulo": "DA ENTREGA DAS CHAVES E DAS CONTAS DE CONSUMO",
+        "visivel": lambda: True,
+        "textos": lambda: [
+            clausula_05__1_juizo_entrega_chaves(),
+            clausula_05_2_livre_desocupado(),
+            clausula_05_3_condominio(),
+        ],
+    },
+    {
+        "id": "cl06",
+        "variante": True,
+        "titulo": "DAS TRANSFERÊNCIAS JUNTO À PREFEITURA E ÀS EVENTUAIS CONCESSIONÁRIAS DE ÁGUA, ENERGIA E GÁS",
+        "visivel": lambda: True,
+        "textos": lambda: [
+            clausula_06_1_transferencia_concessionaria(),
+            clausula_06_1_transferencia_iptu(),
+        ],
+    },
+    {
+        "id": "cl07",
+        "variante": True,
+        "titulo": "DO PAGAMENTO DOS HONORÁRIOS DA INTERMEDIADORA",
+        "visivel": lambda: True,
+        "textos": lambda: [
+            clausula_07_1_honorarios(),
+            clausula_07_2_honorarios(),
+            clausula_07_3_honorarios(),
+            clausula_07_4_honorarios(),
+        ],
+    },
+    {
+        "id": "cl08",
+        "variante": True,
+        "titulo": "DO PRAZO DE VALIDADE DO INSTRUMENTO À SUA CONCLUSÃO",
+        "visivel": lambda: not get("preco_parcelamento_total", "").strip(),
+        "textos": lambda: [
+            clausula_08_1_prazo_conclusao(),
+            clausula_08_2_resilicao_por_prazo(),
+            clausula_08_3_resilicao_por_prazo(),
+        ],
+    },
+    {
+        "id": "cl09",
+        "variante": True,
+        "titulo": "DA RESOLUÇÃO CONTRATUAL",
+        "visivel": lambda: True,
+        "textos": lambda: [
+            clausula_09_1_resolucao(),
+            clausula_09_2_desist_com_sinal(),
+            clausula_09_3_desist_com_sinal(),
+            clausula_09_4_desist_com_sinal(),
+        ],
+    },
+    {
+        "id": "cl10",
+        "variante": True,
+        "titulo": "DA IRRETRATABILIDADE",
+        "visivel": lambda: True,
+        "textos": lambda: [
+            clausula_10_1_irretratabilidade(),
+        ],
+    },
+    {
+        "id": "cl11",
+        "variante": True,
+        "titulo": "DA EVICÇÃO DE DIREITO E VÍCIOS REDIBITÓRIOS",
+        "visivel": lambda: True,
+        "textos": lambda: [
+            clausula_11_1_vicios(),
+            clausula_11_2_vicios(),
+        ],
+    },
+    {
+        "id": "cl12",
+        "titulo": clausula_12_titulo_declaracoes,
+        "visivel": lambda: True,
+        "textos": lambda: [
+            clausula_12_1_ficara_bens(),
+            clausula_12_2_ficara_bens(),
+            clausula_12_3_ficara_bens(),
+        ],
+    },
+    {
+        "id": "cl13",
+        "variante": True,
+        "titulo": "DO TÉRMINO DA PRESTAÇÃO DE SERVIÇO DA INTERMEDIADORA",
+        "visivel": lambda: True,
+        "textos": lambda: [
+            clausula_13_1_termino_pretacao(),
+            clausula_13_2_termino_pretacao(),
+            Clausula_13_3_responsabilidade_intermediadora(),
+            Clausula_13_4_responsabilidade_intermediadora(),
+            Clausula_13_5_responsabilidade_intermediadora(),
+        ],
+    },
+    {
+        "id": "cl14",
+        "variante": True,
+        "titulo": "DAS DISPOSIÇÕES GERAIS",
+        "visivel": lambda: True,
+        "textos": lambda: [
+            clausula_14_1_disposicoes_gerais(),
+            clausula_14_2_procuracao_vendedora(),
+            clausula_14_3_procuracao_compradora(),
+            clausula_14_4_intimacoes(),
+            clausula_14_5_comunicar_endereco(),
+            clausula_14_6_alterar_endereco(),
+        ],
+    },
+    {
+        "id": "cl15",
+        "titulo": "ELEIÇÃO DO FORO",
+        "visivel": lambda: True,
+        "textos": lambda: [
+            clausula_15_1_foro(),
+        ],
+    },
+]
+
+
+def titulo_clausula(c: dict) -> str:
+    """
+    O título pode ser fixo (texto) ou variável (função avaliada no contrato atual).
+    """
+    t = c["titulo"]
+    return t() if callable(t) else t
@@ -0,0 +1,243 @@
+"""
+Cliente HTTP único do processo para os serviços externos (ViaCEP e
+ReceitaWS).
+
+- um httpx.Client com pool de conexões keep-alive (sem novo TLS a cada
+  consulta);
+- timeout, tentativas e URL base por serviço; a URL base pode vir do
+  ambiente (VIACEP_URL, RECEITAWS_URL) — útil para testar contra um
+  servidor local falso;
+- novas tentativas com espera exponencial e jitter para erro de rede/5xx;
+- disjuntor (circuit breaker) por serviço: após falhas seguidas, falha
+  na hora durante uma pausa em vez de esperar o timeout de novo;
+- métricas por serviço (chamadas, erros, latência p50/p95) e log das
+  falhas, que antes eram engolidas em silêncio.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+
+import httpx
+
+log = logging.getLogger(__name__)
+
+SERVICOS = {
+    "viacep": {
+        "env_url": "VIACEP_URL",
+        "url": "https://viacep.com.br/ws",
+        "timeout_s": 6.0,
+        "tentativas": 3,
+    },
+    "receitaws": {
+        "env_url": "RECEITAWS_URL",
+        "url": "https://receitaws.com.br/v1",
+        "timeout_s": 12.0,
+        # cada tentativa gasta cota da API gratuita
+        "tentativas": 2,
+    },
+}
+
+ESPERA_BASE_S = 0.2
+ESPERA_MAX_S = 2.0
+FALHAS_PARA_ABRIR = 5
+PAUSA_DISJUNTOR_S = 30.0
+AMOSTRAS_LATENCIA = 200
+
+
+class FalhaServico(Exception):
+    """
+    Consulta não concluída. `status` é o HTTP recebido (None para erro
+    de rede/timeout ou disjuntor aberto).
+    """
+
+    def __init__(self, servico: str, mensagem: str, status: int = None):
+        super().__init__(f"{servico}: {mensagem}")
+        self.servico = servico
+        self.status = status
+
+
+class DisjuntorAberto(FalhaServico):
+    pass
+
+
+# ============================================================
+# DISJUNTOR / MÉTRICAS
+# ============================================================
+
+class Disjuntor:
+    """
+    fechado -> (FALHAS_PARA_ABRIR falhas seguidas) -> aberto por
+    `pausa_s` -> uma chamada de teste (meio-aberto) -> fechado ou aberto.
+    """
+
+    def __init__(self, falhas_para_abrir: int = FALHAS_PARA_ABRIR, pausa_s: float = PAUSA_DISJUNTOR_S,
+                 relogio=time.monotonic):
+        self.falhas_para_abrir = falhas_para_abrir
+        self.pausa_s = pausa_s
+        self._relogio = relogio
+        self._falhas = 0
+        self._aberto_ate = None
+        self._em_teste = False
+        self._lock = threading.Lock()
+
+    @property
+    def estado(self) -> str:
+        with self._lock:
+            if self._aberto_ate is None:
+                return "fechado"
+            return "aberto" if self._relogio() < self._aberto_ate else "meio-aberto"
+
+    def permitir(self) -> bool:
+        with self._lock:
+            if self._aberto_ate is None:
+                return True
+            if self._relogio() < self._aberto_ate or self._em_teste:
+                return False
+            self._em_teste = True
+            return True
+
+    def sucesso(self):
+        with self._lock:
+            self._falhas = 0
+            self._aberto_ate = None
+            self._em_teste = False
+
+    def falha(self):
+        with self._lock:
+            self._falhas += 1
+            if self._em_teste or self._falhas >= self.falhas_para_abrir:
+                self._aberto_ate = self._relogio() + self.pausa_s
+            self._em_teste = False
+
+
+class Metricas:
+    def __init__(self):
+        self.chamadas = 0
+        self.sucessos = 0
+        self.erros = 0
+        self.tentativas_extras = 0
+        self.rejeitadas = 0
+        self._latencias_ms = deque(maxlen=AMOSTRAS_LATENCIA)
+        self._lock = threading.Lock()
+
+    def registrar(self, campo: str, latencia_ms: float = None):
+        with self._lock:
+            setattr(self, campo, getattr(self, campo) + 1)
+            if latencia_ms is not None:
+                self._latencias_ms.append(latencia_ms)
+
+    def resumo(self) -> dict:
+        with self._lock:
+            lat = sorted(self._latencias_ms)
+            return {
+                "chamadas": self.chamadas,
+                "sucessos": self.sucessos,
+                "erros": self.erros,
+                "tentativas_extras": self.tentativas_extras,
+                "rejeitadas": self.rejeitadas,
+                "latencia_p50_ms": lat[len(lat) // 2] if lat else None,
+                "latencia_p95_ms": lat[min(len(lat) - 1, int(len(lat) * 0.95))] if lat else None,
+            }
+
+
+# ============================================================
+# CLIENTE
+# ============================================================
+
+class ClienteHttp:
+
+    def __init__(self, servicos: dict = None, transport: httpx.BaseTransport = None, dormir=time.sleep):
+        self._servicos = servicos or SERVICOS
+        self._dormir = dormir
+        self._cliente = httpx.Client(
+            transport=transport,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0),
+            headers={"User-Agent": "gerador-contratos"},
+            follow_redirects=True,
+        )
+        self.disjuntores = {nome: Disjuntor() for nome in self._servicos}
+        self.metricas = {nome: Metricas() for nome in self._servicos}
+
+    def url_base(self, servico: str) -> str:
+        cfg = self._servicos[servico]
+        return (os.environ.get(cfg.get("env_url", ""), "").strip() or cfg["url"]).rstrip("/")
+
+    def get_json(self, servico: str, caminho: str):
+        """
+        GET {url_base}{caminho} e devolve o JSON. Erro de rede, timeout e
+        5xx são tentados de novo; 4xx não. FalhaServico quando não deu.
+        """
+        cfg = self._servicos[servico]
+        disjuntor, metricas = self.disjuntores[servico], self.metricas[servico]
+        timeout = httpx.Timeout(cfg["timeout_s"], connect=min(3.0, cfg["timeout_s"]))
+        url = self.url_base(servico) + caminho
+
+        if not disjuntor.permitir():
+            metricas.registrar("rejeitadas")
+            raise DisjuntorAberto(servico, "serviço indisponível (disjuntor aberto)")
+
+        # a chamada de teste (meio-aberto) precisa terminar em sucesso() ou
+        # falha(); qualquer outra exceção deixaria o disjuntor preso
+        resolvido = False
+        try:
+            ultimo = None
+            for tentativa in range(cfg["tentativas"]):
+                if tentativa:
+                    metricas.registrar("tentativas_extras")
+                    self._dormir(random.uniform(0, min(ESPERA_MAX_S, ESPERA_BASE_S * 2 ** tentativa)))
+
+                t0 = time.perf_counter()
+                try:
+                    r = self._cliente.get(url, timeout=timeout)
+                except httpx.HTTPError as e:
+                    ultimo = FalhaServico(servico, f"{type(e).__name__}: {e}")
+                    metricas.registrar("chamadas", (time.perf_counter() - t0) * 1000)
+                    continue
+                metricas.registrar("chamadas", (time.perf_counter() - t0) * 1000)
+
+                if r.status_code >= 500:
+                    ultimo = FalhaServico(servico, f"HTTP {r.status_code}", r.status_code)
+                    continue
+
+                # serviço respondeu: 4xx é problema do pedido, não do serviço
+                disjuntor.sucesso()
+                resolvido = True
+                if r.status_code >= 400:
+                    metricas.registrar("erros")
+                    log.warning("%s respondeu HTTP %s para %s", servico, r.status_code, caminho)
+                    raise FalhaServico(servico, f"HTTP {r.status_code}", r.status_code)
+                try:
+                    data = r.json()
+                except ValueError as e:
+                    metricas.registrar("erros")
+                    log.warning("%s devolveu JSON inválido para %s", servico, caminho)
+                    raise FalhaServico(servico, "JSON inválido", r.status_code) from e
+                metricas.registrar("sucessos")
+                return data
+
+            resolvido = True
+            disjuntor.falha()
+            metricas.registrar("erros")
+            log.warning("%s falhou após %s tentativa(s): %s", servico, cfg["tentativas"], ultimo)
+            raise ultimo
+        except BaseException:
+            if not resolvido:
+                disjuntor.falha()
+            raise
+
+    def resumo(self) -> dict:
+        """
+        Métricas e estado do disjuntor de cada serviço.
+        """
+        return {
+            nome: {**self.metricas[nome].resumo(), "disjuntor": self.disjuntores[nome].estado}
+            for nome in self._servicos
+        }
+
+
+# ✅ único por processo (pool de conexões compartilhado por todas as sessões)
+CLIENTE_HTTP = ClienteHttp()
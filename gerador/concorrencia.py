@@ -0,0 +1,103 @@
+"""
+Primitivas de concorrência para as consultas externas.
+
+- BaldeDeFichas: limitador de taxa (token bucket) compartilhado pelas
+  threads do processo.
+- VooUnico: "single-flight" — pedidos simultâneos pela mesma chave
+  recebem o mesmo Future, então só uma chamada sai para o serviço.
+"""
+
+import threading
+import time
+from concurrent.futures import Executor, Future
+
+
+class BaldeDeFichas:
+    """
+    `capacidade` fichas, repostas a `por_segundo`. Cada chamada externa
+    consome uma ficha; sem ficha, espera (ou desiste no timeout).
+    """
+
+    def __init__(self, capacidade: float, por_segundo: float, relogio=time.monotonic, dormir=time.sleep):
+        self.capacidade = float(capacidade)
+        self.por_segundo = float(por_segundo)
+        self._relogio = relogio
+        self._dormir = dormir
+        self._fichas = float(capacidade)
+        self._ultima = relogio()
+        self._lock = threading.Lock()
+
+    def _repor(self, agora: float):
+        self._fichas = min(self.capacidade, self._fichas + (agora - self._ultima) * self.por_segundo)
+        self._ultima = agora
+
+    def tentar(self) -> float:
+        """
+        Consome uma ficha e devolve 0.0, ou devolve quantos segundos
+        faltam para a próxima ficha (sem consumir).
+        """
+        with self._lock:
+            self._repor(self._relogio())
+            if self._fichas >= 1.0:
+                self._fichas -= 1.0
+                return 0.0
+            return (1.0 - self._fichas) / self.por_segundo
+
+    def adquirir(self, timeout: float = None) -> bool:
+        limite = None if timeout is None else self._relogio() + timeout
+        while True:
+            espera = self.tentar()
+            if espera == 0.0:
+                return True
+            if limite is not None:
+                restante = limite - self._relogio()
+                if restante <= 0:
+                    return False
+                espera = min(espera, restante)
+            self._dormir(espera)
+
+    def espera_estimada(self) -> float:
+        """
+        Segundos até haver uma ficha livre (0.0 se já houver).
+        """
+        with self._lock:
+            self._repor(self._relogio())
+            return max(0.0, (1.0 - self._fichas) / self.por_segundo)
+
+
+class VooUnico:
+    """
+    chave -> Future em andamento. Enquanto o primeiro pedido não termina,
+    os seguintes pela mesma chave recebem o mesmo Future.
+    """
+
+    def __init__(self):
+        self._em_voo: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.coalescidos = 0
+
+    def submeter(self, chave: str, executor: Executor, func, *args, ao_criar=None) -> Future:
+        """
+        `ao_criar()` roda só quando este pedido cria o Future (não quando
+        reaproveita um em andamento), antes de `func` começar.
+        """
+        with self._lock:
+            f = self._em_voo.get(chave)
+            if f is not None:
+                self.coalescidos += 1
+                return f
+            if ao_criar is not None:
+                ao_criar()
+            f = executor.submit(func, *args)
+            self._em_voo[chave] = f
+        f.add_done_callback(lambda feito: self._remover(chave, feito))
+        return f
+
+    def _remover(self, chave: str, f: Future):
+        with self._lock:
+            if self._em_voo.get(chave) is f:
+                del self._em_voo[chave]
+
+    def em_voo(self, chave: str) -> bool:
+        with self._lock:
+            return chave in self._em_voo
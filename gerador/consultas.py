@@ -0,0 +1,200 @@
+"""
+Consultas a serviços externos (ViaCEP e ReceitaWS).
+
+Devolvem o JSON do serviço ou None quando o documento é inválido,
+não existe ou a consulta falhou — quem chama só precisa testar o retorno.
+As chamadas HTTP passam pelo cliente único de gerador.cliente_http
+(pool, tentativas, disjuntor e métricas).
+Respostas (inclusive "CEP não existe") ficam no cache em disco
+gerador.cache_consultas; falhas de rede não são guardadas.
+
+solicitar_endereco_por_cep() e solicitar_empresa_por_cnpj() devolvem um
+Future (executor em segundo plano) para a tela não esperar a rede.
+
+A ReceitaWS gratuita aceita poucas consultas por minuto: as chamadas
+passam por um limitador de taxa do processo, pedidos simultâneos do
+mesmo CNPJ viram uma chamada só e a tela mostra a posição na fila.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from gerador.cache_consultas import CACHE_CONSULTAS
+from gerador.cep_offline import indice_cep_offline
+from gerador.cliente_http import CLIENTE_HTTP, FalhaServico
+from gerador.concorrencia import BaldeDeFichas, VooUnico
+from gerador.mascaras import so_digitos
+
+TTL_CEP_S = 30 * 24 * 3600.0
+# CEP inexistente: guarda por menos tempo (CEPs novos são criados)
+TTL_CEP_INEXISTENTE_S = 24 * 3600.0
+
+
+# ============================================================
+# VIA CEP - BUSCA
+# ============================================================
+_VOO_CEP = VooUnico()
+_EXECUTOR_CEP = ThreadPoolExecutor(max_workers=4, thread_name_prefix="viacep")
+
+
+def _future_pronto(valor) -> Future:
+    f = Future()
+    f.set_result(valor)
+    return f
+
+
+def _consultar_viacep(cep_limpo: str):
+    try:
+        data = CLIENTE_HTTP.get_json("viacep", f"/{cep_limpo}/json/")
+    except FalhaServico:
+        return None
+
+    if data.get("erro"):
+        CACHE_CONSULTAS.gravar("cep", cep_limpo, None, TTL_CEP_INEXISTENTE_S)
+        return None
+    CACHE_CONSULTAS.gravar("cep", cep_limpo, data, TTL_CEP_S)
+    return data
+
+
+def solicitar_endereco_por_cep(cep: str):
+    """
+    Future com o JSON do ViaCEP (ou None), sem bloquear quem chama.
+    Base offline e cache respondem na hora; o mesmo CEP em andamento
+    reaproveita o Future. None se o CEP não tem 8 dígitos.
+    """
+    cep_limpo = so_digitos(cep)
+    if len(cep_limpo) != 8:
+        return None
+
+    # ✅ base offline primeiro (funciona sem internet); ViaCEP só se não achar
+    offline = indice_cep_offline()
+    data = offline.buscar(cep_limpo) if offline else None
+    if data:
+        return _future_pronto(data)
+
+    achou, data = CACHE_CONSULTAS.obter("cep", cep_limpo)
+    if achou:
+        return _future_pronto(data)
+    return _VOO_CEP.submeter(cep_limpo, _EXECUTOR_CEP, _consultar_viacep, cep_limpo)
+
+
+def buscar_endereco_por_cep(cep: str):
+    f = solicitar_endereco_por_cep(cep)
+    return None if f is None else f.result()
+
+
+# ============================================================
+# RECEITAWS - BUSCA CNPJ (TERCEIRO)
+# ============================================================
+TTL_CNPJ_S = 30 * 24 * 3600.0
+TTL_CNPJ_INEXISTENTE_S = 24 * 3600.0
+
+# plano gratuito: 3 consultas por minuto
+RECEITAWS_POR_MINUTO = 3
+# quanto uma consulta espera na fila por uma ficha antes de desistir
+ESPERA_MAX_RECEITAWS_S = 120.0
+
+LIMITE_RECEITAWS = BaldeDeFichas(capacidade=RECEITAWS_POR_MINUTO, por_segundo=RECEITAWS_POR_MINUTO / 60.0)
+_VOO_CNPJ = VooUnico()
+_EXECUTOR_CNPJ = ThreadPoolExecutor(max_workers=4, thread_name_prefix="receitaws")
+
+# cnpj -> "fila" | "consultando" (ordem de inserção = ordem da fila)
+_SITUACAO_CNPJ: dict[str, str] = {}
+_LOCK_SITUACAO = threading.Lock()
+
+
+def _marcar(cnpj: str, situacao: str = None):
+    with _LOCK_SITUACAO:
+        if situacao is None:
+            _SITUACAO_CNPJ.pop(cnpj, None)
+        else:
+            _SITUACAO_CNPJ[cnpj] = situacao
+
+
+def _consultar_receitaws(cnpj_limpo: str):
+    try:
+        # outro processo pode ter consultado enquanto este pedido esperava
+        achou, data = CACHE_CONSULTAS.obter("cnpj", cnpj_limpo)
+        if achou:
+            return data
+
+        if not LIMITE_RECEITAWS.adquirir(timeout=ESPERA_MAX_RECEITAWS_S):
+            return None
+        _marcar(cnpj_limpo, "consultando")
+
+        try:
+            data = CLIENTE_HTTP.get_json("receitaws", f"/cnpj/{cnpj_limpo}")
+        except FalhaServico:
+            # inclui 429 (limite estourado): não guarda, tenta de novo depois
+            return None
+
+        if data.get("status") == "ERROR":
+            CACHE_CONSULTAS.gravar("cnpj", cnpj_limpo, None, TTL_CNPJ_INEXISTENTE_S)
+            return None
+        CACHE_CONSULTAS.gravar("cnpj", cnpj_limpo, data, TTL_CNPJ_S)
+        return data
+    finally:
+        _marcar(cnpj_limpo)
+
+
+def solicitar_empresa_por_cnpj(cnpj: str):
+    """
+    Future com o JSON da ReceitaWS (ou None), sem bloquear quem chama.
+    Cache em disco responde na hora (Future já concluído); pedidos do
+    mesmo CNPJ em andamento recebem o mesmo Future. None se o CNPJ não
+    tem 14 dígitos.
+    """
+    cnpj_limpo = so_digitos(cnpj)
+    if len(cnpj_limpo) != 14:
+        return None
+
+    achou, data = CACHE_CONSULTAS.obter("cnpj", cnpj_limpo)
+    if achou:
+        return _future_pronto(data)
+
+    # "fila" só para consulta nova: um Future reaproveitado (mesmo que já
+    # concluído e ainda registrado) nunca mais limparia a marcação
+    return _VOO_CNPJ.submeter(
+        cnpj_limpo, _EXECUTOR_CNPJ, _consultar_receitaws, cnpj_limpo,
+        ao_criar=lambda: _marcar(cnpj_limpo, "fila"),
+    )
+
+
+def situacao_cnpj(cnpj: str):
+    """
+    {"situacao": "fila" | "consultando", "posicao": n, "espera_s": s}
+    para um CNPJ com consulta em andamento; None se não há consulta.
+    `posicao` conta quantos pedidos estão na fila antes deste.
+    """
+    cnpj_limpo = so_digitos(cnpj)
+    with _LOCK_SITUACAO:
+        situacao = _SITUACAO_CNPJ.get(cnpj_limpo)
+        if situacao is None:
+            return None
+        fila = [c for c, s in _SITUACAO_CNPJ.items() if s == "fila"]
+    posicao = fila.index(cnpj_limpo) if cnpj_limpo in fila else 0
+    espera = LIMITE_RECEITAWS.espera_estimada() + posicao * 60.0 / RECEITAWS_POR_MINUTO
+    return {"situacao": situacao, "posicao": posicao, "espera_s": espera if situacao == "fila" else 0.0}
+
+
+def buscar_empresa_por_cnpj(cnpj: str):
+    """
+    Versão bloqueante: espera a fila e a consulta (usada fora da tela).
+    """
+    f = solicitar_empresa_por_cnpj(cnpj)
+    return None if f is None else f.result()
+
+
+def endereco_da_empresa(dados: dict) -> dict:
+    """
+    Endereço da resposta da ReceitaWS no formato do ViaCEP (cep,
+    logradouro, bairro, localidade, uf) — preenche o endereço da PJ sem
+    uma segunda consulta. Campos vazios se a Receita não informar.
+    """
+    return {
+        "cep": dados.get("cep", ""),
+        "logradouro": dados.get("logradouro", ""),
+        "bairro": dados.get("bairro", ""),
+        "localidade": dados.get("municipio", ""),
+        "uf": dados.get("uf", ""),
+    }
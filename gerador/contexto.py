@@ -0,0 +1,91 @@
+"""
+Acesso aos dados do contrato para o motor de geração.
+
+O app Streamlit guarda os dados em st.session_state.dados; o motor não pode
+depender disso. Aqui os dados ficam num ContextVar: quem gera o contrato
+ativa um snapshot (dict simples) com usar_dados(...) e as cláusulas leem
+via get()/get_list(), sem saber de onde os dados vieram.
+
+Como ContextVar é isolado por thread/tarefa, vários contratos podem ser
+gerados ao mesmo tempo (threads, processos, jobs em lote).
+
+Cada leitura via get()/get_list() também é registrada nos rastreadores
+ativos (rastrear_leituras), para o cache por dependências (gerador.memo).
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_DADOS: ContextVar[dict] = ContextVar("gerador_dados_contrato")
+_MEMO: ContextVar = ContextVar("gerador_memo", default=None)
+_LEITURAS: ContextVar[tuple] = ContextVar("gerador_leituras", default=())
+
+
+@contextmanager
+def usar_dados(dados: dict, memo=None):
+    """
+    Ativa `dados` como snapshot do contrato durante o bloco `with`.
+    Se `memo` (gerador.memo.MemoDependencias) for informado, as cláusulas
+    memoizadas reaproveitam resultados já calculados.
+    """
+    token = _DADOS.set(dados if dados is not None else {})
+    token_memo = _MEMO.set(memo)
+    try:
+        yield
+    finally:
+        _MEMO.reset(token_memo)
+        _DADOS.reset(token)
+
+
+def dados_atuais() -> dict:
+    return _DADOS.get({})
+
+
+def memo_atual():
+    return _MEMO.get()
+
+
+# ============================================================
+# RASTREIO DE LEITURAS (dependências de cada cláusula)
+# ============================================================
+
+@contextmanager
+def rastrear_leituras():
+    """
+    Coleta as chaves de `dados` lidas dentro do bloco `with`.
+    Rastreadores podem ser aninhados: a leitura vale para todos os ativos.
+    """
+    lidas = set()
+    token = _LEITURAS.set(_LEITURAS.get() + (lidas,))
+    try:
+        yield lidas
+    finally:
+        _LEITURAS.reset(token)
+
+
+def registrar_leituras(chaves):
+    """
+    Repassa chaves já conhecidas aos rastreadores ativos
+    (usado quando um resultado vem do cache e a função não é executada).
+    """
+    for lidas in _LEITURAS.get():
+        lidas.update(chaves)
+
+
+def get(k, default=""):
+    for lidas in _LEITURAS.get():
+        lidas.add(k)
+    return dados_atuais().get(k, default)
+
+
+def get_list(k) -> list:
+    """
+    Igual ao get_list do app, mas sem alterar o snapshot:
+    valor ausente ou inválido vira lista vazia.
+    """
+    for lidas in _LEITURAS.get():
+        lidas.add(k)
+    v = dados_atuais().get(k, [])
+    if not isinstance(v, list):
+        return []
+    return v
@@ -0,0 +1,153 @@
+"""
+Representação intermediária (IR) do contrato, neutra de formato.
+
+O motor de cláusulas descreve o conteúdo uma vez só com estes nós, sem
+HTML; cada formato de saída (render_html, render_docx, render_pdf,
+render_texto) apenas percorre os blocos. Os nós são dicionários e
+listas simples (JSON): o contrato gerado continua podendo ser hasheado,
+guardado nos caches e enviado para outro processo.
+
+Trechos (conteúdo de um parágrafo):
+    "texto"                                     texto normal ("\\n" = quebra de linha)
+    {"texto": "...", "negrito": True}           texto em negrito
+
+Blocos:
+    {"tipo": "titulo", "texto", "nivel"}        1 = centralizado em caixa alta; 2 = título de seção
+    {"tipo": "paragrafo", "trechos", "alinhamento"}   "justificado" | "direita" | "centro"
+    {"tipo": "caixa", "blocos"}                 quadro com borda (quadro resumo)
+    {"tipo": "clausula", "numero", "titulo", "subclausulas"}   subclausulas: [[blocos], ...]
+    {"tipo": "assinatura", "nome", "linhas"}    linha de assinatura, nome em negrito e linhas extras
+
+Onde o contrato tem "conteúdo", vale str (um parágrafo) ou lista de
+blocos; blocos() normaliza. Os blocos podem vir de caches compartilhados
+entre sessões: quem monta um documento cria nós novos, nunca altera.
+"""
+
+JUSTIFICADO = "justificado"
+DIREITA = "direita"
+CENTRO = "centro"
+
+
+# ============================================================
+# CONSTRUTORES
+# ============================================================
+
+def negrito(texto: str) -> dict:
+    return {"texto": texto, "negrito": True}
+
+
+def paragrafo(*trechos, alinhamento: str = JUSTIFICADO) -> dict:
+    return {"tipo": "paragrafo", "trechos": [t for t in trechos if t], "alinhamento": alinhamento}
+
+
+def titulo(texto: str, nivel: int = 2) -> dict:
+    return {"tipo": "titulo", "texto": texto, "nivel": nivel}
+
+
+def caixa(conteudo) -> dict:
+    return {"tipo": "caixa", "blocos": blocos(conteudo)}
+
+
+def assinatura(nome: str = "", linhas=()) -> dict:
+    return {"tipo": "assinatura", "nome": nome, "linhas": list(linhas)}
+
+
+def clausula(numero: int, texto_titulo: str, subclausulas: list) -> dict:
+    return {"tipo": "clausula", "numero": numero, "titulo": texto_titulo, "subclausulas": subclausulas}
+
+
+# ============================================================
+# CONSULTA
+# ============================================================
+
+def blocos(conteudo) -> list[dict]:
+    """
+    str -> [parágrafo]; lista de blocos -> a própria lista; vazio -> [].
+    """
+    if not conteudo:
+        return []
+    if isinstance(conteudo, str):
+        texto = conteudo.strip()
+        return [paragrafo(texto)] if texto else []
+    return list(conteudo)
+
+
+def texto_trecho(trecho) -> str:
+    return trecho if isinstance(trecho, str) else trecho.get("texto", "")
+
+
+def e_negrito(trecho) -> bool:
+    return not isinstance(trecho, str) and bool(trecho.get("negrito"))
+
+
+def numerar(prefixo: str, conteudo) -> list[dict]:
+    """
+    Blocos do conteúdo com `prefixo` ("1.2. ") no início do primeiro
+    parágrafo. Não altera os blocos recebidos.
+    """
+    out = blocos(conteudo)
+    if out and out[0]["tipo"] == "paragrafo":
+        primeiro = out[0]
+        trechos = list(primeiro["trechos"])
+        if trechos and isinstance(trechos[0], str):
+            trechos[0] = prefixo + trechos[0].lstrip()
+        else:
+            trechos.insert(0, prefixo)
+        return [{**primeiro, "trechos": trechos}] + out[1:]
+    return [paragrafo(prefixo.strip())] + out
+
+
+# ============================================================
+# DOCUMENTO COMPLETO
+# ============================================================
+
+def montar_documento(contrato: dict) -> list[dict]:
+    """
+    Blocos do contrato inteiro (título, QUADRO RESUMO, caixas das partes,
+    objeto, seções, cláusulas numeradas e assinaturas) a partir do
+    dicionário de gerador.gerar_contrato(). É a entrada de todos os
+    formatos de saída.
+    """
+    doc = []
+    add = doc.append
+
+    if contrato.get("tipo_contrato"):
+        add(titulo(contrato["tipo_contrato"], nivel=1))
+
+    # QUADRO RESUMO / DAS PARTES
+    add(titulo("QUADRO RESUMO", nivel=1))
+    add(titulo("DAS PARTES"))
+
+    doc.extend(blocos(contrato.get("frase_vendedora")))
+    if contrato.get("qualificacao_vendedores"):
+        add(caixa(contrato["qualificacao_vendedores"]))
+
+    doc.extend(blocos(contrato.get("frase_compradora")))
+    if contrato.get("qualificacao_compradores"):
+        add(caixa(contrato["qualificacao_compradores"]))
+
+    # DA INTERMEDIADORA
+    add(titulo("DA INTERMEDIADORA"))
+    add(paragrafo("Adiante simplesmente designado como ", negrito("INTERMEDIADORA"), ":"))
+    if contrato.get("intermediadora"):
+        add(caixa(contrato["intermediadora"]))
+
+    # DO OBJETO DO CONTRATO
+    add(titulo("DO OBJETO DO CONTRATO"))
+    add(paragrafo("Adiante simplesmente designado como ", negrito("IMÓVEL"), ":"))
+    if contrato.get("objeto"):
+        add(caixa(contrato["objeto"]))
+
+    for titulo_secao, conteudo in contrato.get("secoes", {}).items():
+        add(titulo(titulo_secao))
+        if conteudo:
+            add(caixa(conteudo))
+
+    # DAS CLÁUSULAS E CONDIÇÕES
+    add(titulo("DAS CLÁUSULAS E CONDIÇÕES", nivel=1))
+    doc.extend(blocos(contrato.get("preambulo")))
+
+    for c in contrato.get("clausulas", []):
+        add(clausula(c["numero"], c["titulo"], c["subclausulas"]))
+
+    return doc
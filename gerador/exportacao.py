@@ -0,0 +1,96 @@
+"""
+Exportação do contrato: snapshot de `dados` + formato -> arquivo (bytes).
+
+Ponto único de geração de arquivos, usado pela fila de documentos
+(gerador.fila_documentos). Só depende do motor e dos renderizadores, então
+roda em qualquer processo, sem Streamlit.
+"""
+
+import time
+
+from gerador.documento import montar_documento
+from gerador.motor import gerar_contrato
+from gerador.render_docx import documento_base, documento_docx
+from gerador.render_html import pagina_html
+from gerador.render_pdf import documento_pdf
+from gerador.render_texto import documento_texto
+
+
+def _titulo(dados: dict) -> str:
+    numero = str(dados.get("contrato__numero", "") or "").strip()
+    return f"Contrato {numero}" if numero else "Contrato"
+
+
+FORMATOS = {
+    "docx": {
+        "extensao": "docx",
+        "mime": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "render": lambda documento, dados: documento_docx(documento),
+    },
+    "pdf": {
+        "extensao": "pdf",
+        "mime": "application/pdf",
+        "render": lambda documento, dados: documento_pdf(documento),
+    },
+    "html": {
+        "extensao": "html",
+        "mime": "text/html",
+        "render": lambda documento, dados: pagina_html(documento, _titulo(dados)).encode("utf-8"),
+    },
+    "txt": {
+        "extensao": "txt",
+        "mime": "text/plain",
+        "render": lambda documento, dados: documento_texto(documento).encode("utf-8"),
+    },
+}
+
+
+def validar_formatos(formatos) -> list[str]:
+    desconhecidos = [f for f in formatos if f not in FORMATOS]
+    if desconhecidos:
+        raise ValueError(f"Formato desconhecido: {', '.join(desconhecidos)} (use {', '.join(FORMATOS)}).")
+    return list(formatos)
+
+
+def gerar_arquivos(dados: dict, formatos) -> tuple[dict, dict]:
+    """
+    Avalia o contrato uma vez e gera cada formato pedido.
+    Devolve ({formato: bytes}, {"contrato": s, formato: s, ...}) com os
+    segundos gastos em cada etapa.
+    """
+    validar_formatos(formatos)
+    tempos = {}
+    t0 = time.perf_counter()
+    documento = montar_documento(gerar_contrato(dados))
+    tempos["contrato"] = time.perf_counter() - t0
+
+    arquivos = {}
+    for formato in formatos:
+        t0 = time.perf_counter()
+        arquivos[formato] = FORMATOS[formato]["render"](documento, dados)
+        tempos[formato] = time.perf_counter() - t0
+    return arquivos, tempos
+
+
+def exportar(dados: dict, formato: str) -> bytes:
+    """
+    Gera o contrato de `dados` no `formato` (chave de FORMATOS).
+    """
+    return gerar_arquivos(dados, [formato])[0][formato]
+
+
+def exportar_medindo(dados: dict, formato: str) -> tuple[bytes, float]:
+    """
+    (arquivo, segundos gastos), medido dentro do processo que gerou.
+    """
+    t0 = time.perf_counter()
+    conteudo = exportar(dados, formato)
+    return conteudo, time.perf_counter() - t0
+
+
+def aquecer():
+    """
+    Prepara o processo para gerar documentos (documento base do DOCX).
+    Usado como initializer dos pools de processos.
+    """
+    documento_base()
@@ -0,0 +1,371 @@
+"""
+Fila de geração de documentos em processos separados.
+
+A tela pede um arquivo (snapshot de `dados` + formato) e recebe na hora o
+id do trabalho; a montagem do contrato e a renderização rodam num pool de
+processos, fora da thread do Streamlit, e a tela acompanha pelo id.
+
+- concorrência limitada: no máximo `trabalhadores` documentos rodando; os
+  demais esperam na fila (até `fila_max`; acima disso, FilaCheia);
+- id derivado do conteúdo (dados + formato + data): o mesmo pedido na
+  fila, rodando ou já pronto devolve o mesmo trabalho;
+- prazo por trabalho: rodando há mais de `tempo_max_s`, o trabalho falha
+  e o pool é recriado (o processo travado é encerrado; os outros
+  trabalhos que estavam no pool voltam para a fila). O prazo é conferido
+  a cada pedido/consulta — a tela consulta enquanto espera;
+- arquivos prontos ficam guardados (os `resultados_max` mais recentes) e
+  respondem na hora pedidos iguais — o serviço HTTP (gerador.servico)
+  usa isso como cache de respostas e `esperar()` para responder na mesma
+  chamada;
+- métricas: profundidade da fila, rodando, concluídos, falhas, prazos
+  estourados, recusados e espera/duração p50/p95.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date
+
+from gerador.exportacao import FORMATOS, aquecer, exportar_medindo
+from gerador.versoes import campos_persistidos
+
+log = logging.getLogger(__name__)
+
+TRABALHADORES = int(os.environ.get("GERADOR_TRABALHADORES", "0") or 0) or min(4, os.cpu_count() or 1)
+FILA_MAX = 64
+TEMPO_MAX_S = 60.0
+RESULTADOS_MAX = 100
+TENTATIVAS_MAX = 2
+AMOSTRAS_TEMPO = 200
+
+
+class FilaCheia(Exception):
+    pass
+
+
+def _id(snapshot: dict, formato: str) -> str:
+    bruto = json.dumps(
+        {"dados": snapshot, "formato": formato, "dia": date.today().isoformat()},
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str,
+    )
+    return hashlib.sha256(bruto.encode("utf-8")).hexdigest()[:24]
+
+
+def id_trabalho(dados: dict, formato: str) -> str:
+    """
+    Mesmo conteúdo + formato + dia = mesmo id (a data por extenso do
+    contrato muda na virada do dia).
+    """
+    return _id(campos_persistidos(dados), formato)
+
+
+class Trabalho:
+    def __init__(self, tid: str, dados: dict, formato: str, criado: float):
+        self.id = tid
+        self.formato = formato
+        self.estado = "fila"   # fila | rodando | pronto | erro
+        self.criado = criado
+        self.iniciado = None
+        self.concluido = None
+        self.duracao_s = None
+        self.erro = None
+        self.resultado = None
+        self.tentativas = 0
+        self.dados = dados
+        self.future = None
+
+
+def _iniciar_trabalhador(pids):
+    """
+    Initializer do pool: informa o pid do processo (para _reciclar_pool
+    encerrá-lo) e aquece.
+    """
+    pids.put(os.getpid())
+    aquecer()
+
+
+def _drenar(fila) -> set:
+    pids = set()
+    while True:
+        try:
+            pids.add(fila.get_nowait())
+        except queue.Empty:
+            return pids
+
+
+def _percentis(amostras) -> dict:
+    lat = sorted(amostras)
+    if not lat:
+        return {"p50": None, "p95": None}
+    return {"p50": lat[len(lat) // 2], "p95": lat[min(len(lat) - 1, int(len(lat) * 0.95))]}
+
+
+class FilaDocumentos:
+
+    def __init__(self, trabalhadores: int = TRABALHADORES, fila_max: int = FILA_MAX,
+                 tempo_max_s: float = TEMPO_MAX_S, resultados_max: int = RESULTADOS_MAX,
+                 relogio=time.monotonic):
+        self.trabalhadores = trabalhadores
+        self.fila_max = fila_max
+        self.tempo_max_s = tempo_max_s
+        self.resultados_max = resultados_max
+        self._relogio = relogio
+        self._executor = None
+        self._pids_pool = None
+        self._lock = threading.RLock()
+        self._mudou = threading.Condition(self._lock)
+        self._trabalhos: OrderedDict[str, Trabalho] = OrderedDict()
+        self._fila: deque[str] = deque()
+        self._rodando: set[str] = set()
+        self._esperas_s = deque(maxlen=AMOSTRAS_TEMPO)
+        self._duracoes_s = deque(maxlen=AMOSTRAS_TEMPO)
+        self.concluidos = 0
+        self.falhas = 0
+        self.expirados = 0
+        self.recusados = 0
+        self.reaproveitados = 0
+        self.pools_recriados = 0
+        self.processos_encerrados = 0
+
+    # ---------------- pool ----------------
+
+    def _pool(self) -> ProcessPoolExecutor:
+        # criado no primeiro uso: importar o módulo não sobe processos
+        if self._executor is None:
+            contexto = multiprocessing.get_context("spawn")
+            self._pids_pool = contexto.Queue()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.trabalhadores,
+                mp_context=contexto,
+                initializer=_iniciar_trabalhador,
+                initargs=(self._pids_pool,),
+            )
+        return self._executor
+
+    def aquecer_pool(self):
+        """
+        Sobe todos os processos do pool já aquecidos, para o primeiro
+        pedido não pagar o spawn (o pool só cria processos sob demanda).
+        """
+        with self._lock:
+            pool = self._pool()
+            futuros = [pool.submit(aquecer) for _ in range(self.trabalhadores)]
+        for f in futuros:
+            f.result()
+
+    def _reciclar_pool(self):
+        """
+        Encerra os processos do pool atual (inclusive o travado). Os
+        outros trabalhos que rodavam nele falham com BrokenProcessPool e
+        voltam para a fila em _concluir().
+
+        Os processos vêm dos pids que cada um informou ao subir, cruzados
+        com os filhos vivos deste processo (um pid que já morreu e foi
+        reutilizado pelo sistema não é de um filho e fica de fora).
+        """
+        executor, self._executor = self._executor, None
+        pids, self._pids_pool = self._pids_pool, None
+        if executor is None:
+            return
+        self.pools_recriados += 1
+        meus = _drenar(pids)
+        for processo in multiprocessing.active_children():
+            if processo.pid in meus:
+                processo.terminate()
+                self.processos_encerrados += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+        pids.close()
+
+    # ---------------- ciclo do trabalho ----------------
+
+    def submeter(self, dados: dict, formato: str) -> str:
+        """
+        Põe o documento na fila e devolve o id do trabalho (na hora).
+        FilaCheia se já há `fila_max` trabalhos esperando.
+        """
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato desconhecido: {formato!r} (use {', '.join(FORMATOS)}).")
+        snapshot = campos_persistidos(dados)
+        tid = _id(snapshot, formato)
+
+        with self._lock:
+            self._verificar_prazos()
+            t = self._trabalhos.get(tid)
+            if t is not None and t.estado != "erro":
+                self.reaproveitados += 1
+                self._trabalhos.move_to_end(tid)
+                return tid
+            if len(self._fila) >= self.fila_max:
+                self.recusados += 1
+                raise FilaCheia(f"Fila de documentos cheia ({len(self._fila)} esperando). Tente em instantes.")
+
+            self._trabalhos[tid] = Trabalho(tid, snapshot, formato, self._relogio())
+            self._trabalhos.move_to_end(tid)
+            self._fila.append(tid)
+            self._despachar()
+        return tid
+
+    def _despachar(self):
+        while self._fila and len(self._rodando) < self.trabalhadores:
+            tid = self._fila.popleft()
+            t = self._trabalhos[tid]
+            try:
+                f = self._pool().submit(exportar_medindo, t.dados, t.formato)
+            except BrokenProcessPool:
+                # um processo do pool morreu: pool novo e tenta de novo
+                self._reciclar_pool()
+                f = self._pool().submit(exportar_medindo, t.dados, t.formato)
+
+            t.estado = "rodando"
+            t.iniciado = self._relogio()
+            t.tentativas += 1
+            t.future = f
+            self._esperas_s.append(t.iniciado - t.criado)
+            self._rodando.add(tid)
+            f.add_done_callback(lambda feito, tid=tid: self._concluir(tid, feito))
+
+    def _concluir(self, tid: str, f):
+        with self._lock:
+            t = self._trabalhos.get(tid)
+            if t is None or t.future is not f:
+                return  # prazo estourado ou reenviado: resultado antigo não vale
+            self._rodando.discard(tid)
+            t.future = None
+
+            try:
+                conteudo, duracao = f.result()
+            except (BrokenProcessPool, CancelledError):
+                if t.tentativas < TENTATIVAS_MAX:
+                    # pool derrubado/recriado por causa de outro trabalho: volta para a frente da fila
+                    t.estado = "fila"
+                    self._fila.appendleft(tid)
+                    if self._executor is not None and getattr(self._executor, "_broken", False):
+                        self._reciclar_pool()
+                    self._despachar()
+                    return
+                self._falhar(t, "processo de geração encerrado")
+            except Exception as e:
+                self._falhar(t, f"{type(e).__name__}: {e}")
+            else:
+                t.estado = "pronto"
+                t.resultado = conteudo
+                t.duracao_s = duracao
+                t.concluido = self._relogio()
+                t.dados = None
+                self.concluidos += 1
+                self._duracoes_s.append(duracao)
+
+            self._aparar()
+            self._despachar()
+            self._mudou.notify_all()
+
+    def _falhar(self, t: Trabalho, erro: str):
+        t.estado = "erro"
+        t.erro = erro
+        t.concluido = self._relogio()
+        t.dados = None
+        self.falhas += 1
+        log.warning("Documento %s (%s) falhou: %s", t.id, t.formato, erro)
+
+    def _verificar_prazos(self):
+        agora = self._relogio()
+        vencidos = [tid for tid in self._rodando if agora - self._trabalhos[tid].iniciado > self.tempo_max_s]
+        if not vencidos:
+            return
+        for tid in vencidos:
+            t = self._trabalhos[tid]
+            self._rodando.discard(tid)
+            t.future = None
+            self.expirados += 1
+            self._falhar(t, f"tempo esgotado ({self.tempo_max_s:.0f}s)")
+        self._reciclar_pool()
+        self._despachar()
+        self._mudou.notify_all()
+
+    def _aparar(self):
+        """
+        Mantém só os `resultados_max` trabalhos terminados mais recentes.
+        """
+        terminados = [tid for tid, t in self._trabalhos.items() if t.estado in ("pronto", "erro")]
+        for tid in terminados[:max(0, len(terminados) - self.resultados_max)]:
+            del self._trabalhos[tid]
+
+    # ---------------- consulta ----------------
+
+    def situacao(self, tid: str):
+        """
+        {"estado", "posicao", "erro", "duracao_s"} do trabalho, ou None se
+        o id não existe (nunca pedido ou já descartado).
+        `posicao` conta quantos trabalhos estão na fila antes deste.
+        """
+        with self._lock:
+            self._verificar_prazos()
+            t = self._trabalhos.get(tid)
+            if t is None:
+                return None
+            posicao = self._fila.index(tid) if t.estado == "fila" else 0
+            return {"estado": t.estado, "posicao": posicao, "erro": t.erro, "duracao_s": t.duracao_s}
+
+    def esperar(self, tid: str, timeout: float = None):
+        """
+        Bloqueia até o trabalho sair da fila/execução (ou `timeout`
+        segundos) e devolve situacao(tid). Para quem precisa do arquivo na
+        mesma chamada (gerador.servico); a tela do Streamlit não espera.
+        """
+        limite = None if timeout is None else self._relogio() + timeout
+        with self._lock:
+            while True:
+                s = self.situacao(tid)
+                if s is None or s["estado"] not in ("fila", "rodando"):
+                    return s
+                restante = 0.5 if limite is None else min(0.5, limite - self._relogio())
+                if restante <= 0:
+                    return s
+                # acorda a cada 0,5s no máximo para conferir os prazos
+                self._mudou.wait(restante)
+
+    def resultado(self, tid: str):
+        """
+        Arquivo pronto (bytes) ou None.
+        """
+        with self._lock:
+            t = self._trabalhos.get(tid)
+            return t.resultado if t is not None and t.estado == "pronto" else None
+
+    def resumo(self) -> dict:
+        with self._lock:
+            self._verificar_prazos()
+            return {
+                "trabalhadores": self.trabalhadores,
+                "na_fila": len(self._fila),
+                "rodando": len(self._rodando),
+                "concluidos": self.concluidos,
+                "falhas": self.falhas,
+                "expirados": self.expirados,
+                "recusados": self.recusados,
+                "reaproveitados": self.reaproveitados,
+                "pools_recriados": self.pools_recriados,
+                "processos_encerrados": self.processos_encerrados,
+                "espera_s": _percentis(self._esperas_s),
+                "duracao_s": _percentis(self._duracoes_s),
+            }
+
+    def encerrar(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+                self._pids_pool.close()
+                self._pids_pool = None
+
+
+# ✅ única por processo do Streamlit (todas as sessões dividem o mesmo pool)
+FILA_DOCUMENTOS = FilaDocumentos()
@@ -0,0 +1,157 @@
+"""
+Importação em lote de corretores a partir de planilha (CSV ou XLSX).
+
+Fluxo: ler_planilha() transforma o arquivo em registros, e
+preparar_importacao() valida o CPF (dígitos verificadores), aplica a
+máscara e separa o que já existe na imobiliária (pelo IndiceCorretores)
+ou se repete na própria planilha. A gravação em lotes fica em
+gerador.persistencia.gravar_corretores_em_lotes.
+
+XLSX depende do openpyxl, que é opcional: sem ele só CSV é aceito.
+"""
+
+import csv
+import io
+
+from gerador.indice_corretores import IndiceCorretores
+from gerador.mascaras import cpf_valido, mask_cpf, normalizar_nome, so_digitos
+from gerador.persistencia import CAMPOS_CORRETOR
+
+# cabeçalho da planilha (normalizado) -> campo do corretor
+COLUNAS_ACEITAS = {
+    "nome": "nome",
+    "corretor": "nome",
+    "nome do corretor": "nome",
+    "cpf": "cpf",
+    "banco": "banco",
+    "agencia": "agencia",
+    "ag": "agencia",
+    "conta": "conta",
+    "conta corrente": "conta",
+    "pix": "pix",
+    "chave pix": "pix",
+}
+
+
+# ============================================================
+# LEITURA
+# ============================================================
+
+def _linhas_csv(conteudo: bytes) -> list[list[str]]:
+    try:
+        texto = conteudo.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        # CSV salvo pelo Excel em português costuma vir em Windows-1252
+        texto = conteudo.decode("cp1252", errors="replace")
+    try:
+        dialeto = csv.Sniffer().sniff(texto[:4096], delimiters=";,\t")
+    except csv.Error:
+        dialeto = csv.excel
+    return list(csv.reader(io.StringIO(texto), dialeto))
+
+
+def _celula(v) -> str:
+    if v is None:
+        return ""
+    if isinstance(v, float) and v.is_integer():
+        v = int(v)
+    return str(v)
+
+
+def _linhas_xlsx(conteudo: bytes) -> list[list[str]]:
+    try:
+        import openpyxl
+    except ImportError as e:
+        raise ValueError("Para importar .xlsx instale o openpyxl (pip install openpyxl) ou salve a planilha como CSV.") from e
+
+    wb = openpyxl.load_workbook(io.BytesIO(conteudo), read_only=True, data_only=True)
+    try:
+        return [[_celula(v) for v in row] for row in wb.worksheets[0].iter_rows(values_only=True)]
+    finally:
+        wb.close()
+
+
+def ler_planilha(nome_arquivo: str, conteudo: bytes) -> list[dict]:
+    """
+    Registros {"linha", "nome", "cpf", ...} da primeira aba/arquivo.
+    A primeira linha não vazia é o cabeçalho; colunas desconhecidas são
+    ignoradas. ValueError se não houver coluna de nome.
+    """
+    if (nome_arquivo or "").lower().endswith((".xlsx", ".xlsm")):
+        linhas = _linhas_xlsx(conteudo)
+    else:
+        linhas = _linhas_csv(conteudo)
+
+    numeradas = [(n, l) for n, l in enumerate(linhas, start=1) if any((c or "").strip() for c in l)]
+    if not numeradas:
+        return []
+
+    _, cabecalho = numeradas[0]
+    mapa = {i: COLUNAS_ACEITAS.get(normalizar_nome(h)) for i, h in enumerate(cabecalho)}
+    if "nome" not in mapa.values():
+        raise ValueError("A planilha precisa de uma coluna 'Nome'.")
+
+    registros = []
+    for n, linha in numeradas[1:]:
+        r = {c: "" for c in CAMPOS_CORRETOR}
+        for i, valor in enumerate(linha):
+            campo = mapa.get(i)
+            if campo and not r[campo]:
+                r[campo] = (valor or "").strip()
+        r["linha"] = n
+        registros.append(r)
+    return registros
+
+
+# ============================================================
+# VALIDAÇÃO / DEDUPLICAÇÃO
+# ============================================================
+
+def preparar_importacao(registros: list[dict], indice: IndiceCorretores) -> dict:
+    """
+    Separa os registros em:
+      - "novos": prontos para gravar (CPF mascarado, nome com espaços normalizados)
+      - "duplicados": (linha, motivo) já cadastrados ou repetidos na planilha
+      - "invalidos": (linha, motivo) sem nome ou com CPF inválido
+    Duplicidade é por CPF (quando informado) e depois por nome, sem
+    diferenciar acentos e caixa.
+    """
+    novos, duplicados, invalidos = [], [], []
+    cpfs_vistos, nomes_vistos = set(), set()
+
+    for r in registros:
+        nome = " ".join((r.get("nome") or "").split())
+        if not nome:
+            invalidos.append((r.get("linha"), "sem nome"))
+            continue
+
+        cpf = so_digitos(r.get("cpf", ""))
+        if cpf and 9 <= len(cpf) < 11:
+            # planilha com CPF numérico perde os zeros à esquerda
+            cpf = cpf.zfill(11)
+        if cpf and not cpf_valido(cpf):
+            invalidos.append((r.get("linha"), f"CPF inválido: {r.get('cpf')}"))
+            continue
+
+        chave_nome = normalizar_nome(nome)
+        if cpf and cpf in cpfs_vistos:
+            duplicados.append((r.get("linha"), f"CPF repetido na planilha: {mask_cpf(cpf)}"))
+            continue
+        if cpf and indice.buscar_cpf(cpf):
+            duplicados.append((r.get("linha"), f"CPF já cadastrado: {mask_cpf(cpf)}"))
+            continue
+        if chave_nome in nomes_vistos:
+            duplicados.append((r.get("linha"), f"nome repetido na planilha: {nome}"))
+            continue
+        if indice.buscar_nome(nome):
+            duplicados.append((r.get("linha"), f"nome já cadastrado: {nome}"))
+            continue
+
+        if cpf:
+            cpfs_vistos.add(cpf)
+        nomes_vistos.add(chave_nome)
+        novo = {c: (r.get(c) or "").strip() for c in CAMPOS_CORRETOR}
+        novo.update(nome=nome, cpf=mask_cpf(cpf) if cpf else "")
+        novos.append(novo)
+
+    return {"novos": novos, "duplicados": duplicados, "invalidos": invalidos}
@@ -0,0 +1,114 @@
+"""
+Índice dos corretores de uma imobiliária: por id, por nome normalizado,
+por CPF e a lista de nomes já ordenada.
+
+Montado uma vez por versão do cache (gerador.cache_corretores); as
+buscas do render_agente viram consultas O(1) em dicionário, e buscas
+por prefixo usam bisect sobre as chaves ordenadas (O(log n)). Para a
+busca enquanto digita há também um índice de trigramas (como o pg_trgm:
+cada palavra com dois espaços antes e um depois), que acha o termo no
+meio do nome ("silva" -> "João da Silva").
+"""
+
+import bisect
+from collections import Counter
+
+from gerador.mascaras import normalizar_nome, so_digitos
+
+
+def trigramas(texto: str) -> set[str]:
+    """
+    Trigramas de um texto já normalizado, palavra a palavra.
+    """
+    out = set()
+    for palavra in texto.split():
+        p = f"  {palavra} "
+        out.update(p[i:i + 3] for i in range(len(p) - 2))
+    return out
+
+
+class IndiceCorretores:
+    """
+    Estrutura somente leitura sobre a lista de corretores (dicts como os
+    de persistencia.listar_corretores). Nomes repetidos (após normalizar)
+    ficam com o primeiro corretor da lista.
+    """
+
+    def __init__(self, corretores: list[dict]):
+        self.lista = corretores
+        self.por_id: dict[str, dict] = {}
+        self.por_nome: dict[str, dict] = {}
+        self.por_cpf: dict[str, dict] = {}
+
+        for c in corretores:
+            if c.get("id"):
+                self.por_id.setdefault(str(c["id"]), c)
+            chave = normalizar_nome(c.get("nome", ""))
+            if chave:
+                self.por_nome.setdefault(chave, c)
+            cpf = so_digitos(c.get("cpf", ""))
+            if cpf:
+                self.por_cpf.setdefault(cpf, c)
+
+        # chaves normalizadas em ordem + nomes de exibição na mesma ordem
+        self.chaves_ordenadas = sorted(self.por_nome)
+        self.nomes = [(self.por_nome[k].get("nome") or "").strip() for k in self.chaves_ordenadas]
+
+        # trigrama -> posições em chaves_ordenadas
+        self.por_trigrama: dict[str, list[int]] = {}
+        for pos, chave in enumerate(self.chaves_ordenadas):
+            for t in trigramas(chave):
+                self.por_trigrama.setdefault(t, []).append(pos)
+
+    def __len__(self):
+        return len(self.por_nome)
+
+    def buscar_nome(self, nome: str):
+        return self.por_nome.get(normalizar_nome(nome))
+
+    def buscar_id(self, corretor_id: str):
+        return self.por_id.get(str(corretor_id or ""))
+
+    def buscar_cpf(self, cpf: str):
+        return self.por_cpf.get(so_digitos(cpf))
+
+    def _faixa_prefixo(self, p: str) -> range:
+        ini = bisect.bisect_left(self.chaves_ordenadas, p)
+        fim = bisect.bisect_right(self.chaves_ordenadas, p + "\uffff", lo=ini)
+        return range(ini, fim)
+
+    def com_prefixo(self, prefixo: str, limite: int = None) -> list[str]:
+        """
+        Nomes cujo nome normalizado começa com `prefixo`, em ordem alfabética.
+        """
+        faixa = self._faixa_prefixo(normalizar_nome(prefixo))
+        fim = faixa.stop if limite is None else min(faixa.stop, faixa.start + limite)
+        return self.nomes[faixa.start:fim]
+
+    def buscar(self, termo: str, limite: int, similaridade_min: float = 0.5) -> list[str]:
+        """
+        Até `limite` nomes para o termo digitado, sem diferenciar acentos
+        e caixa. Primeiro os que começam com o termo (ordem alfabética),
+        depois os que compartilham mais trigramas com ele. Termo vazio:
+        os primeiros nomes em ordem alfabética.
+        """
+        p = normalizar_nome(termo)
+        if not p:
+            return self.nomes[:limite]
+
+        faixa = self._faixa_prefixo(p)
+        posicoes = list(faixa[:limite])
+        if len(posicoes) >= limite:
+            return [self.nomes[i] for i in posicoes]
+
+        alvo = trigramas(p)
+        contagem = Counter()
+        for t in alvo:
+            contagem.update(self.por_trigrama.get(t, ()))
+        minimo = similaridade_min * len(alvo)
+        candidatos = sorted(
+            (pos for pos, n in contagem.items() if n >= minimo and pos not in faixa),
+            key=lambda pos: (-contagem[pos], pos),
+        )
+        posicoes.extend(candidatos[:limite - len(posicoes)])
+        return [self.nomes[i] for i in posicoes]
@@ -0,0 +1,416 @@
+"""
+Geração de contratos em lote, fora do Streamlit.
+
+Regenera muitos contratos de uma vez (ex.: depois de mudar o texto de uma
+cláusula) a partir de:
+- arquivos NDJSON/JSON: cada linha/objeto é o `dados` de um contrato ou
+  uma linha exportada da tabela `contratos` ({numero_contrato, versao,
+  formato, dados, patch}; versões do mesmo contrato são reconstruídas);
+- arquivos CSV: uma linha por contrato, colunas = chaves de `dados`
+  (células começando com [ ou { são lidas como JSON) — ou uma coluna
+  `dados` com o JSON inteiro;
+- a tabela `contratos` (--banco): última versão de cada contrato da
+  imobiliária, ou só dos --numeros pedidos.
+
+Os documentos são gerados num pool de processos (um por núcleo, por
+padrão); cada processo grava os próprios arquivos, então só o caminho e os
+tempos voltam para o processo principal. No fim grava relatorio.csv com o
+tempo de cada documento e imprime o resumo (docs/s, p50/p95, paralelismo).
+
+Uso:
+    python -m gerador.lote contratos.ndjson planilha.csv --saida saida/
+    python -m gerador.lote --banco --imobiliaria geral --formatos docx,pdf
+"""
+
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from gerador import persistencia, versoes
+from gerador.exportacao import FORMATOS, aquecer, gerar_arquivos, validar_formatos
+
+FORMATOS_PADRAO = ("docx", "html")
+EM_VOO_POR_PROCESSO = 4
+
+# ============================================================
+# ENTRADAS
+# ============================================================
+
+def _entrada(origem: str, numero, dados: dict) -> dict:
+    numero = str(numero or dados.get("contrato__numero", "") or "").strip()
+    return {"origem": origem, "numero": numero, "dados": dados}
+
+
+def _e_linha_tabela(obj: dict) -> bool:
+    return bool(obj.get("numero_contrato")) and ("versao" in obj or "formato" in obj)
+
+
+def _entradas_de_objetos(objetos) -> list[dict]:
+    """
+    `objetos`: [(origem, dict)]. Linhas da tabela `contratos` (com
+    numero_contrato e versao/formato) são agrupadas por contrato e
+    reconstruídas até a versão mais alta; {"dados": {...}} vira uma entrada
+    com esse `dados`; os demais objetos já são o `dados` do contrato.
+    """
+    entradas = []
+    linhas_tabela: OrderedDict[tuple, list] = OrderedDict()
+    for origem, obj in objetos:
+        if not isinstance(obj, dict):
+            raise ValueError(f"{origem}: esperado um objeto JSON.")
+        if _e_linha_tabela(obj):
+            chave = (obj.get("imobiliaria"), obj.get("numero_contrato"))
+            linhas_tabela.setdefault(chave, []).append((origem, obj))
+        elif isinstance(obj.get("dados"), dict):
+            entradas.append(_entrada(origem, obj.get("numero_contrato"), obj["dados"]))
+        else:
+            entradas.append(_entrada(origem, None, obj))
+
+    for (_, numero), grupo in linhas_tabela.items():
+        grupo.sort(key=lambda item: item[1].get("versao") or 0)
+        dados = versoes.reconstruir([obj for _, obj in grupo])
+        entradas.append(_entrada(grupo[-1][0], numero, dados))
+    return entradas
+
+
+def _celula_csv(v: str):
+    v = v.strip()
+    if v[:1] in ("[", "{"):
+        try:
+            return json.loads(v)
+        except ValueError:
+            pass
+    return v
+
+
+def _decodificar(conteudo: bytes) -> str:
+    try:
+        return conteudo.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        # CSV salvo pelo Excel em português costuma vir em Windows-1252
+        return conteudo.decode("cp1252", errors="replace")
+
+
+def ler_arquivo(caminho: str) -> list[dict]:
+    """
+    Entradas de um arquivo .ndjson/.jsonl/.json/.csv.
+    """
+    nome = os.path.basename(caminho)
+    ext = os.path.splitext(caminho)[1].lower()
+    with open(caminho, "rb") as f:
+        texto = _decodificar(f.read())
+
+    if ext in (".ndjson", ".jsonl"):
+        objetos = [
+            (f"{nome}:{i}", json.loads(linha))
+            for i, linha in enumerate(texto.splitlines(), start=1)
+            if linha.strip()
+        ]
+    elif ext == ".json":
+        conteudo = json.loads(texto)
+        lista = conteudo if isinstance(conteudo, list) else [conteudo]
+        objetos = [(f"{nome}[{i}]", obj) for i, obj in enumerate(lista)]
+    elif ext == ".csv":
+        try:
+            dialeto = csv.Sniffer().sniff(texto[:4096], delimiters=";,\t")
+        except csv.Error:
+            dialeto = csv.excel
+        objetos = [
+            (f"{nome}:{i}", {k.strip(): _celula_csv(v or "") for k, v in linha.items() if k})
+            for i, linha in enumerate(csv.DictReader(io.StringIO(texto), dialect=dialeto), start=2)
+        ]
+    else:
+        raise ValueError(f"{nome}: formato não suportado (use .ndjson, .jsonl, .json ou .csv).")
+    return _entradas_de_objetos(objetos)
+
+
+def ler_banco(sb, tenant: str, numeros=None) -> list[dict]:
+    """
+    Última versão de cada contrato da imobiliária (ou só dos `numeros`).
+    """
+    numeros = list(numeros) if numeros else persistencia.listar_numeros_contratos(sb, tenant)
+    entradas = []
+    for numero in numeros:
+        contrato = persistencia.obter_contrato_ultima_versao(sb, tenant, numero)
+        if contrato is None:
+            raise ValueError(f"Contrato {numero!r} não encontrado em {tenant!r}.")
+        entradas.append(_entrada(f"banco:{numero}@v{contrato['versao']}", numero, contrato["dados"] or {}))
+    return entradas
+
+
+def cliente_banco():
+    """
+    Cliente Supabase para a CLI: SUPABASE_URL/SUPABASE_SERVICE_ROLE_KEY no
+    ambiente ou, se não definidos, .streamlit/secrets.toml (mesmos dois
+    formatos aceitos pelo app). GERADOR_BACKEND=memoria usa o backend em
+    memória.
+    """
+    if os.environ.get("GERADOR_BACKEND", "").strip().lower() == "memoria":
+        from gerador.backend_memoria import SupabaseMemoria
+        return SupabaseMemoria()
+
+    url = os.environ.get("SUPABASE_URL", "")
+    key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY", "")
+    if not (url and key) and os.path.exists(os.path.join(".streamlit", "secrets.toml")):
+        import tomllib
+        with open(os.path.join(".streamlit", "secrets.toml"), "rb") as f:
+            segredos = tomllib.load(f)
+        url = segredos.get("supabase_url") or segredos.get("supabase", {}).get("url") or ""
+        key = segredos.get("supabase_service_role_key") or segredos.get("supabase", {}).get("service_role_key") or ""
+
+    sb = persistencia.criar_cliente(url, key)
+    if sb is None:
+        raise ValueError("Supabase não configurado (SUPABASE_URL/SUPABASE_SERVICE_ROLE_KEY ou .streamlit/secrets.toml).")
+    return sb
+
+
+# ============================================================
+# GERAÇÃO (roda nos processos do pool)
+# ============================================================
+
+def _nome_arquivo(numero: str, indice: int) -> str:
+    return re.sub(r"[^\w.-]+", "_", numero).strip("._") or f"contrato_{indice:04d}"
+
+
+def gerar_documento(indice: int, nome: str, dados: dict, formatos: list[str], saida: str) -> dict:
+    """
+    Gera e grava os arquivos de um contrato. Nunca levanta: erros voltam
+    no resultado para entrar no relatório.
+    """
+    t0 = time.perf_counter()
+    resultado = {"indice": indice, "status": "ok", "erro": "", "bytes": 0, "arquivos": [], "tempos": {}}
+    try:
+        arquivos, tempos = gerar_arquivos(dados, formatos)
+        for formato, conteudo in arquivos.items():
+            caminho = os.path.join(saida, f"{nome}.{FORMATOS[formato]['extensao']}")
+            with open(caminho, "wb") as f:
+                f.write(conteudo)
+            resultado["bytes"] += len(conteudo)
+            resultado["arquivos"].append(caminho)
+        resultado["tempos"] = tempos
+    except Exception as e:
+        resultado.update(status="erro", erro=f"{type(e).__name__}: {e}")
+    resultado["total_s"] = time.perf_counter() - t0
+    resultado["processo"] = os.getpid()
+    return resultado
+
+
+def _falha(indice: int, erro: str) -> dict:
+    return {
+        "indice": indice, "status": "erro", "erro": erro, "bytes": 0, "arquivos": [],
+        "tempos": {}, "total_s": 0.0, "processo": "",
+    }
+
+
+def _novo_pool(processos: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=processos,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=aquecer,
+    )
+
+
+def gerar_lote(entradas: list[dict], formatos, saida: str, processos: int, ao_concluir=None) -> list[dict]:
+    """
+    Gera todas as entradas em `processos` processos (1 = no próprio
+    processo) e devolve os resultados na ordem das entradas.
+    Mantém no máximo EM_VOO_POR_PROCESSO contratos por processo enviados
+    de uma vez, para não serializar o lote inteiro de início.
+
+    Se um processo morre (falta de memória, crash), o pool é recriado e os
+    contratos que estavam nele são refeitos um de cada vez: o que derrubar
+    o pool sozinho entra no relatório como erro e o lote continua.
+    """
+    formatos = validar_formatos(formatos)
+    os.makedirs(saida, exist_ok=True)
+
+    # nomes de arquivo únicos (números repetidos ganham sufixo)
+    usados = set()
+    tarefas = []
+    for i, e in enumerate(entradas):
+        base = nome = _nome_arquivo(e["numero"], i + 1)
+        n = 1
+        while nome in usados:
+            n += 1
+            nome = f"{base}_{n}"
+        usados.add(nome)
+        tarefas.append((i, nome, e["dados"], formatos, saida))
+
+    resultados = [None] * len(tarefas)
+
+    def registrar(r):
+        resultados[r["indice"]] = r
+        if ao_concluir:
+            ao_concluir(r)
+
+    if processos <= 1:
+        aquecer()
+        for tarefa in tarefas:
+            registrar(gerar_documento(*tarefa))
+        return resultados
+
+    pendentes = deque(tarefas)
+    suspeitos = deque()   # estavam num pool que quebrou: refeitos isolados
+    em_voo = {}           # future -> (tarefa, isolada)
+    executor = _novo_pool(processos)
+
+    def tratar(f) -> bool:
+        """
+        Registra o resultado do future; True se o pool quebrou.
+        """
+        tarefa, isolada = em_voo.pop(f)
+        try:
+            registrar(f.result())
+        except BrokenProcessPool:
+            if isolada:
+                registrar(_falha(tarefa[0], "processo de geração encerrado (falta de memória ou crash)"))
+            else:
+                suspeitos.append(tarefa)
+            return True
+        except Exception as e:
+            registrar(_falha(tarefa[0], f"{type(e).__name__}: {e}"))
+        return False
+
+    try:
+        while pendentes or suspeitos or em_voo:
+            quebrou = False
+            try:
+                if suspeitos:
+                    if not em_voo:
+                        em_voo[executor.submit(gerar_documento, *suspeitos[0])] = (suspeitos[0], True)
+                        suspeitos.popleft()
+                else:
+                    while pendentes and len(em_voo) < processos * EM_VOO_POR_PROCESSO:
+                        em_voo[executor.submit(gerar_documento, *pendentes[0])] = (pendentes[0], False)
+                        pendentes.popleft()
+            except BrokenProcessPool:
+                quebrou = True   # a tarefa fica na frente da fila e vai para o pool novo
+
+            if em_voo:
+                feitos, _ = wait(list(em_voo), return_when=FIRST_COMPLETED)
+                quebrou = any([tratar(f) for f in feitos]) or quebrou
+            if quebrou:
+                # os demais futures do pool quebrado terminam logo (com erro ou resultado)
+                for f in wait(list(em_voo))[0]:
+                    tratar(f)
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = _novo_pool(processos)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return resultados
+
+
+# ============================================================
+# RELATÓRIO
+# ============================================================
+
+def _ms(s) -> str:
+    return "" if s is None else f"{s * 1000:.1f}"
+
+
+def gravar_relatorio(caminho: str, entradas: list[dict], resultados: list[dict], formatos):
+    colunas = ["origem", "numero", "status", "erro", "contrato_ms"] + [f"{f}_ms" for f in formatos] + [
+        "total_ms", "bytes", "processo", "arquivos",
+    ]
+    with open(caminho, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(colunas)
+        for e, r in zip(entradas, resultados):
+            tempos = r["tempos"]
+            w.writerow(
+                [e["origem"], e["numero"], r["status"], r["erro"], _ms(tempos.get("contrato"))]
+                + [_ms(tempos.get(fmt)) for fmt in formatos]
+                + [_ms(r["total_s"]), r["bytes"], r["processo"], " ".join(r["arquivos"])]
+            )
+
+
+def resumo(resultados: list[dict], parede_s: float) -> dict:
+    """
+    Totais do lote. `paralelismo` = soma dos tempos por documento / tempo
+    de parede (≈ número de processos quando escala bem).
+    """
+    totais = sorted(r["total_s"] for r in resultados)
+    n = len(totais)
+    return {
+        "documentos": n,
+        "ok": sum(1 for r in resultados if r["status"] == "ok"),
+        "falhas": sum(1 for r in resultados if r["status"] != "ok"),
+        "parede_s": parede_s,
+        "docs_por_s": n / parede_s if parede_s > 0 else 0.0,
+        "p50_s": totais[n // 2] if n else None,
+        "p95_s": totais[min(n - 1, int(n * 0.95))] if n else None,
+        "paralelismo": sum(totais) / parede_s if parede_s > 0 else 0.0,
+    }
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m gerador.lote",
+        description="Gera contratos em lote (DOCX/HTML/PDF/TXT) a partir de NDJSON/CSV ou da tabela contratos.",
+    )
+    parser.add_argument("entradas", nargs="*", help="arquivos .ndjson/.jsonl/.json/.csv")
+    parser.add_argument("--banco", action="store_true", help="ler também da tabela contratos (última versão)")
+    parser.add_argument("--imobiliaria", default="geral", help="imobiliária (tenant) no banco (padrão: geral)")
+    parser.add_argument("--numeros", default="", help="com --banco: só estes números, separados por vírgula")
+    parser.add_argument("--formatos", default=",".join(FORMATOS_PADRAO), help=f"entre {', '.join(FORMATOS)} (padrão: docx,html)")
+    parser.add_argument("--saida", default="contratos_gerados", help="pasta dos arquivos (padrão: contratos_gerados)")
+    parser.add_argument("--processos", type=int, default=os.cpu_count() or 1, help="processos em paralelo (padrão: núcleos)")
+    parser.add_argument("--relatorio", default=None, help="CSV com o tempo de cada documento (padrão: <saida>/relatorio.csv)")
+    args = parser.parse_args(argv)
+
+    if not args.entradas and not args.banco:
+        parser.error("informe arquivos de entrada e/ou --banco")
+
+    try:
+        formatos = validar_formatos([f.strip().lower() for f in args.formatos.split(",") if f.strip()])
+        entradas = []
+        for caminho in args.entradas:
+            entradas.extend(ler_arquivo(caminho))
+        if args.banco:
+            numeros = [n.strip() for n in args.numeros.split(",") if n.strip()]
+            entradas.extend(ler_banco(cliente_banco(), args.imobiliaria, numeros))
+    except (OSError, ValueError) as e:
+        print(f"erro: {e}", file=sys.stderr)
+        return 2
+
+    if not entradas:
+        print("Nenhum contrato encontrado.")
+        return 0
+
+    processos = max(1, min(args.processos, len(entradas)))
+
+    def ao_concluir(r):
+        if r["status"] != "ok":
+            print(f"falhou: {entradas[r['indice']]['origem']}: {r['erro']}", file=sys.stderr)
+
+    t0 = time.perf_counter()
+    resultados = gerar_lote(entradas, formatos, args.saida, processos, ao_concluir)
+    parede = time.perf_counter() - t0
+
+    relatorio = args.relatorio or os.path.join(args.saida, "relatorio.csv")
+    gravar_relatorio(relatorio, entradas, resultados, formatos)
+
+    r = resumo(resultados, parede)
+    print(
+        f"{r['documentos']} contratos ({r['ok']} ok, {r['falhas']} com erro) em {r['parede_s']:.2f}s "
+        f"com {processos} processo(s): {r['docs_por_s']:.1f} docs/s, "
+        f"p50 {_ms(r['p50_s'])} ms, p95 {_ms(r['p95_s'])} ms, paralelismo {r['paralelismo']:.1f}x"
+    )
+    print(f"arquivos em {args.saida}/, relatório em {relatorio}")
+    return 1 if r["falhas"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
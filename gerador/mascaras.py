@@ -0,0 +1,146 @@
+"""
+Máscaras e formatações de campos (CPF, CNPJ, CEP, dinheiro, %...).
+
+Funções puras: recebem texto, devolvem texto. Usadas pelos callbacks
+dos campos no app e por quem mais precisar formatar dados do contrato.
+"""
+
+import re
+import unicodedata
+
+
+# ============================================================
+# HELPERS - DIGITOS / MÁSCARAS
+# ============================================================
+
+def so_digitos(s: str) -> str:
+    return re.sub(r"\D", "", s or "")
+
+def normalizar_nome(nome: str) -> str:
+    """
+    Forma de comparação de nomes: sem acentos, minúsculas e espaços
+    simples ("  JOÃO  da Silva" -> "joao da silva").
+    """
+    s = unicodedata.normalize("NFKD", nome or "")
+    s = "".join(c for c in s if not unicodedata.combining(c))
+    return " ".join(s.casefold().split())
+
+def mask_cpf(v: str) -> str:
+    d = so_digitos(v)[:11]
+    if len(d) <= 3:
+        return d
+    if len(d) <= 6:
+        return f"{d[:3]}.{d[3:]}"
+    if len(d) <= 9:
+        return f"{d[:3]}.{d[3:6]}.{d[6:]}"
+    return f"{d[:3]}.{d[3:6]}.{d[6:9]}-{d[9:]}"
+
+def cpf_valido(v: str) -> bool:
+    """
+    Confere os dois dígitos verificadores (e rejeita 111.111.111-11 etc.).
+    """
+    d = so_digitos(v)
+    if len(d) != 11 or d == d[0] * 11:
+        return False
+    for n in (9, 10):
+        soma = sum(int(d[i]) * (n + 1 - i) for i in range(n))
+        if (soma * 10) % 11 % 10 != int(d[n]):
+            return False
+    return True
+
+def mask_cnpj(v: str) -> str:
+    d = so_digitos(v)[:14]
+    if len(d) <= 2:
+        return d
+    if len(d) <= 5:
+        return f"{d[:2]}.{d[2:]}"
+    if len(d) <= 8:
+        return f"{d[:2]}.{d[2:5]}.{d[5:]}"
+    if len(d) <= 12:
+        return f"{d[:2]}.{d[2:5]}.{d[5:8]}/{d[8:]}"
+    return f"{d[:2]}.{d[2:5]}.{d[5:8]}/{d[8:12]}-{d[12:]}"
+
+
+def mask_cep(v: str) -> str:
+    d = so_digitos(v)[:8]
+    if len(d) <= 5:
+        return d
+    return f"{d[:5]}-{d[5:]}"
+
+
+def parse_money_br(s: str) -> float:
+    if not s:
+        return 0.0
+    t = s.strip().replace("R$", "").strip()
+    t = t.replace(".", "").replace(" ", "")
+    t = t.replace(",", ".")
+    try:
+        return float(t)
+    except ValueError:
+        return 0.0
+
+
+def mask_money_br(s: str) -> str:
+    if not s:
+        return ""
+
+    # remove qualquer coisa que não seja número, vírgula ou ponto
+    t = s.strip().replace("R$", "").strip()
+
+    # se digitou apenas letras ou vazio
+    if not so_digitos(t):
+        return ""
+
+    v = parse_money_br(t)
+
+    out = f"{v:,.2f}"
+    out = out.replace(",", "X").replace(".", ",").replace("X", ".")
+
+    return f"R$ {out}"
+
+
+def money_br(v: float) -> str:
+    out = f"{v:,.2f}"
+    out = out.replace(",", "X").replace(".", ",").replace("X", ".")
+    return f"R$ {out}"
+
+
+def mask_ordinal_cartorio(s: str) -> str:
+    d = so_digitos(s)
+    if not d:
+        return ""
+    return f"{int(d)}º"
+
+
+def mask_percent(s: str) -> str:
+    d = so_digitos(s)
+    if not d:
+        return ""
+    return f"{int(d)}%"
+
+
+# ============================================================
+# ENDEREÇO
+# ============================================================
+
+def format_endereco_completo(logradouro, numero, complemento, bairro, cidade, uf, cep):
+    partes = []
+    if logradouro:
+        partes.append(logradouro)
+    if numero:
+        partes.append(f"n.º {numero}")
+    if complemento:
+        partes.append(complemento)
+    if bairro:
+        partes.append(bairro)
+    if cidade and uf:
+        partes.append(f"{cidade}/{uf}")
+    elif cidade:
+        partes.append(cidade)
+    elif uf:
+        partes.append(uf)
+
+    texto = ", ".join([p for p in partes if p])
+    if cep:
+        texto += f" - CEP: {cep}"
+    return texto.strip()
@@ -0,0 +1,90 @@
+"""
+Cache de cláusulas por dependências (chaves de `dados` efetivamente lidas).
+
+Cada resultado guardado sabe quais chaves de `dados` leu ao ser calculado
+(registradas automaticamente por gerador.contexto.get/get_list). Quando o
+app altera uma chave (set_), apenas os resultados que dependem dela são
+descartados; todo o resto é reaproveitado na próxima prévia.
+"""
+
+from datetime import date
+from functools import wraps
+
+from gerador.contexto import memo_atual, rastrear_leituras, registrar_leituras
+
+
+class MemoDependencias:
+    """
+    Guarda resultados de funções do motor junto com as chaves de `dados` que leram.
+
+    Uma instância por sessão/contrato (não é compartilhada entre contratos).
+    """
+
+    def __init__(self):
+        self._valores = {}     # chave_memo -> resultado
+        self._deps = {}        # chave_memo -> frozenset(chaves de dados)
+        self._por_chave = {}   # chave de dados -> set(chave_memo)
+        self._dia = date.today()
+        self.acertos = 0
+        self.falhas = 0
+
+    def avaliar(self, chave_memo, func, *args):
+        # a data por extenso do contrato muda na virada do dia
+        hoje = date.today()
+        if hoje != self._dia:
+            self.limpar()
+            self._dia = hoje
+
+        if chave_memo in self._valores:
+            self.acertos += 1
+            registrar_leituras(self._deps[chave_memo])
+            return self._valores[chave_memo]
+
+        self.falhas += 1
+        with rastrear_leituras() as lidas:
+            valor = func(*args)
+
+        self._valores[chave_memo] = valor
+        self._deps[chave_memo] = frozenset(lidas)
+        for k in lidas:
+            self._por_chave.setdefault(k, set()).add(chave_memo)
+        return valor
+
+    def invalidar(self, chave_dados: str):
+        """
+        Descarta os resultados que leram `chave_dados`.
+        """
+        for chave_memo in self._por_chave.pop(chave_dados, ()):
+            self._valores.pop(chave_memo, None)
+            for k in self._deps.pop(chave_memo, ()):
+                if k != chave_dados:
+                    self._por_chave.get(k, set()).discard(chave_memo)
+
+    def limpar(self):
+        self._valores.clear()
+        self._deps.clear()
+        self._por_chave.clear()
+
+    def __len__(self):
+        return len(self._valores)
+
+
+def avaliar_memoizado(chave_memo, func, *args):
+    """
+    Executa func(*args) pelo memo ativo (usar_dados(..., memo=...)).
+    Sem memo ativo, apenas executa.
+    """
+    memo = memo_atual()
+    if memo is None:
+        return func(*args)
+    return memo.avaliar(chave_memo, func, *args)
+
+
+def memoizada(func):
+    """
+    Decorador: memoiza a função pelo memo ativo, usando nome + argumentos como chave.
+    """
+    @wraps(func)
+    def wrapper(*args):
+        return avaliar_memoizado((func.__name__,) + args, func, *args)
+    return wrapper
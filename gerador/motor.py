@@ -0,0 +1,123 @@
+"""
+Motor de geração do contrato completo a partir de um snapshot de `dados`.
+
+Uso (sem Streamlit):
+
+    from gerador import gerar_contrato
+    contrato = gerar_contrato(dados)
+
+`dados` é o mesmo dicionário que o app guarda em st.session_state.dados
+(e que é salvo em contratos.dados no Supabase).
+
+Com `memo` (gerador.memo.MemoDependencias), cada bloco do contrato só é
+recalculado quando alguma chave de `dados` que ele leu foi alterada.
+
+As cláusulas "variante" vêm prontas do cache de variantes (gerador.variantes),
+compartilhado entre sessões; só as cláusulas próprias do contrato são avaliadas.
+"""
+
+from gerador.clausulas import (
+    CLAUSULAS,
+    bloco_intermediadora,
+    bloco_objeto,
+    bloco_qualificacao_compradores,
+    bloco_qualificacao_vendedores,
+    clausula_preambulo_clausulas_condicoes,
+    frase_adiante_designado,
+    frase_adiante_designado_compradora,
+    numerar_subclausulas,
+    titulo_clausula,
+)
+from gerador.contexto import get, usar_dados
+from gerador.memo import avaliar_memoizado
+from gerador.variantes import CACHE_VARIANTES, assinatura_variante
+
+
+def _avaliar_clausula(c: dict):
+    """
+    Avalia uma entrada de CLAUSULAS no contrato ativo.
+    Retorna None se a cláusula não estiver visível.
+    """
+    if not c["visivel"]():
+        return None
+    return {
+        "id": c["id"],
+        "titulo": titulo_clausula(c),
+        "textos": c["textos"](),
+    }
+
+
+def _montar_corpo_variante() -> dict:
+    """
+    Avalia todas as cláusulas "variante" (e o preâmbulo) no contrato ativo.
+    O resultado vale para qualquer contrato com a mesma assinatura.
+    """
+    corpo = {c["id"]: _avaliar_clausula(c) for c in CLAUSULAS if c.get("variante")}
+    corpo["preambulo"] = clausula_preambulo_clausulas_condicoes()
+    return corpo
+
+
+def _corpo_variante() -> dict:
+    return CACHE_VARIANTES.obter(assinatura_variante(), _montar_corpo_variante)
+
+
+def clausulas_do_contrato(corpo: dict) -> list[dict]:
+    """
+    Junta as cláusulas da variante (`corpo`) com as cláusulas próprias do
+    contrato ativo e devolve apenas as visíveis, já com numeração principal
+    (1, 2, 3...) e das subcláusulas (1.1, 1.2...).
+    """
+    avaliadas = []
+    for c in CLAUSULAS:
+        if c.get("variante"):
+            avaliadas.append(corpo[c["id"]])
+        else:
+            avaliadas.append(avaliar_memoizado(("clausula", c["id"]), _avaliar_clausula, c))
+
+    clausulas_visiveis = [c for c in avaliadas if c is not None]
+
+    out = []
+    for i, c in enumerate(clausulas_visiveis, start=1):
+        out.append({
+            "id": c["id"],
+            "numero": i,
+            "titulo": c["titulo"],
+            "subclausulas": numerar_subclausulas(i, c["textos"]),
+        })
+    return out
+
+
+def gerar_contrato(dados: dict, memo=None) -> dict:
+    """
+    Gera o contrato completo (quadro resumo + cláusulas) para o snapshot `dados`.
+
+    Retorna um dicionário simples (textos e blocos de gerador.documento,
+    sem HTML), pronto para ser exibido na prévia, exportado ou enviado para
+    outro processo:
+    - tipo_contrato
+    - frase_vendedora / qualificacao_vendedores
+    - frase_compradora / qualificacao_compradores
+    - intermediadora
+    - objeto / secoes
+    - preambulo
+    - clausulas: [{id, numero, titulo, subclausulas: [[blocos], ...]}]
+
+    gerador.documento.montar_documento() transforma o resultado no
+    documento único que alimenta todos os formatos de saída.
+    """
+    with usar_dados(dados, memo=memo):
+        corpo = avaliar_memoizado(("corpo_variante",), _corpo_variante)
+        objeto = avaliar_memoizado(("objeto",), bloco_objeto)
+
+        return {
+            "tipo_contrato": get("contrato__tipo", "").strip(),
+            "frase_vendedora": avaliar_memoizado(("frase_vendedora",), frase_adiante_designado),
+            "qualificacao_vendedores": avaliar_memoizado(("vendedores",), bloco_qualificacao_vendedores),
+            "frase_compradora": avaliar_memoizado(("frase_compradora",), frase_adiante_designado_compradora),
+            "qualificacao_compradores": avaliar_memoizado(("compradores",), bloco_qualificacao_compradores),
+            "intermediadora": bloco_intermediadora(),
+            "objeto": objeto.get("objeto", ""),
+            "secoes": objeto.get("secoes", {}),
+            "preambulo": corpo["preambulo"],
+            "clausulas": clausulas_do_contrato(corpo),
+        }
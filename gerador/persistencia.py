@@ -0,0 +1,310 @@
+"""
+Camada de acesso ao Supabase (corretores e contratos).
+
+Nada aqui conhece o Streamlit: toda função recebe o cliente `sb` e a
+imobiliária (`tenant`) explicitamente. O app cuida de criar o cliente
+(a partir dos Secrets) e de descobrir a imobiliária do usuário logado.
+"""
+
+import time
+from typing import Optional
+
+from postgrest.exceptions import APIError
+from supabase import create_client, Client
+
+from gerador import versoes
+
+COLUNAS_CORRETOR = "id, imobiliaria, nome, cpf, banco, agencia, conta, pix"
+# colunas editáveis do corretor (ordem da grade do admin)
+CAMPOS_CORRETOR = ("nome", "cpf", "banco", "agencia", "conta", "pix")
+COLUNAS_CONTRATO = "id, imobiliaria, numero_contrato, versao, numero_versao_label, formato, dados, patch"
+
+# conflito de versão no save (unique violation do Postgres)
+UNIQUE_VIOLATION = "23505"
+# patch enviado contra uma versão que já não é a última (serialization_failure)
+BASE_DESATUALIZADA = "40001"
+# corretores por upsert na importação em lote
+TAMANHO_LOTE_IMPORTACAO = 500
+TENTATIVAS_SALVAR = 3
+ESPERA_CONFLITO_S = 0.05
+
+
+def criar_cliente(url: str, key: str) -> Optional[Client]:
+    url = (url or "").strip()
+    key = (key or "").strip()
+    if not url or not key:
+        return None
+    return create_client(url, key)
+
+
+# ============================================================
+# CORRETORES
+# ============================================================
+
+def _corretor_da_linha(row: dict) -> dict:
+    out = {"id": str(row.get("id") or "")}
+    out.update({c: row.get(c) or "" for c in CAMPOS_CORRETOR})
+    return out
+
+
+def _payload_corretor(tenant: str, corretor: dict) -> dict:
+    payload = {"imobiliaria": tenant}
+    payload.update({c: (corretor.get(c) or "").strip() for c in CAMPOS_CORRETOR})
+    if corretor.get("id"):
+        payload["id"] = corretor["id"]
+    return payload
+
+
+def _escapar_like(texto: str) -> str:
+    return texto.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def listar_corretores(sb: Client, tenant: str) -> list[dict]:
+    """
+    Espera tabela: corretores
+    Colunas: id (uuid), imobiliaria (text), nome, cpf, banco, agencia, conta, pix
+    """
+    res = (
+        sb.table("corretores")
+          .select(COLUNAS_CORRETOR)
+          .eq("imobiliaria", tenant)
+          .order("nome")
+          .execute()
+    )
+
+    return [_corretor_da_linha(row) for row in (res.data or [])]
+
+
+def pagina_corretores(
+    sb: Client,
+    tenant: str,
+    pagina: int,
+    por_pagina: int,
+    filtro: str = "",
+    campo_filtro: str = "nome",
+    ordem: str = "nome",
+    desc: bool = False,
+) -> tuple[list[dict], int]:
+    """
+    Uma página de corretores filtrada e ordenada no banco (ilike + order +
+    range). `pagina` começa em 0. Devolve (corretores, total filtrado).
+    """
+    if campo_filtro not in CAMPOS_CORRETOR or ordem not in CAMPOS_CORRETOR:
+        raise ValueError("Campo de filtro/ordem inválido.")
+
+    q = sb.table("corretores").select(COLUNAS_CORRETOR, count="exact").eq("imobiliaria", tenant)
+    filtro = (filtro or "").strip()
+    if filtro:
+        q = q.ilike(campo_filtro, f"%{_escapar_like(filtro)}%")
+
+    inicio = max(0, pagina) * por_pagina
+    res = q.order(ordem, desc=desc).order("id").range(inicio, inicio + por_pagina - 1).execute()
+    return [_corretor_da_linha(row) for row in (res.data or [])], int(res.count or 0)
+
+
+def salvar_corretor(sb: Client, tenant: str, nome, cpf, banco, agencia, conta, pix, corretor_id=None) -> str:
+    """
+    Insere/atualiza corretor e retorna id.
+    """
+    payload = _payload_corretor(tenant, {
+        "id": corretor_id, "nome": nome, "cpf": cpf, "banco": banco,
+        "agencia": agencia, "conta": conta, "pix": pix,
+    })
+
+    res = sb.table("corretores").upsert(payload).execute()
+
+    if res.data and isinstance(res.data, list) and len(res.data) > 0:
+        return str(res.data[0].get("id") or corretor_id or "")
+
+    return str(corretor_id or "")
+
+
+def excluir_corretor(sb: Client, tenant: str, corretor_id: str) -> bool:
+    if not corretor_id:
+        return False
+    sb.table("corretores").delete().eq("id", corretor_id).eq("imobiliaria", tenant).execute()
+    return True
+
+
+def aplicar_alteracoes_corretores(sb: Client, tenant: str, gravar: list[dict], excluir: list[str]) -> dict:
+    """
+    Grava um lote de alterações: um upsert com todos os corretores
+    novos/alterados (sem id = novo) e um delete com todos os ids
+    excluídos. Devolve {"gravados": n, "excluidos": n}.
+    """
+    gravar = [c for c in gravar if (c.get("nome") or "").strip()]
+    excluir = [str(i) for i in excluir if i]
+
+    if gravar:
+        # default_to_null=False: linhas sem id usam o default da coluna
+        sb.table("corretores").upsert(
+            [_payload_corretor(tenant, c) for c in gravar], default_to_null=False
+        ).execute()
+    if excluir:
+        sb.table("corretores").delete().eq("imobiliaria", tenant).in_("id", excluir).execute()
+
+    return {"gravados": len(gravar), "excluidos": len(excluir)}
+
+
+def gravar_corretores_em_lotes(
+    sb: Client, tenant: str, corretores: list[dict], tamanho_lote: int = TAMANHO_LOTE_IMPORTACAO, progresso=None
+) -> int:
+    """
+    Grava `corretores` em upserts de até `tamanho_lote` linhas. Chama
+    progresso(gravados, total) após cada lote. Devolve o total gravado;
+    se um lote falhar, os anteriores continuam gravados e o erro sobe.
+    """
+    tamanho_lote = max(1, int(tamanho_lote))
+    total, gravados = len(corretores), 0
+    for inicio in range(0, total, tamanho_lote):
+        r = aplicar_alteracoes_corretores(sb, tenant, corretores[inicio:inicio + tamanho_lote], [])
+        gravados += r["gravados"]
+        if progresso:
+            progresso(min(inicio + tamanho_lote, total), total)
+    return gravados
+
+
+# ============================================================
+# CONTRATOS (VERSIONADOS)
+# ============================================================
+
+def salvar_contrato_nova_versao(
+    sb: Client, tenant: str, numero_contrato: str, dados: dict, base: Optional[dict] = None
+) -> dict:
+    """
+    Grava `dados` em public.contratos criando uma NOVA versão.
+
+    `base` ({"versao", "dados"}) é a última versão que a sessão conhece.
+    Com base, grava só o patch contra ela; sem base (ou quando a próxima
+    versão cai num múltiplo de INTERVALO_SNAPSHOT) grava snapshot.
+
+    Uma ida ao banco: a função salvar_contrato_nova_versao (ver
+    supabase/migrations) aloca a versão e insere na mesma transação. Se
+    a base estiver desatualizada (outro corretor salvou antes) ou houver
+    conflito de versão, tenta de novo como snapshot, até TENTATIVAS_SALVAR vezes.
+
+    O hash do conteúdo vai junto: se for igual ao da última versão, o
+    banco não grava nada e devolve a versão existente ("inalterado": True).
+
+    Retorna {"versao", "label", "inalterado", "data", "base"}; "base" é a
+    versão resultante, para o próximo save da sessão.
+    """
+    atuais = versoes.campos_persistidos(dados)
+    hash_atual = versoes.hash_conteudo(atuais)
+
+    for tentativa in range(1, TENTATIVAS_SALVAR + 1):
+        params = {
+            "p_imobiliaria": tenant,
+            "p_numero_contrato": numero_contrato,
+            "p_dados": None,
+            "p_patch": None,
+            "p_base_versao": None,
+            "p_intervalo_snapshot": versoes.INTERVALO_SNAPSHOT,
+            "p_hash": hash_atual,
+        }
+        if base and base["versao"] % versoes.INTERVALO_SNAPSHOT != 0:
+            params["p_patch"] = versoes.diff(base["dados"], atuais)
+            params["p_base_versao"] = base["versao"]
+        else:
+            params["p_dados"] = atuais
+
+        try:
+            res = sb.rpc("salvar_contrato_nova_versao", params).execute()
+            break
+        except APIError as e:
+            if e.code not in (UNIQUE_VIOLATION, BASE_DESATUALIZADA) or tentativa == TENTATIVAS_SALVAR:
+                raise
+            base = None
+            time.sleep(ESPERA_CONFLITO_S * tentativa)
+
+    rows = res.data or []
+    if not rows:
+        raise RuntimeError("O banco não retornou a versão gravada.")
+
+    versao = int(rows[0].get("versao") or 0)
+    label = rows[0].get("numero_versao_label") or f"versao_{versao}"
+    return {
+        "versao": versao,
+        "label": label,
+        "inalterado": bool(rows[0].get("inalterado")),
+        "data": rows,
+        "base": {"versao": versao, "label": label, "hash": hash_atual, "dados": atuais},
+    }
+
+
+def obter_contrato_versao(sb: Client, tenant: str, numero_contrato: str, versao: Optional[int] = None):
+    """
+    Retorna a versão pedida (None = a mais alta) já reconstruída, no mesmo
+    formato de antes: {id, imobiliaria, numero_contrato, versao,
+    numero_versao_label, dados}. None se não existir.
+
+    Duas consultas: o snapshot mais recente até a versão e, a partir dele,
+    as linhas até a versão (no máximo INTERVALO_SNAPSHOT linhas).
+    """
+    q = (
+        sb.table("contratos")
+        .select("versao")
+        .eq("imobiliaria", tenant)
+        .eq("numero_contrato", numero_contrato)
+        .eq("formato", "snapshot")
+    )
+    if versao is not None:
+        q = q.lte("versao", versao)
+    snap = q.order("versao", desc=True).limit(1).execute().data or []
+    if not snap:
+        return None
+
+    q = (
+        sb.table("contratos")
+        .select(COLUNAS_CONTRATO)
+        .eq("imobiliaria", tenant)
+        .eq("numero_contrato", numero_contrato)
+        .gte("versao", snap[0]["versao"])
+    )
+    if versao is not None:
+        q = q.lte("versao", versao)
+    linhas = q.order("versao").execute().data or []
+    if not linhas or (versao is not None and linhas[-1]["versao"] != versao):
+        return None
+
+    ultima = linhas[-1]
+    return {
+        "id": ultima.get("id"),
+        "imobiliaria": ultima.get("imobiliaria"),
+        "numero_contrato": ultima.get("numero_contrato"),
+        "versao": ultima.get("versao"),
+        "numero_versao_label": ultima.get("numero_versao_label"),
+        "dados": versoes.reconstruir(linhas),
+    }
+
+
+def obter_contrato_ultima_versao(sb: Client, tenant: str, numero_contrato: str):
+    """
+    Retorna a última versão do contrato (versão mais alta) ou None.
+    """
+    return obter_contrato_versao(sb, tenant, numero_contrato)
+
+
+def listar_numeros_contratos(sb: Client, tenant: str, por_pagina: int = 1000) -> list[str]:
+    """
+    Números dos contratos da imobiliária (ordenados). Todo contrato tem
+    snapshot na versão 1, então basta olhar as linhas de snapshot.
+    """
+    numeros = set()
+    inicio = 0
+    while True:
+        linhas = (
+            sb.table("contratos")
+            .select("numero_contrato")
+            .eq("imobiliaria", tenant)
+            .eq("formato", "snapshot")
+            .order("numero_contrato")
+            .range(inicio, inicio + por_pagina - 1)
+            .execute()
+            .data
+            or []
+        )
+        numeros.update(l["numero_contrato"] for l in linhas)
+        if len(linhas) < por_pagina:
+            return sorted(numeros)
+        inicio += por_pagina
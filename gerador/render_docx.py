@@ -0,0 +1,183 @@
+"""
+Renderização do contrato em DOCX (python-docx).
+
+Percorre o mesmo documento da prévia (gerador.documento.montar_documento):
+títulos, caixas do QUADRO RESUMO (tabelas de uma célula), cláusulas
+numeradas e assinaturas.
+
+O documento base (modelo + estilos) é montado uma vez por processo e
+clonado (deepcopy) a cada contrato: clonar custa bem menos que abrir o
+pacote .docx de novo. O modelo pode ser trocado pela variável de
+ambiente GERADOR_MODELO_DOCX (ex.: papel timbrado da imobiliária).
+"""
+
+import copy
+import io
+import os
+import threading
+
+from docx import Document
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Cm, Pt
+
+from gerador.documento import CENTRO, DIREITA, e_negrito, montar_documento, texto_trecho
+
+FONTE = "Arial"
+TAMANHO_PT = 11
+LINHA_ASSINATURA = "_" * 45
+
+_BASE = None
+_LOCK_BASE = threading.Lock()
+
+
+# ============================================================
+# DOCUMENTO BASE (uma vez por processo)
+# ============================================================
+
+def _montar_base():
+    modelo = os.environ.get("GERADOR_MODELO_DOCX", "").strip()
+    doc = Document(modelo or None)
+
+    normal = doc.styles["Normal"]
+    normal.font.name = FONTE
+    normal.font.size = Pt(TAMANHO_PT)
+    normal.paragraph_format.space_after = Pt(6)
+    normal.paragraph_format.line_spacing = 1.15
+
+    if not modelo:
+        for secao in doc.sections:
+            secao.top_margin = secao.bottom_margin = Cm(2.5)
+            secao.left_margin = secao.right_margin = Cm(2.5)
+
+    # corpo vazio: o modelo pode trazer texto de exemplo
+    corpo = doc.element.body
+    for el in list(corpo):
+        if not el.tag.endswith("}sectPr"):
+            corpo.remove(el)
+    return doc
+
+
+def documento_base():
+    """
+    Documento base compartilhado. Não alterar: use novo_documento().
+    """
+    global _BASE
+    with _LOCK_BASE:
+        if _BASE is None:
+            _BASE = _montar_base()
+        return _BASE
+
+
+def novo_documento():
+    # a base nunca é alterada depois de pronta: clonar não precisa de lock
+    return copy.deepcopy(documento_base())
+
+
+# ============================================================
+# BLOCOS DO DOCUMENTO (gerador.documento)
+# ============================================================
+
+_ALINHAMENTOS = {
+    DIREITA: WD_ALIGN_PARAGRAPH.RIGHT,
+    CENTRO: WD_ALIGN_PARAGRAPH.CENTER,
+}
+
+
+def _paragrafo(destino, b: dict):
+    par = destino.add_paragraph()
+    par.alignment = _ALINHAMENTOS.get(b.get("alinhamento"), WD_ALIGN_PARAGRAPH.JUSTIFY)
+    for t in b["trechos"]:
+        for i, linha in enumerate(texto_trecho(t).split("\n")):
+            if i:
+                par.add_run().add_break()
+            run = par.add_run(linha)
+            run.bold = e_negrito(t) or None
+
+
+def _titulo(destino, texto: str, nivel: int = 2):
+    par = destino.add_paragraph()
+    par.paragraph_format.keep_with_next = True
+    if nivel == 1:
+        par.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        par.paragraph_format.space_before = Pt(6)
+        run = par.add_run(texto.upper())
+        run.font.size = Pt(13)
+    else:
+        par.paragraph_format.space_before = Pt(12)
+        run = par.add_run(texto)
+    run.bold = True
+
+
+def _caixa(doc, blocos: list[dict]):
+    """
+    Caixa com borda (tabela de uma célula), como o box da prévia.
+    """
+    if not blocos:
+        return
+    tabela = doc.add_table(rows=1, cols=1)
+    tabela.style = "Table Grid"
+    tabela.alignment = WD_TABLE_ALIGNMENT.CENTER
+    celula = tabela.cell(0, 0)
+    # célula nasce com um parágrafo vazio: sai depois de preenchida
+    vazio = celula.paragraphs[0]
+    _blocos(celula, blocos)
+    if len(celula.paragraphs) > 1:
+        vazio._element.getparent().remove(vazio._element)
+    doc.add_paragraph()
+
+
+def _assinatura(destino, b: dict):
+    par = destino.add_paragraph()
+    par.paragraph_format.space_before = Pt(30)
+    par.paragraph_format.keep_with_next = True
+    par.add_run(LINHA_ASSINATURA)
+    linhas = ([b["nome"]] if b.get("nome") else []) + list(b.get("linhas", []))
+    for i, linha in enumerate(linhas):
+        par.add_run().add_break()
+        run = par.add_run(linha)
+        run.bold = (i == 0 and bool(b.get("nome"))) or None
+
+
+def _blocos(destino, blocos: list[dict]):
+    """
+    Acrescenta os blocos em `destino` (documento ou célula).
+    """
+    for b in blocos:
+        tipo = b["tipo"]
+        if tipo == "paragrafo":
+            _paragrafo(destino, b)
+        elif tipo == "titulo":
+            _titulo(destino, b["texto"], b.get("nivel", 2))
+        elif tipo == "caixa":
+            _caixa(destino, b["blocos"])
+        elif tipo == "assinatura":
+            _assinatura(destino, b)
+        elif tipo == "clausula":
+            _titulo(destino, f"{b['numero']}. {b['titulo']}")
+            for sub in b["subclausulas"]:
+                _blocos(destino, sub)
+
+
+# ============================================================
+# DOCUMENTO COMPLETO
+# ============================================================
+
+def documento_docx(documento: list[dict]) -> bytes:
+    """
+    DOCX (bytes) do documento (lista de blocos de montar_documento()).
+    """
+    doc = novo_documento()
+    _blocos(doc, documento)
+
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def contrato_docx(contrato: dict) -> bytes:
+    """
+    Contrato completo em DOCX (bytes), a partir do dicionário de
+    gerador.gerar_contrato(). Pronto para st.download_button.
+    """
+    return documento_docx(montar_documento(contrato))
@@ -0,0 +1,155 @@
+"""
+Renderização do contrato em UM documento HTML.
+
+A prévia antes emitia um st.markdown por título/subcláusula (centenas de
+elementos por rerun). Aqui o documento do contrato
+(gerador.documento.montar_documento) vira uma única string HTML, com os
+mesmos estilos da prévia original, e um hash do conteúdo para o app
+saber quando o documento realmente mudou. Os textos são escapados: o
+HTML sai só daqui, nunca do conteúdo das cláusulas.
+"""
+
+import hashlib
+import json
+from html import escape
+
+from gerador.documento import CENTRO, DIREITA, e_negrito, montar_documento, texto_trecho
+
+ESTILO_CAIXA = (
+    "border: 1px solid rgba(120,120,120,0.6); "
+    "padding: 14px 16px; "
+    "border-radius: 6px; "
+    "background: rgba(255,255,255,0.02); "
+    "text-align: justify; "
+    "font-size: {px}px; "
+    "line-height: 1.65;"
+)
+
+
+# ============================================================
+# BLOCOS (mesmo visual dos helpers da prévia)
+# ============================================================
+
+def html_centralizado(texto: str, tamanho_px: int = 18, negrito: bool = True) -> str:
+    if not texto:
+        return ""
+    fw = "700" if negrito else "400"
+    return f"<div style='text-align:center; font-size:{tamanho_px}px; font-weight:{fw}; text-transform:uppercase;'>{texto}</div>"
+
+
+def html_justificado(texto: str, tamanho_px: int = 15) -> str:
+    if not texto:
+        return ""
+    return f"<div style='text-align:justify; font-size:{tamanho_px}px; line-height:1.6;'>{texto}</div>"
+
+
+def html_caixa(texto: str, tamanho_px: int = 15) -> str:
+    if not texto:
+        return ""
+    return f'<div style="{ESTILO_CAIXA.format(px=tamanho_px)}">{texto}</div>'
+
+
+def html_titulo(texto: str) -> str:
+    return f"<h3>{texto}</h3>"
+
+
+# ============================================================
+# BLOCOS DO DOCUMENTO (gerador.documento)
+# ============================================================
+
+_ALINHAMENTOS = {DIREITA: "right", CENTRO: "center"}
+ESPACO = "0.9em"
+
+
+def _html_trechos(trechos) -> str:
+    partes = []
+    for t in trechos:
+        texto = escape(texto_trecho(t)).replace("\n", "<br>")
+        partes.append(f"<b>{texto}</b>" if e_negrito(t) else texto)
+    return "".join(partes)
+
+
+def _html_bloco(b: dict, tamanho_px: int, primeiro: bool) -> str:
+    margem = "0" if primeiro else ESPACO
+    tipo = b["tipo"]
+
+    if tipo == "paragrafo":
+        alinhamento = _ALINHAMENTOS.get(b.get("alinhamento"), "justify")
+        return f"<div style='text-align:{alinhamento}; margin-top:{margem};'>{_html_trechos(b['trechos'])}</div>"
+
+    if tipo == "titulo":
+        if b.get("nivel", 2) == 1:
+            return f"<div style='margin-top:{ESPACO};'>{html_centralizado(escape(b['texto']), tamanho_px=18)}</div>"
+        return html_titulo(escape(b["texto"]))
+
+    if tipo == "caixa":
+        return html_caixa(html_blocos(b["blocos"], tamanho_px), tamanho_px)
+
+    if tipo == "clausula":
+        partes = [html_titulo(escape(f"{b['numero']}. {b['titulo']}"))]
+        for i, sub in enumerate(b["subclausulas"]):
+            partes.append(html_blocos(sub, tamanho_px, primeiro=i == 0))
+        return "\n".join(partes)
+
+    if tipo == "assinatura":
+        linhas = [f"<b>{escape(b['nome'])}</b>"] if b.get("nome") else []
+        linhas += [escape(l) for l in b.get("linhas", [])]
+        return (
+            "<div style='margin-top:2.5em;'>"
+            "<div style='border-bottom:1px solid #000; width:60%;'></div>"
+            + "<br>".join(linhas)
+            + "</div>"
+        )
+
+    return ""
+
+
+def html_blocos(blocos: list[dict], tamanho_px: int = 15, primeiro: bool = True) -> str:
+    """
+    HTML de uma lista de blocos; o primeiro não leva margem superior
+    (as caixas já têm padding).
+    """
+    return "\n".join(
+        _html_bloco(b, tamanho_px, primeiro and i == 0) for i, b in enumerate(blocos)
+    )
+
+
+# ============================================================
+# DOCUMENTO COMPLETO
+# ============================================================
+
+def documento_html(documento: list[dict], tamanho_px: int = 15) -> str:
+    """
+    HTML do documento inteiro (lista de blocos de montar_documento()).
+    """
+    corpo = html_blocos(documento, tamanho_px)
+    return f"<div style='font-size:{tamanho_px}px; line-height:1.65;'>\n{corpo}\n</div>"
+
+
+def pagina_html(documento: list[dict], titulo: str = "Contrato", tamanho_px: int = 15) -> str:
+    """
+    Arquivo HTML completo (para baixar ou enviar), com o documento centralizado.
+    """
+    return (
+        "<!DOCTYPE html>\n<html lang='pt-BR'>\n<head>\n<meta charset='utf-8'>\n"
+        f"<title>{escape(titulo)}</title>\n</head>\n"
+        "<body style='max-width:800px; margin:40px auto; padding:0 16px; font-family:Arial, sans-serif;'>\n"
+        f"{documento_html(documento, tamanho_px)}\n</body>\n</html>\n"
+    )
+
+
+def contrato_html(contrato: dict, tamanho_px: int = 15) -> str:
+    """
+    Monta o contrato inteiro (quadro resumo, boxes, cláusulas numeradas e
+    assinaturas) a partir do dicionário de gerador.gerar_contrato().
+    """
+    return documento_html(montar_documento(contrato), tamanho_px)
+
+
+def hash_contrato(contrato: dict) -> str:
+    """
+    Hash estável do contrato gerado: mesmo conteúdo, mesmo hash.
+    O app só remonta o HTML da prévia quando este valor muda.
+    """
+    bruto = json.dumps(contrato, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(bruto.encode("utf-8")).hexdigest()
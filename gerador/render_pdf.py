@@ -0,0 +1,436 @@
+"""
+Renderização do contrato em PDF, em Python puro (sem dependências).
+
+Percorre o mesmo documento da prévia (gerador.documento.montar_documento)
+e escreve o PDF direto: fontes padrão Helvetica / Helvetica-Bold (todo
+leitor de PDF já as tem, nada é embutido) com WinAnsiEncoding (cp1252,
+cobre os acentos do português). Quebra de linha e justificação usam as
+larguras de glifo das métricas AFM das duas fontes. Página A4, margens
+de 2,5 cm, caixas com borda que continuam na página seguinte e número
+da página no rodapé.
+
+A saída é determinística (sem data de criação): o mesmo documento gera
+sempre os mesmos bytes.
+"""
+
+import unicodedata
+import zlib
+
+from gerador.documento import CENTRO, DIREITA, e_negrito, montar_documento, texto_trecho
+
+LARGURA_PAGINA = 595.28   # A4 em pontos
+ALTURA_PAGINA = 841.89
+MARGEM = 70.87            # 2,5 cm
+TAMANHO = 11
+ENTRELINHA = 14.5
+ESPACO_PARAGRAFO = 7
+RECUO_CAIXA = 7
+ESPACO_ASSINATURA = 30
+
+# larguras AFM (1/1000 em) dos caracteres 32..126
+_LARGURAS_ASCII = {
+    False: (
+        "278 278 355 556 556 889 667 191 333 333 389 584 278 333 278 278 "
+        "556 556 556 556 556 556 556 556 556 556 278 278 584 584 584 556 "
+        "1015 667 667 722 722 667 611 778 722 278 500 667 556 833 722 778 "
+        "667 778 722 667 611 722 667 944 667 667 611 278 278 278 469 556 "
+        "333 556 556 500 556 556 278 556 556 222 222 500 222 833 556 556 "
+        "556 556 333 500 278 556 500 722 500 500 500 334 260 334 584"
+    ),
+    True: (
+        "278 333 474 556 556 889 722 238 333 333 389 584 278 333 278 278 "
+        "556 556 556 556 556 556 556 556 556 556 333 333 584 584 584 611 "
+        "975 722 722 722 722 667 611 778 722 278 556 722 611 833 722 778 "
+        "667 778 722 667 611 722 667 944 667 667 611 333 278 333 584 556 "
+        "333 556 611 556 611 556 333 611 611 278 278 556 278 889 611 611 "
+        "611 611 389 556 333 611 556 778 556 556 500 389 280 389 584"
+    ),
+}
+_LARGURAS_EXTRAS = {
+    False: {"º": 365, "ª": 370, "°": 400, "§": 556, "–": 556, "—": 1000, "“": 333, "”": 333, "‘": 222, "’": 222, "•": 350},
+    True: {"º": 365, "ª": 370, "°": 400, "§": 556, "–": 556, "—": 1000, "“": 500, "”": 500, "‘": 278, "’": 278, "•": 350},
+}
+LARGURA_PADRAO = 556
+
+# caracteres fora do cp1252 que têm equivalente legível
+_TRANSLITERACAO = {
+    "≤": "<=", "≥": ">=", "≠": "<>", "→": "->", "←": "<-", "−": "-",
+    "ł": "l", "Ł": "L", "đ": "d", "Đ": "D", "ı": "i",
+}
+# símbolos/emoji, seletores de variação e afins: sem glifo na Helvetica, somem
+_CATEGORIAS_DESCARTADAS = {"So", "Sk", "Cf", "Cc", "Co", "Cs", "Cn", "Mn", "Me"}
+
+
+def _largura_base(tabela: dict, c: str) -> int:
+    # letra acentuada tem a largura da letra base (á = a, Ç = C)
+    return tabela.get(c, tabela.get(unicodedata.normalize("NFKD", c)[:1], LARGURA_PADRAO))
+
+
+def _montar_larguras(negrito: bool) -> dict:
+    tabela = {
+        **{chr(32 + i): int(w) for i, w in enumerate(_LARGURAS_ASCII[negrito].split())},
+        "\u00a0": 278,
+        **_LARGURAS_EXTRAS[negrito],
+    }
+    # demais caracteres do cp1252 (acentuados etc.) calculados uma vez aqui
+    for b in range(0x80, 0x100):
+        c = bytes([b]).decode("cp1252", errors="ignore")
+        if c and c not in tabela:
+            tabela[c] = _largura_base(tabela, c)
+    return tabela
+
+
+# somente leitura depois de montadas
+LARGURAS = {negrito: _montar_larguras(negrito) for negrito in (False, True)}
+
+_FONTES = {False: "F1", True: "F2"}
+
+
+def _largura_caractere(c: str, negrito: bool) -> int:
+    tabela = LARGURAS[negrito]
+    w = tabela.get(c)
+    return w if w is not None else _largura_base(tabela, c)
+
+
+def _caractere_winansi(c: str) -> str:
+    try:
+        c.encode("cp1252")
+        return c
+    except UnicodeEncodeError:
+        pass
+    if c in _TRANSLITERACAO:
+        return _TRANSLITERACAO[c]
+    if unicodedata.category(c) in _CATEGORIAS_DESCARTADAS:
+        return ""
+    # letra de outro alfabeto latino (ő, ł...): sem o acento, se sobrar algo
+    base = "".join(b for b in unicodedata.normalize("NFKD", c) if not unicodedata.combining(b))
+    try:
+        base.encode("cp1252")
+        return base
+    except UnicodeEncodeError:
+        return ""
+
+
+def para_winansi(texto: str) -> str:
+    """
+    Texto só com caracteres que a Helvetica/WinAnsi desenha: emoji e
+    símbolos sem glifo (ex.: o ⚠️ de "Escrever no contrato") são
+    removidos, alguns sinais viram equivalentes ASCII e letras de outros
+    alfabetos latinos perdem o acento. Nada vira "?".
+    """
+    try:
+        texto.encode("cp1252")
+        return texto
+    except UnicodeEncodeError:
+        return "".join(_caractere_winansi(c) for c in texto)
+
+
+def largura_texto(texto: str, negrito: bool = False, tamanho: float = TAMANHO) -> float:
+    return sum(_largura_caractere(c, negrito) for c in texto) * tamanho / 1000
+
+
+def _pdf_texto(texto: str) -> str:
+    """
+    Literal de string PDF em cp1252 (guardado como str latin-1, 1:1 com os bytes).
+    """
+    bruto = para_winansi(texto).encode("cp1252").decode("latin-1")
+    return "(" + bruto.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+# ============================================================
+# QUEBRA DE LINHAS
+# ============================================================
+
+def _palavras(trechos) -> list[list[list[tuple[str, bool]]]]:
+    """
+    Trechos -> linhas forçadas ("\\n") -> palavras -> pedaços (texto, negrito).
+    Um pedaço em negrito colado em texto normal ("IMÓVEL:") é uma palavra só.
+    """
+    linhas = [[]]
+    atual = None
+    for t in trechos:
+        negrito = e_negrito(t)
+        for i, linha in enumerate(para_winansi(texto_trecho(t)).split("\n")):
+            if i:
+                linhas.append([])
+                atual = None
+            for j, parte in enumerate(linha.split(" ")):
+                if j:
+                    atual = None
+                if not parte:
+                    continue
+                if atual is None:
+                    atual = []
+                    linhas[-1].append(atual)
+                atual.append((parte, negrito))
+    return linhas
+
+
+def _largura_palavra(palavra, tamanho: float) -> float:
+    return sum(largura_texto(p, n, tamanho) for p, n in palavra)
+
+
+def _partir_palavra(palavra, largura: float, tamanho: float) -> list:
+    """
+    Palavra mais larga que a linha (e-mail, chave PIX, URL...) cortada em
+    pedaços que cabem numa linha cada.
+    """
+    pedacos, atual, usada = [], [], 0.0
+    for texto, negrito in palavra:
+        for c in texto:
+            w = largura_texto(c, negrito, tamanho)
+            if atual and usada + w > largura:
+                pedacos.append(atual)
+                atual, usada = [], 0.0
+            if atual and atual[-1][1] == negrito:
+                atual[-1] = (atual[-1][0] + c, negrito)
+            else:
+                atual.append((c, negrito))
+            usada += w
+    if atual:
+        pedacos.append(atual)
+    return pedacos
+
+
+def quebrar_linhas(trechos, largura: float, tamanho: float = TAMANHO) -> list[tuple[list, bool]]:
+    """
+    [(palavras da linha, última linha do parágrafo?)]. A última linha de
+    cada parágrafo (e antes de "\\n") não é justificada.
+    """
+    espaco = largura_texto(" ", False, tamanho)
+    out = []
+    for palavras in _palavras(trechos):
+        linha, usada = [], 0.0
+        for palavra in palavras:
+            w = _largura_palavra(palavra, tamanho)
+            pedacos = [palavra] if w <= largura else _partir_palavra(palavra, largura, tamanho)
+            for p in pedacos:
+                w = _largura_palavra(p, tamanho)
+                if linha and usada + espaco + w > largura:
+                    out.append((linha, False))
+                    linha, usada = [], 0.0
+                usada += (espaco if linha else 0.0) + w
+                linha.append(p)
+        out.append((linha, True))
+    return out
+
+
+# ============================================================
+# PAGINAÇÃO
+# ============================================================
+
+class _Paginador:
+    """
+    Desenha os blocos de cima para baixo, abrindo página nova quando o
+    espaço acaba. Caixas abertas são fechadas no fim da página e
+    reabertas no topo da seguinte.
+    """
+
+    def __init__(self):
+        self.paginas: list[list[str]] = []
+        self._caixas: list[float] = []   # topo do trecho atual de cada caixa aberta
+        self.x = MARGEM
+        self.largura = LARGURA_PAGINA - 2 * MARGEM
+        self._nova_pagina()
+
+    @property
+    def ops(self) -> list[str]:
+        return self.paginas[-1]
+
+    def _nova_pagina(self):
+        self.paginas.append([])
+        self.y = ALTURA_PAGINA - MARGEM
+        for i in range(len(self._caixas)):
+            self._caixas[i] = self.y
+        if self._caixas:
+            self.y -= RECUO_CAIXA
+
+    def _retangulo(self, topo: float, base: float, nivel: int):
+        recuo = nivel * RECUO_CAIXA * 2
+        x = MARGEM + recuo
+        w = LARGURA_PAGINA - 2 * MARGEM - 2 * recuo
+        self.ops.append(f"0.6 w {x:.2f} {base:.2f} {w:.2f} {topo - base:.2f} re S")
+
+    def reservar(self, altura: float):
+        """
+        Garante `altura` pontos livres na página atual (ou vira a página).
+        """
+        if self.y - altura >= MARGEM:
+            return
+        for nivel, topo in enumerate(self._caixas):
+            self._retangulo(topo, MARGEM - RECUO_CAIXA / 2, nivel)
+        self._nova_pagina()
+
+    def espaco(self, altura: float):
+        # espaço no topo da página não tem efeito
+        if self.y < ALTURA_PAGINA - MARGEM - RECUO_CAIXA:
+            self.y -= altura
+
+    # ---------------- texto ----------------
+
+    def linha(self, palavras, ultima: bool, alinhamento=None, tamanho: float = TAMANHO):
+        self.reservar(ENTRELINHA)
+        self.y -= ENTRELINHA
+        base = self.y + (ENTRELINHA - tamanho) * 0.9
+
+        espaco = largura_texto(" ", False, tamanho)
+        larguras = [_largura_palavra(p, tamanho) for p in palavras]
+        natural = sum(larguras) + espaco * max(0, len(palavras) - 1)
+
+        x = self.x
+        if alinhamento == DIREITA:
+            x += self.largura - natural
+        elif alinhamento == CENTRO:
+            x += (self.largura - natural) / 2
+        elif not ultima and len(palavras) > 1:
+            espaco += (self.largura - natural) / (len(palavras) - 1)
+
+        ops = ["BT"]
+        fonte = None
+        for p, w in zip(palavras, larguras):
+            px = x
+            for texto, negrito in p:
+                if negrito != fonte:
+                    ops.append(f"/{_FONTES[negrito]} {tamanho} Tf")
+                    fonte = negrito
+                ops.append(f"1 0 0 1 {px:.2f} {base:.2f} Tm {_pdf_texto(texto)} Tj")
+                px += largura_texto(texto, negrito, tamanho)
+            x += w + espaco
+        ops.append("ET")
+        self.ops.append("\n".join(ops))
+
+    def paragrafo(self, trechos, alinhamento=None, tamanho: float = TAMANHO, com_proximas: int = 0):
+        """
+        Sem linha órfã: as duas primeiras linhas (mais `com_proximas`
+        linhas do bloco seguinte, para títulos) ficam na mesma página.
+        """
+        linhas = quebrar_linhas(trechos, self.largura, tamanho)
+        self.reservar(ENTRELINHA * (min(2, len(linhas)) + com_proximas))
+        for palavras, ultima in linhas:
+            self.linha(palavras, ultima, alinhamento, tamanho)
+
+    # ---------------- caixas ----------------
+
+    def abrir_caixa(self):
+        self.reservar(ENTRELINHA * 2 + RECUO_CAIXA * 2)
+        self._caixas.append(self.y)
+        self.y -= RECUO_CAIXA
+        self.x += RECUO_CAIXA * 2
+        self.largura -= RECUO_CAIXA * 4
+
+    def fechar_caixa(self):
+        self.y -= RECUO_CAIXA
+        topo = self._caixas.pop()
+        self._retangulo(topo, self.y, len(self._caixas))
+        self.x -= RECUO_CAIXA * 2
+        self.largura += RECUO_CAIXA * 4
+
+    def traco(self, largura: float):
+        self.ops.append(f"0.8 w {self.x:.2f} {self.y:.2f} m {self.x + largura:.2f} {self.y:.2f} l S")
+
+
+# ============================================================
+# BLOCOS DO DOCUMENTO (gerador.documento)
+# ============================================================
+
+def _titulo(pag: _Paginador, texto: str, nivel: int):
+    if nivel == 1:
+        pag.espaco(ESPACO_PARAGRAFO)
+        pag.paragrafo([{"texto": texto.upper(), "negrito": True}], CENTRO, tamanho=13, com_proximas=2)
+    else:
+        pag.espaco(ESPACO_PARAGRAFO * 1.5)
+        pag.paragrafo([{"texto": texto, "negrito": True}], com_proximas=2)
+
+
+def _assinatura(pag: _Paginador, b: dict):
+    linhas = ([{"texto": b["nome"], "negrito": True}] if b.get("nome") else []) + list(b.get("linhas", []))
+    pag.reservar(ESPACO_ASSINATURA + ENTRELINHA * len(linhas) + 2)
+    pag.espaco(ESPACO_ASSINATURA)
+    pag.traco(pag.largura * 0.6)
+    for t in linhas:
+        pag.paragrafo([t])
+
+
+def _blocos(pag: _Paginador, blocos: list[dict]):
+    for i, b in enumerate(blocos):
+        tipo = b["tipo"]
+        if tipo == "paragrafo":
+            if i:
+                pag.espaco(ESPACO_PARAGRAFO)
+            pag.paragrafo(b["trechos"], b.get("alinhamento"))
+        elif tipo == "titulo":
+            _titulo(pag, b["texto"], b.get("nivel", 2))
+        elif tipo == "caixa":
+            pag.espaco(ESPACO_PARAGRAFO)
+            pag.abrir_caixa()
+            _blocos(pag, b["blocos"])
+            pag.fechar_caixa()
+        elif tipo == "assinatura":
+            _assinatura(pag, b)
+        elif tipo == "clausula":
+            _titulo(pag, f"{b['numero']}. {b['titulo']}", 2)
+            for j, sub in enumerate(b["subclausulas"]):
+                if j:
+                    pag.espaco(ESPACO_PARAGRAFO)
+                _blocos(pag, sub)
+
+
+# ============================================================
+# ARQUIVO PDF
+# ============================================================
+
+def _montar_pdf(paginas: list[list[str]]) -> bytes:
+    objetos = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # páginas: preenchido abaixo
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+    ]
+    kids = []
+    total = len(paginas)
+    for n, ops in enumerate(paginas, start=1):
+        rodape = (
+            f"BT /F1 9 Tf 1 0 0 1 {LARGURA_PAGINA / 2 - 10:.2f} {MARGEM / 2:.2f} Tm "
+            f"{_pdf_texto(f'{n}/{total}')} Tj ET"
+        )
+        conteudo = zlib.compress("\n".join(ops + [rodape]).encode("latin-1"))
+        objetos.append(f"<< /Length {len(conteudo)} /Filter /FlateDecode >>".encode("latin-1") + b"\nstream\n" + conteudo + b"\nendstream")
+        objetos.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {LARGURA_PAGINA} {ALTURA_PAGINA}] "
+            f"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents {len(objetos)} 0 R >>"
+        )
+        kids.append(f"{len(objetos)} 0 R")
+    objetos[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {total} >>"
+
+    saida = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    posicoes = []
+    for i, obj in enumerate(objetos, start=1):
+        posicoes.append(len(saida))
+        corpo = obj if isinstance(obj, bytes) else obj.encode("latin-1")
+        saida += f"{i} 0 obj\n".encode("latin-1") + corpo + b"\nendobj\n"
+
+    inicio_xref = len(saida)
+    saida += f"xref\n0 {len(objetos) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    saida += "".join(f"{p:010d} 00000 n \n" for p in posicoes).encode("latin-1")
+    saida += (
+        f"trailer\n<< /Size {len(objetos) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{inicio_xref}\n%%EOF\n"
+    ).encode("latin-1")
+    return bytes(saida)
+
+
+def documento_pdf(documento: list[dict]) -> bytes:
+    """
+    PDF (bytes) do documento (lista de blocos de montar_documento()).
+    """
+    pag = _Paginador()
+    _blocos(pag, documento)
+    return _montar_pdf(pag.paginas)
+
+
+def contrato_pdf(contrato: dict) -> bytes:
+    """
+    Contrato completo em PDF (bytes), a partir do dicionário de
+    gerador.gerar_contrato(). Pronto para st.download_button.
+    """
+    return documento_pdf(montar_documento(contrato))
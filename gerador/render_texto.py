@@ -0,0 +1,69 @@
+"""
+Renderização do contrato em texto puro (.txt), para e-mail, WhatsApp,
+colar em outro sistema ou comparar versões com diff.
+
+Percorre o mesmo documento da prévia (gerador.documento.montar_documento).
+Negrito não existe em texto puro; caixas viram blocos recuados.
+"""
+
+import textwrap
+
+from gerador.documento import CENTRO, DIREITA, montar_documento, texto_trecho
+
+LARGURA = 80
+RECUO_CAIXA = "    "
+LINHA_ASSINATURA = "_" * 45
+
+
+def _linhas_paragrafo(b: dict, largura: int) -> list[str]:
+    texto = "".join(texto_trecho(t) for t in b["trechos"])
+    out = []
+    for linha in texto.split("\n"):
+        quebradas = textwrap.wrap(linha, largura) or [""]
+        if b.get("alinhamento") == DIREITA:
+            quebradas = [q.rjust(largura) for q in quebradas]
+        elif b.get("alinhamento") == CENTRO:
+            quebradas = [q.center(largura).rstrip() for q in quebradas]
+        out.extend(quebradas)
+    return out
+
+
+def _linhas_blocos(blocos: list[dict], largura: int) -> list[str]:
+    """
+    Linhas de texto dos blocos, com uma linha em branco entre eles.
+    """
+    out = []
+    for b in blocos:
+        tipo = b["tipo"]
+        if tipo == "paragrafo":
+            linhas = _linhas_paragrafo(b, largura)
+        elif tipo == "titulo":
+            texto = b["texto"].upper() if b.get("nivel", 2) == 1 else b["texto"]
+            linhas = [texto.center(largura).rstrip()] if b.get("nivel", 2) == 1 else ["", texto]
+        elif tipo == "caixa":
+            largura_caixa = largura - len(RECUO_CAIXA)
+            linhas = [RECUO_CAIXA + l if l else "" for l in _linhas_blocos(b["blocos"], largura_caixa)]
+        elif tipo == "assinatura":
+            linhas = ["", LINHA_ASSINATURA] + ([b["nome"]] if b.get("nome") else []) + list(b.get("linhas", []))
+        elif tipo == "clausula":
+            linhas = ["", f"{b['numero']}. {b['titulo']}"]
+            for sub in b["subclausulas"]:
+                linhas += [""] + _linhas_blocos(sub, largura)
+        else:
+            continue
+
+        if out:
+            out.append("")
+        out.extend(linhas)
+    return out
+
+
+def documento_texto(documento: list[dict], largura: int = LARGURA) -> str:
+    """
+    Texto puro do documento (lista de blocos de montar_documento()).
+    """
+    return "\n".join(_linhas_blocos(documento, largura)) + "\n"
+
+
+def contrato_texto(contrato: dict, largura: int = LARGURA) -> str:
+    return documento_texto(montar_documento(contrato), largura)
@@ -0,0 +1,270 @@
+"""
+Serviço HTTP local de geração de contratos, para outros sistemas (CRM)
+obterem o contrato de um `dados` sem passar pelo assistente do Streamlit.
+
+    POST /contrato.html   corpo: JSON do `dados` (ou {"dados": {...}})
+    POST /contrato.docx   idem para .docx (também .pdf e .txt)
+    GET  /saude           métricas do serviço e da fila (JSON)
+
+Só biblioteca padrão (ThreadingHTTPServer): as threads só recebem e
+respondem; a geração roda numa FilaDocumentos própria (pool de processos
+aquecido na subida, com o documento base do DOCX já carregado). A fila já
+identifica o trabalho pelo conteúdo (dados + formato + data), então o
+mesmo payload — pronto, rodando ou na fila — não é gerado de novo: os
+arquivos prontos (os `--cache` mais recentes) são a cache de respostas.
+
+Respostas trazem ETag (o id do trabalho; If-None-Match devolve 304),
+X-Cache (HIT/MISS) e X-Tempo-ms. Com --token (ou GERADOR_SERVICO_TOKEN),
+exige "Authorization: Bearer <token>".
+
+Uso:
+    python -m gerador.servico --porta 8765 --trabalhadores 4
+"""
+
+import argparse
+import hmac
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from gerador.exportacao import FORMATOS
+from gerador.fila_documentos import TRABALHADORES, FilaCheia, FilaDocumentos, id_trabalho
+
+log = logging.getLogger(__name__)
+
+PORTA = 8765
+CORPO_MAX = 2 * 1024 * 1024
+CACHE_RESPOSTAS = 1000
+FILA_MAX_SERVICO = 256
+AMOSTRAS_TEMPO = 1000
+
+
+class ErroRequisicao(Exception):
+    def __init__(self, status: int, mensagem: str):
+        super().__init__(mensagem)
+        self.status = status
+
+
+# ============================================================
+# MÉTRICAS
+# ============================================================
+
+class MetricasServico:
+    """
+    Contagem por resultado e latência p50/p95 (em ms) de HIT e MISS.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tempos = {"HIT": deque(maxlen=AMOSTRAS_TEMPO), "MISS": deque(maxlen=AMOSTRAS_TEMPO)}
+        self.status = {}
+
+    def registrar(self, status: int, cache: str, segundos: float):
+        with self._lock:
+            self.status[status] = self.status.get(status, 0) + 1
+            if cache in self._tempos:
+                self._tempos[cache].append(segundos * 1000)
+
+    def resumo(self) -> dict:
+        with self._lock:
+            out = {"respostas": {str(k): v for k, v in sorted(self.status.items())}}
+            for cache, amostras in self._tempos.items():
+                lat = sorted(amostras)
+                out[cache.lower()] = {
+                    "n": len(lat),
+                    "p50_ms": round(lat[len(lat) // 2], 2) if lat else None,
+                    "p95_ms": round(lat[min(len(lat) - 1, int(len(lat) * 0.95))], 2) if lat else None,
+                }
+            return out
+
+
+# ============================================================
+# HTTP
+# ============================================================
+
+class ServidorContratos(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, endereco, fila: FilaDocumentos, token: str = "", tempo_max_s: float = None):
+        super().__init__(endereco, _Requisicao)
+        self.fila = fila
+        self.token = token or ""
+        self.tempo_max_s = tempo_max_s if tempo_max_s is not None else fila.tempo_max_s + 5
+        self.metricas = MetricasServico()
+
+
+class _Requisicao(BaseHTTPRequestHandler):
+    server: ServidorContratos
+    protocol_version = "HTTP/1.1"   # keep-alive: o cliente reaproveita a conexão
+    disable_nagle_algorithm = True  # sem isso, cabeçalho e corpo em writes separados esperam ~40ms de ACK
+
+    def log_message(self, formato, *args):
+        log.debug("%s - " + formato, self.address_string(), *args)
+
+    def _responder(self, status: int, corpo: bytes, tipo: str, cabecalhos=None):
+        self.send_response(status)
+        self.send_header("Content-Type", tipo)
+        self.send_header("Content-Length", str(len(corpo)))
+        for k, v in (cabecalhos or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(corpo)
+
+    def _responder_json(self, status: int, obj, cabecalhos=None):
+        corpo = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        self._responder(status, corpo, "application/json; charset=utf-8", cabecalhos)
+
+    def _autorizado(self) -> bool:
+        if not self.server.token:
+            return True
+        enviado = self.headers.get("Authorization", "")
+        return hmac.compare_digest(enviado.encode("utf-8"), f"Bearer {self.server.token}".encode("utf-8"))
+
+    def _ler_dados(self) -> dict:
+        try:
+            tamanho = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            raise ErroRequisicao(400, "Content-Length inválido.")
+        if tamanho <= 0:
+            raise ErroRequisicao(400, "Corpo vazio: envie o JSON do contrato (dados).")
+        if tamanho > CORPO_MAX:
+            raise ErroRequisicao(413, f"Corpo maior que {CORPO_MAX // 1024} KiB.")
+        try:
+            dados = json.loads(self.rfile.read(tamanho))
+        except ValueError as e:
+            raise ErroRequisicao(400, f"JSON inválido: {e}")
+        if isinstance(dados, dict) and set(dados) == {"dados"} and isinstance(dados["dados"], dict):
+            dados = dados["dados"]
+        if not isinstance(dados, dict):
+            raise ErroRequisicao(400, "O corpo deve ser um objeto JSON (dados do contrato).")
+        return dados
+
+    def _formato(self) -> str:
+        caminho = self.path.split("?", 1)[0].rstrip("/")
+        for formato, cfg in FORMATOS.items():
+            if caminho == f"/contrato.{cfg['extensao']}":
+                return formato
+        raise ErroRequisicao(404, f"Use POST /contrato.<{'|'.join(c['extensao'] for c in FORMATOS.values())}>.")
+
+    def _gerar(self, dados: dict, formato: str):
+        """
+        (status, corpo, tipo, cabeçalhos, HIT/MISS).
+        """
+        fila = self.server.fila
+        tid = id_trabalho(dados, formato)
+        etag = f'"{tid}"'
+        cfg = FORMATOS[formato]
+
+        conteudo = fila.resultado(tid)
+        cache = "HIT"
+        if conteudo is None:
+            cache = "MISS"
+            try:
+                fila.submeter(dados, formato)
+            except FilaCheia as e:
+                raise ErroRequisicao(503, str(e))
+            s = fila.esperar(tid, self.server.tempo_max_s)
+            if s is None or s["estado"] in ("fila", "rodando"):
+                raise ErroRequisicao(504, "Tempo esgotado gerando o contrato.")
+            if s["estado"] == "erro":
+                raise ErroRequisicao(500, f"Falha ao gerar o contrato: {s['erro']}")
+            conteudo = fila.resultado(tid)
+            if conteudo is None:
+                raise ErroRequisicao(500, "Arquivo descartado antes da resposta; tente de novo.")
+
+        cabecalhos = {"ETag": etag, "X-Cache": cache, "Cache-Control": "private, max-age=0"}
+        if etag in (self.headers.get("If-None-Match") or ""):
+            return 304, b"", cfg["mime"], cabecalhos, cache
+        numero = re.sub(r"[^\w.-]+", "_", str(dados.get("contrato__numero", "") or ""), flags=re.ASCII).strip("._") or "novo"
+        cabecalhos["Content-Disposition"] = f'inline; filename="contrato_{numero}.{cfg["extensao"]}"'
+        tipo = cfg["mime"] + ("; charset=utf-8" if cfg["mime"].startswith("text/") else "")
+        return 200, conteudo, tipo, cabecalhos, cache
+
+    def do_POST(self):
+        t0 = time.perf_counter()
+        cache = ""
+        try:
+            if not self._autorizado():
+                raise ErroRequisicao(401, "Token inválido.")
+            formato = self._formato()
+            dados = self._ler_dados()
+            status, corpo, tipo, cabecalhos, cache = self._gerar(dados, formato)
+        except ErroRequisicao as e:
+            status = e.status
+            self.close_connection = status in (400, 401, 404, 413)   # corpo pode não ter sido lido
+            self._responder_json(status, {"erro": str(e)}, {"Retry-After": "1"} if status == 503 else None)
+        except Exception as e:
+            status = 500
+            log.exception("Erro no serviço de contratos")
+            self._responder_json(status, {"erro": f"{type(e).__name__}: {e}"})
+        else:
+            cabecalhos["X-Tempo-ms"] = f"{(time.perf_counter() - t0) * 1000:.1f}"
+            self._responder(status, corpo, tipo, cabecalhos)
+        self.server.metricas.registrar(status, cache, time.perf_counter() - t0)
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0].rstrip("/") not in ("/saude", ""):
+            self._responder_json(404, {"erro": "Use GET /saude ou POST /contrato.<formato>."})
+            return
+        if not self._autorizado():
+            self._responder_json(401, {"erro": "Token inválido."})
+            return
+        self._responder_json(200, {
+            "servico": self.server.metricas.resumo(),
+            "fila": self.server.fila.resumo(),
+            "formatos": list(FORMATOS),
+        })
+
+    do_HEAD = do_GET
+
+
+def criar_servidor(host: str = "127.0.0.1", porta: int = PORTA, trabalhadores: int = TRABALHADORES,
+                   cache: int = CACHE_RESPOSTAS, token: str = "", aquecer: bool = True) -> ServidorContratos:
+    """
+    Servidor pronto para serve_forever(); com `aquecer`, os processos de
+    geração já sobem carregados.
+    """
+    fila = FilaDocumentos(trabalhadores=trabalhadores, fila_max=FILA_MAX_SERVICO, resultados_max=cache)
+    if aquecer:
+        fila.aquecer_pool()
+    return ServidorContratos((host, porta), fila, token=token)
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m gerador.servico",
+        description="Serviço HTTP local que devolve o contrato (HTML/DOCX/PDF/TXT) de um JSON de dados.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="endereço (padrão: 127.0.0.1; 0.0.0.0 expõe na rede)")
+    parser.add_argument("--porta", type=int, default=PORTA, help=f"porta (padrão: {PORTA})")
+    parser.add_argument("--trabalhadores", type=int, default=TRABALHADORES, help=f"processos de geração (padrão: {TRABALHADORES})")
+    parser.add_argument("--cache", type=int, default=CACHE_RESPOSTAS, help=f"arquivos prontos guardados (padrão: {CACHE_RESPOSTAS})")
+    parser.add_argument("--token", default=os.environ.get("GERADOR_SERVICO_TOKEN", ""), help="exige Authorization: Bearer <token>")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    servidor = criar_servidor(args.host, args.porta, max(1, args.trabalhadores), args.cache, args.token)
+    print(f"Servindo em http://{args.host}:{servidor.server_address[1]} ({servidor.fila.trabalhadores} processo(s))")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        servidor.fila.encerrar()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Cache de variantes: corpo das cláusulas compartilhado entre contratos.
+
+Quase todo o texto das cláusulas depende só de alguns "flags" do contrato
+(tem financiamento? FGTS? carta de crédito? parcelamento? sinal? imóvel
+alienado? matrícula em área maior? quem paga a comissão? mais de um
+vendedor/comprador?). Esses flags formam a assinatura da variante.
+
+As cláusulas marcadas com "variante": True em CLAUSULAS são avaliadas uma
+única vez por assinatura e guardadas num LRU do processo (compartilhado por
+todas as sessões). Cada contrato só completa o que é próprio dele
+(qualificações, objeto, bens, foro/assinaturas e numeração).
+"""
+
+import threading
+from collections import OrderedDict
+
+from gerador.contexto import get, get_list
+
+TAMANHO_CACHE_VARIANTES = 128
+
+TIPOS_SEM_CONDOMINIO = ("casa", "terreno", "sobrado")
+
+TIPOS_MATRICULA_AREA_MAIOR = {
+    "apartamento (matrícula em área maior)",
+    "sobrado em condomínio (matrícula em área maior)",
+    "casa em condomínio (matrícula em área maior)",
+}
+
+
+def assinatura_variante() -> str:
+    """
+    Assinatura compacta da variante do contrato ativo, ex.: "1100010100:PARTE VENDEDORA".
+
+    Precisa cobrir TUDO o que as cláusulas "variante" leem; ao criar uma
+    cláusula nova com outro critério, inclua o critério aqui.
+    """
+    tipo_imovel = get("imovel__tipo", "").strip().lower()
+
+    flags = (
+        bool(get("preco_financiamento", "").strip()),
+        bool(get("preco_fgts", "").strip()),
+        bool(get("preco_carta_credito", "").strip()),
+        bool(get("preco_parcelamento_total", "").strip()),
+        bool(get("preco_sinal", "").strip()),
+        get("imovel__alienado", "NÃO") == "SIM",
+        "matrícula em área maior" in tipo_imovel,
+        tipo_imovel in TIPOS_SEM_CONDOMINIO,
+        # cláusula 8.1 lê a chave "tipo_imovel" (planilha IMÓVEL!E7)
+        get("tipo_imovel", "").strip().lower() in TIPOS_MATRICULA_AREA_MAIOR,
+        len(get_list("vendedores")) > 1,
+        len(get_list("compradores")) > 1,
+    )
+
+    bits = "".join("1" if f else "0" for f in flags)
+    quem_paga = get("quem_paga_comissao", "").strip()
+    return f"{bits}:{quem_paga}"
+
+
+class CacheVariantes:
+    """
+    LRU limitado e thread-safe: assinatura -> corpo montado das cláusulas.
+    """
+
+    def __init__(self, max_itens: int = TAMANHO_CACHE_VARIANTES):
+        self.max_itens = max_itens
+        self._itens = OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, assinatura: str, montar):
+        with self._lock:
+            if assinatura in self._itens:
+                self._itens.move_to_end(assinatura)
+                self.acertos += 1
+                return self._itens[assinatura]
+            self.falhas += 1
+
+        # monta fora do lock (duas sessões podem montar a mesma variante; o resultado é igual)
+        corpo = montar()
+
+        with self._lock:
+            self._itens[assinatura] = corpo
+            self._itens.move_to_end(assinatura)
+            while len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+        return corpo
+
+    def limpar(self):
+        with self._lock:
+            self._itens.clear()
+
+    def __len__(self):
+        return len(self._itens)
+
+
+# ✅ único por processo (compartilhado por todas as sessões)
+CACHE_VARIANTES = CacheVariantes()
@@ -0,0 +1,121 @@
+"""
+Versões de contrato guardadas como delta (JSON Patch) com snapshots.
+
+Cada versão salva é um snapshot (dados completos) ou um patch RFC 6902
+contra a versão imediatamente anterior. A cada INTERVALO_SNAPSHOT versões
+o banco exige um snapshot, então reconstruir qualquer versão aplica no
+máximo INTERVALO_SNAPSHOT - 1 patches.
+"""
+
+import copy
+import hashlib
+import json
+
+from gerador.clausulas import clausulas_padrao_entrega_chaves
+
+INTERVALO_SNAPSHOT = 20
+
+# chaves que não são do contrato: cache do banco e metadados da versão
+CHAVES_NAO_PERSISTIDAS = {
+    "corretores_cadastrados",
+    "contrato__versao",
+    "contrato__versao_label",
+}
+
+
+# ============================================================
+# CAMPOS PERSISTIDOS
+# ============================================================
+
+def campos_persistidos(dados: dict) -> dict:
+    """
+    Cópia de `dados` só com o que precisa ir para o banco: sem campos
+    derivados/cache e sem o dicionário padrão de entrega de chaves
+    (recriado ao abrir a prévia).
+    """
+    out = {k: v for k, v in dados.items() if k not in CHAVES_NAO_PERSISTIDAS and not k.startswith("_")}
+    if out.get("clausulas_entrega_chaves") == clausulas_padrao_entrega_chaves():
+        del out["clausulas_entrega_chaves"]
+    return copy.deepcopy(out)
+
+
+def hash_conteudo(campos: dict) -> str:
+    """
+    Hash canônico (sha256) dos campos persistidos: chaves ordenadas e sem
+    espaços, então o mesmo conteúdo sempre gera o mesmo hash.
+    """
+    bruto = json.dumps(campos, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(bruto.encode("utf-8")).hexdigest()
+
+
+# ============================================================
+# JSON PATCH (RFC 6902: add / replace / remove)
+# ============================================================
+
+def _escapar(chave: str) -> str:
+    return str(chave).replace("~", "~0").replace("/", "~1")
+
+
+def _desescapar(parte: str) -> str:
+    return parte.replace("~1", "/").replace("~0", "~")
+
+
+def diff(antes: dict, depois: dict, caminho: str = "") -> list[dict]:
+    """
+    Patch que transforma `antes` em `depois`. Dicionários são comparados
+    chave a chave; listas e valores simples são substituídos inteiros.
+    """
+    ops = []
+    for k, v in antes.items():
+        p = f"{caminho}/{_escapar(k)}"
+        if k not in depois:
+            ops.append({"op": "remove", "path": p})
+        elif isinstance(v, dict) and isinstance(depois[k], dict):
+            ops.extend(diff(v, depois[k], p))
+        elif v != depois[k] or type(v) is not type(depois[k]):
+            ops.append({"op": "replace", "path": p, "value": copy.deepcopy(depois[k])})
+    for k, v in depois.items():
+        if k not in antes:
+            ops.append({"op": "add", "path": f"{caminho}/{_escapar(k)}", "value": copy.deepcopy(v)})
+    return ops
+
+
+def aplicar_patch(doc: dict, patch: list[dict]) -> dict:
+    """
+    Aplica o patch sobre uma cópia de `doc` e devolve o resultado.
+    """
+    doc = copy.deepcopy(doc)
+    for op in patch:
+        partes = [_desescapar(p) for p in op["path"].split("/")[1:]]
+        alvo = doc
+        for p in partes[:-1]:
+            alvo = alvo[p]
+        ultima = partes[-1]
+        if op["op"] == "remove":
+            del alvo[ultima]
+        elif op["op"] in ("add", "replace"):
+            alvo[ultima] = copy.deepcopy(op["value"])
+        else:
+            raise ValueError(f"operação de patch não suportada: {op['op']}")
+    return doc
+
+
+# ============================================================
+# RECONSTRUÇÃO
+# ============================================================
+
+def reconstruir(linhas: list[dict]) -> dict:
+    """
+    `linhas`: versões em ordem crescente, começando por um snapshot.
+    Devolve os dados da última linha.
+    """
+    if not linhas or linhas[0].get("formato", "snapshot") != "snapshot":
+        raise ValueError("Reconstrução precisa começar por um snapshot.")
+
+    dados = copy.deepcopy(linhas[0]["dados"] or {})
+    for linha in linhas[1:]:
+        if linha.get("formato", "snapshot") == "snapshot":
+            dados = copy.deepcopy(linha["dados"] or {})
+        else:
+            dados = aplicar_patch(dados, linha.get("patch") or [])
+    return dados
@@ -0,0 +1,89 @@
+-- ============================================================
+-- CONTRATOS: nova versão em UMA chamada (versão alocada no servidor)
+-- ============================================================
+-- Antes: o app fazia SELECT max(versao) e depois INSERT (2 idas ao banco).
+-- Dois corretores salvando o mesmo numero_contrato ao mesmo tempo podiam
+-- gravar a mesma versão. Agora:
+--   1) a unique constraint impede versões repetidas;
+--   2) a função aloca max+1 e insere na mesma transação, serializando
+--      apenas os saves do MESMO contrato (advisory lock por contrato).
+--
+-- A corrida antiga pode já ter gravado versões repetidas, e aí a unique
+-- constraint falharia. Antes dela, os contratos com versão repetida são
+-- renumerados 1..n na ordem em que foram gravados (versao, created_at,
+-- id); os demais contratos não mudam.
+
+lock table public.contratos in share row exclusive mode;
+
+do $$
+declare
+  v_contratos integer;
+begin
+  with repetidos as (
+    select imobiliaria, numero_contrato
+      from public.contratos
+     group by imobiliaria, numero_contrato
+    having count(*) <> count(distinct versao)
+  ),
+  ordem as (
+    select c.id,
+           row_number() over (
+             partition by c.imobiliaria, c.numero_contrato
+             order by c.versao, c.created_at, c.id
+           ) as nova_versao
+      from public.contratos c
+      join repetidos r
+        on r.imobiliaria = c.imobiliaria
+       and r.numero_contrato = c.numero_contrato
+  )
+  update public.contratos c
+     set versao = o.nova_versao,
+         numero_versao_label = 'versao_' || o.nova_versao
+    from ordem o
+   where o.id = c.id
+     and c.versao is distinct from o.nova_versao;
+
+  select count(*) into v_contratos from (
+    select 1
+      from public.contratos
+     group by imobiliaria, numero_contrato
+    having count(*) <> count(distinct versao)
+  ) s;
+  if v_contratos > 0 then
+    raise exception 'contratos: % contrato(s) ainda com versão repetida; corrija antes de aplicar a migração', v_contratos;
+  end if;
+end;
+$$;
+
+alter table public.contratos
+  add constraint contratos_imobiliaria_numero_versao_key
+  unique (imobiliaria, numero_contrato, versao);
+
+create or replace function public.salvar_contrato_nova_versao(
+  p_imobiliaria text,
+  p_numero_contrato text,
+  p_dados jsonb
+) returns table (id text, versao integer, numero_versao_label text)
+language plpgsql
+as $$
+declare
+  v_versao integer;
+begin
+  perform pg_advisory_xact_lock(
+    hashtextextended(p_imobiliaria || '|' || p_numero_contrato, 0)
+  );
+
+  select coalesce(max(c.versao), 0) + 1
+    into v_versao
+    from public.contratos c
+   where c.imobiliaria = p_imobiliaria
+     and c.numero_contrato = p_numero_contrato;
+
+  return query
+  insert into public.contratos as c
+    (imobiliaria, numero_contrato, versao, numero_versao_label, dados, created_at, updated_at)
+  values
+    (p_imobiliaria, p_numero_contrato, v_versao, 'versao_' || v_versao, p_dados, now(), now())
+  returning c.id::text, c.versao, c.numero_versao_label;
+end;
+$$;
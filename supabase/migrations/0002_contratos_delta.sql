@@ -0,0 +1,74 @@
+-- ============================================================
+-- CONTRATOS: versões como delta (JSON Patch) + snapshots periódicos
+-- ============================================================
+-- formato = 'snapshot' -> `dados` tem o contrato inteiro
+-- formato = 'delta'    -> `patch` (RFC 6902) contra a versão anterior
+-- Linhas já existentes continuam válidas como snapshot.
+
+alter table public.contratos
+  add column if not exists formato text not null default 'snapshot',
+  add column if not exists patch jsonb,
+  add column if not exists base_versao integer,
+  alter column dados drop not null;
+
+alter table public.contratos
+  add constraint contratos_formato_check
+  check (
+    (formato = 'snapshot' and dados is not null)
+    or (formato = 'delta' and patch is not null and base_versao = versao - 1)
+  );
+
+drop function if exists public.salvar_contrato_nova_versao(text, text, jsonb);
+
+-- Grava delta só se a base for exatamente a versão anterior e a nova
+-- versão não cair num ponto de snapshot ((versao - 1) % intervalo = 0).
+-- Caso contrário exige `p_dados` (snapshot); sem ele, falha com 40001 e
+-- o app reenvia como snapshot.
+create or replace function public.salvar_contrato_nova_versao(
+  p_imobiliaria text,
+  p_numero_contrato text,
+  p_dados jsonb default null,
+  p_patch jsonb default null,
+  p_base_versao integer default null,
+  p_intervalo_snapshot integer default 20
+) returns table (id text, versao integer, numero_versao_label text, formato text)
+language plpgsql
+as $$
+declare
+  v_versao integer;
+  v_formato text;
+begin
+  perform pg_advisory_xact_lock(
+    hashtextextended(p_imobiliaria || '|' || p_numero_contrato, 0)
+  );
+
+  select coalesce(max(c.versao), 0) + 1
+    into v_versao
+    from public.contratos c
+   where c.imobiliaria = p_imobiliaria
+     and c.numero_contrato = p_numero_contrato;
+
+  if p_patch is not null
+     and p_base_versao = v_versao - 1
+     and (v_versao - 1) % p_intervalo_snapshot <> 0 then
+    v_formato := 'delta';
+  elsif p_dados is not null then
+    v_formato := 'snapshot';
+  else
+    raise exception 'base_desatualizada: versão atual é %', v_versao - 1
+      using errcode = '40001';
+  end if;
+
+  return query
+  insert into public.contratos as c
+    (imobiliaria, numero_contrato, versao, numero_versao_label, formato,
+     dados, patch, base_versao, created_at, updated_at)
+  values
+    (p_imobiliaria, p_numero_contrato, v_versao, 'versao_' || v_versao, v_formato,
+     case when v_formato = 'snapshot' then p_dados end,
+     case when v_formato = 'delta' then p_patch end,
+     case when v_formato = 'delta' then p_base_versao end,
+     now(), now())
+  returning c.id::text, c.versao, c.numero_versao_label, c.formato;
+end;
+$$;
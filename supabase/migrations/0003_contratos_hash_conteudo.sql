@@ -0,0 +1,72 @@
+-- ============================================================
+-- CONTRATOS: hash do conteúdo por versão (save sem mudança = no-op)
+-- ============================================================
+-- hash_conteudo = sha256 do JSON canônico dos campos persistidos
+-- (chaves ordenadas, sem espaços), calculado pelo app.
+-- Se o hash enviado for igual ao da última versão, nada é gravado e a
+-- função devolve a versão existente com inalterado = true.
+
+alter table public.contratos
+  add column if not exists hash_conteudo text;
+
+drop function if exists public.salvar_contrato_nova_versao(text, text, jsonb, jsonb, integer, integer);
+
+create or replace function public.salvar_contrato_nova_versao(
+  p_imobiliaria text,
+  p_numero_contrato text,
+  p_dados jsonb default null,
+  p_patch jsonb default null,
+  p_base_versao integer default null,
+  p_intervalo_snapshot integer default 20,
+  p_hash text default null
+) returns table (id text, versao integer, numero_versao_label text, formato text, inalterado boolean)
+language plpgsql
+as $$
+declare
+  v_ultima public.contratos%rowtype;
+  v_versao integer;
+  v_formato text;
+begin
+  perform pg_advisory_xact_lock(
+    hashtextextended(p_imobiliaria || '|' || p_numero_contrato, 0)
+  );
+
+  select c.* into v_ultima
+    from public.contratos c
+   where c.imobiliaria = p_imobiliaria
+     and c.numero_contrato = p_numero_contrato
+   order by c.versao desc
+   limit 1;
+
+  if p_hash is not null and v_ultima.hash_conteudo = p_hash then
+    return query
+    select v_ultima.id::text, v_ultima.versao, v_ultima.numero_versao_label, v_ultima.formato, true;
+    return;
+  end if;
+
+  v_versao := coalesce(v_ultima.versao, 0) + 1;
+
+  if p_patch is not null
+     and p_base_versao = v_versao - 1
+     and (v_versao - 1) % p_intervalo_snapshot <> 0 then
+    v_formato := 'delta';
+  elsif p_dados is not null then
+    v_formato := 'snapshot';
+  else
+    raise exception 'base_desatualizada: versão atual é %', v_versao - 1
+      using errcode = '40001';
+  end if;
+
+  return query
+  insert into public.contratos as c
+    (imobiliaria, numero_contrato, versao, numero_versao_label, formato,
+     dados, patch, base_versao, hash_conteudo, created_at, updated_at)
+  values
+    (p_imobiliaria, p_numero_contrato, v_versao, 'versao_' || v_versao, v_formato,
+     case when v_formato = 'snapshot' then p_dados end,
+     case when v_formato = 'delta' then p_patch end,
+     case when v_formato = 'delta' then p_base_versao end,
+     p_hash, now(), now())
+  returning c.id::text, c.versao, c.numero_versao_label, c.formato, false;
+end;
+$$;
@@ -0,0 +1,28 @@
+"""
+CacheConsultas: validade, respostas negativas e erros virando "não achei".
+"""
+
+from gerador.cache_consultas import CacheConsultas
+
+
+def test_grava_le_e_expira(tmp_path):
+    agora = [1000.0]
+    cache = CacheConsultas(str(tmp_path / "c.sqlite3"), relogio=lambda: agora[0])
+    cache.gravar("cep", "01001000", {"uf": "SP"}, ttl_s=60)
+    cache.gravar("cep", "99999999", None, ttl_s=60)
+    assert cache.obter("cep", "01001000") == (True, {"uf": "SP"})
+    assert cache.obter("cep", "99999999") == (True, None)
+    agora[0] += 61
+    assert cache.obter("cep", "01001000") == (False, None)
+    assert cache.limpar_expirados() == 2
+    assert cache.estatisticas() == {"acertos": 1, "acertos_negativos": 1, "falhas": 1, "erros": 0}
+
+
+def test_diretorio_impossivel_vira_nao_achei(tmp_path):
+    arquivo = tmp_path / "nao_e_diretorio"
+    arquivo.write_text("x")
+    cache = CacheConsultas(str(arquivo / "sub" / "c.sqlite3"))
+    assert cache.obter("cep", "01001000") == (False, None)
+    cache.gravar("cep", "01001000", {"uf": "SP"}, ttl_s=60)
+    assert cache.limpar_expirados() == 0
+    assert cache.estatisticas()["erros"] == 3
@@ -0,0 +1,82 @@
+"""
+Índice de CEPs offline: compilação, busca binária e reabertura.
+"""
+
+import os
+
+from gerador import cep_offline
+
+
+def _origem(tmp_path, conteudo: str, nome="ceps.csv"):
+    caminho = tmp_path / nome
+    caminho.write_text(conteudo, encoding="utf-8")
+    return str(caminho)
+
+
+def _indice(tmp_path, conteudo: str):
+    destino = str(tmp_path / "ceps.idx")
+    n = cep_offline.compilar_indice(_origem(tmp_path, conteudo), destino)
+    return n, cep_offline.IndiceCep(destino)
+
+
+def test_compila_e_busca_com_cabecalho(tmp_path):
+    n, idx = _indice(tmp_path, (
+        "cep;logradouro;bairro;cidade;uf\n"
+        "01001-000;Praça da Sé;Sé;São Paulo;sp\n"
+        "20040020;Rua da Assembleia;Centro;Rio de Janeiro;RJ\n"
+        "123;linha inválida;;;\n"
+        "01001000;Praça da Sé (lado ímpar);Sé;São Paulo;SP\n"   # repetido: vale a última
+    ))
+    assert n == 2 and len(idx) == 2
+    assert idx.buscar("01001000") == {
+        "cep": "01001-000", "logradouro": "Praça da Sé (lado ímpar)", "bairro": "Sé",
+        "localidade": "São Paulo", "uf": "SP",
+    }
+    assert idx.buscar("20040-020")["localidade"] == "Rio de Janeiro"
+    idx.fechar()
+
+
+def test_busca_fora_da_base_e_cep_invalido(tmp_path):
+    _, idx = _indice(tmp_path, "".join(f"0200{i:04d};Rua {i};B;C;SP\n" for i in range(0, 200, 2)))
+    assert idx.buscar("02000004")["logradouro"] == "Rua 4"
+    assert idx.buscar("02000005") is None          # entre dois CEPs
+    assert idx.buscar("00000001") is None          # antes do primeiro
+    assert idx.buscar("99999999") is None          # depois do último
+    assert idx.buscar("0200") is None
+    idx.fechar()
+
+
+def test_formato_dne_sem_cabecalho(tmp_path):
+    _, idx = _indice(tmp_path, "".join(f"0300{i:04d}@Rua {i}@Bairro@Cidade@MG\n" for i in range(50)))
+    assert idx.buscar("03000049") == {
+        "cep": "03000-049", "logradouro": "Rua 49", "bairro": "Bairro", "localidade": "Cidade", "uf": "MG",
+    }
+    idx.fechar()
+
+
+def test_texto_longo_cortado_em_fronteira_de_caractere(tmp_path):
+    curtas = "".join(f"0400{i:04d};Rua {i};B;C;SP\n" for i in range(100))
+    _, idx = _indice(tmp_path, "cep;logradouro;bairro;cidade;uf\n" + curtas + "09000000;" + "ã" * 40000 + ";Sé;SP;SP\n")
+    r = idx.buscar("09000000")
+    assert r["logradouro"] and set(r["logradouro"]) == {"ã"}
+    assert len(r["logradouro"].encode("utf-8")) <= 0xFFFF
+    idx.fechar()
+
+
+def test_reabre_indice_recompilado_e_fecha_o_anterior(tmp_path, monkeypatch):
+    destino = str(tmp_path / "ceps.idx")
+    monkeypatch.setenv("GERADOR_CEP_INDICE", destino)
+    assert cep_offline.indice_cep_offline() is None
+
+    cep_offline.compilar_indice(_origem(tmp_path, "05000000;Rua A;B;C;SP\n"), destino)
+    antigo = cep_offline.indice_cep_offline()
+    assert antigo is cep_offline.indice_cep_offline()     # aberto uma vez só
+    assert antigo.buscar("05000000")["logradouro"] == "Rua A"
+
+    cep_offline.compilar_indice(_origem(tmp_path, "05000000;Rua B;B;C;SP\n", "novo.csv"), destino)
+    mtime = os.stat(destino).st_mtime + 10
+    os.utime(destino, (mtime, mtime))
+    novo = cep_offline.indice_cep_offline()
+    assert novo is not antigo
+    assert novo.buscar("05000000")["logradouro"] == "Rua B"
+    assert antigo.buscar("05000000") is None              # fechado, não levanta
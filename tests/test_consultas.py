@@ -0,0 +1,41 @@
+"""
+Consultas de CNPJ: pedidos coalescidos e situação na fila.
+"""
+
+from concurrent.futures import Future
+
+from gerador import consultas
+
+CNPJ = "11222333000181"
+
+
+def test_future_concluido_ainda_registrado_nao_deixa_cnpj_na_fila(monkeypatch):
+    monkeypatch.setattr(consultas.CACHE_CONSULTAS, "obter", lambda tipo, chave: (False, None))
+    # a consulta anterior já passou pelo finally (_marcar), mas o callback
+    # do VooUnico ainda não tirou o Future do registro
+    anterior = Future()
+    anterior.set_result({"nome": "ACME"})
+    monkeypatch.setitem(consultas._VOO_CNPJ._em_voo, CNPJ, anterior)
+
+    assert consultas.solicitar_empresa_por_cnpj(CNPJ) is anterior
+    assert consultas.situacao_cnpj(CNPJ) is None
+    assert CNPJ not in consultas._SITUACAO_CNPJ
+
+
+def test_consulta_nova_fica_na_fila_ate_terminar(monkeypatch):
+    monkeypatch.setattr(consultas.CACHE_CONSULTAS, "obter", lambda tipo, chave: (False, None))
+    situacoes = []
+
+    class Executor:
+        def submit(self, func, *args):
+            situacoes.append(consultas.situacao_cnpj(CNPJ)["situacao"])
+            f = Future()
+            f.set_result(None)
+            consultas._marcar(CNPJ)      # o que o finally de _consultar_receitaws faz
+            return f
+
+    monkeypatch.setattr(consultas, "_EXECUTOR_CNPJ", Executor())
+    consultas.solicitar_empresa_por_cnpj(CNPJ).result()
+    assert situacoes == ["fila"]
+    assert consultas.situacao_cnpj(CNPJ) is None
+    assert not consultas._VOO_CNPJ.em_voo(CNPJ)
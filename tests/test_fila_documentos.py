@@ -0,0 +1,36 @@
+"""
+FilaDocumentos: geração no pool de processos e reciclagem do pool.
+"""
+
+import multiprocessing
+import time
+
+from gerador.fila_documentos import FilaDocumentos
+
+
+def _pids_vivos(pids) -> set:
+    return {p.pid for p in multiprocessing.active_children()} & pids
+
+
+def test_reciclar_pool_encerra_os_processos_que_se_registraram():
+    fila = FilaDocumentos(trabalhadores=2)
+    try:
+        fila.aquecer_pool()
+        tid = fila.submeter({"contrato__numero": "R1"}, "txt")
+        assert fila.esperar(tid, timeout=60)["estado"] == "pronto"
+        antigos = {p.pid for p in multiprocessing.active_children()}
+        assert len(antigos) == 2
+
+        with fila._lock:
+            fila._reciclar_pool()
+        limite = time.monotonic() + 10
+        while _pids_vivos(antigos) and time.monotonic() < limite:
+            time.sleep(0.05)
+        assert not _pids_vivos(antigos)
+        assert fila.resumo()["processos_encerrados"] == 2
+
+        # o pool seguinte sobe e gera normalmente
+        tid = fila.submeter({"contrato__numero": "R2"}, "txt")
+        assert fila.esperar(tid, timeout=60)["estado"] == "pronto"
+    finally:
+        fila.encerrar()
@@ -0,0 +1,63 @@
+"""
+IndiceCorretores: buscas por id, nome normalizado, CPF e prefixo.
+"""
+
+from gerador.indice_corretores import IndiceCorretores
+from gerador.mascaras import normalizar_nome
+
+CORRETORES = [
+    {"id": 1, "nome": "João da Silva", "cpf": "123.456.789-09"},
+    {"id": 2, "nome": "Maria Souza", "cpf": "98765432100"},
+    {"id": 3, "nome": "  JOAO   DA SILVA ", "cpf": ""},        # repetido após normalizar
+    {"id": 4, "nome": "Ângela Barros", "cpf": "111.222.333-96"},
+    {"id": 5, "nome": "Joana Prado"},
+    {"id": 6, "nome": "Carlos Silveira"},
+]
+
+
+def test_normalizar_nome():
+    assert normalizar_nome("  JOÃO  da Silva") == "joao da silva"
+    assert normalizar_nome(None) == ""
+
+
+def test_buscas_exatas():
+    idx = IndiceCorretores(CORRETORES)
+    assert len(idx) == 5
+    assert idx.buscar_nome("joao DA silva")["id"] == 1     # primeiro da lista vence
+    assert idx.buscar_nome("angela barros")["id"] == 4
+    assert idx.buscar_id("2")["nome"] == "Maria Souza"
+    assert idx.buscar_id(2)["nome"] == "Maria Souza"
+    assert idx.buscar_cpf("12345678909")["id"] == 1
+    assert idx.buscar_cpf("987.654.321-00")["id"] == 2
+    assert idx.buscar_nome("ninguém") is None
+    assert idx.buscar_cpf("") is None
+
+
+def test_com_prefixo_em_ordem_alfabetica():
+    idx = IndiceCorretores(CORRETORES)
+    assert idx.com_prefixo("jo") == ["Joana Prado", "João da Silva"]
+    assert idx.com_prefixo("JO", limite=1) == ["Joana Prado"]
+    assert idx.com_prefixo("ang") == ["Ângela Barros"]
+    assert idx.com_prefixo("z") == []
+
+
+def test_buscar_prefixo_primeiro_depois_trigramas():
+    idx = IndiceCorretores(CORRETORES)
+    # termo no meio do nome, sem acento e em outra caixa
+    assert idx.buscar("SILVA", limite=5) == ["João da Silva", "Carlos Silveira"]
+    # quem começa com o termo vem antes dos parecidos
+    assert idx.buscar("joa", limite=5)[:2] == ["Joana Prado", "João da Silva"]
+    assert idx.buscar("joa", limite=1) == ["Joana Prado"]
+
+
+def test_buscar_termo_vazio_e_sem_resultado():
+    idx = IndiceCorretores(CORRETORES)
+    assert idx.buscar("", limite=2) == ["Ângela Barros", "Carlos Silveira"]
+    assert idx.buscar("xyzw", limite=5) == []
+    assert IndiceCorretores([]).buscar("joão", limite=5) == []
+
+
+def test_buscar_respeita_similaridade_minima():
+    idx = IndiceCorretores(CORRETORES)
+    assert "Maria Souza" in idx.buscar("souza", limite=5)
+    assert "Maria Souza" not in idx.buscar("souza", limite=5, similaridade_min=1.1)
@@ -0,0 +1,125 @@
+"""
+gerador.lote: leitura das entradas (NDJSON/JSON/CSV, linhas da tabela
+contratos) e geração com relatório.
+"""
+
+import csv
+import json
+import os
+
+import pytest
+
+from gerador import lote, versoes
+
+
+def _escrever(tmp_path, nome: str, conteudo: str):
+    caminho = tmp_path / nome
+    caminho.write_text(conteudo, encoding="utf-8")
+    return str(caminho)
+
+
+def _ndjson(*objetos) -> str:
+    return "".join(json.dumps(o, ensure_ascii=False) + "\n" for o in objetos)
+
+
+def test_ndjson_dados_puros_e_envelopados_sao_contratos_separados(tmp_path):
+    caminho = _escrever(tmp_path, "c.ndjson", _ndjson(
+        {"contrato__numero": "A1"},
+        {"dados": {"contrato__numero": "B1"}},
+        {"dados": {"contrato__numero": "B2"}},
+        {"numero_contrato": "C9", "dados": {"contrato__numero": "C1"}},
+    ) + "\n")
+    entradas = lote.ler_arquivo(caminho)
+    assert [e["numero"] for e in entradas] == ["A1", "B1", "B2", "C9"]
+    assert [e["origem"] for e in entradas] == ["c.ndjson:1", "c.ndjson:2", "c.ndjson:3", "c.ndjson:4"]
+    assert entradas[1]["dados"] == {"contrato__numero": "B1"}
+
+
+def test_linhas_da_tabela_sao_reconstruidas_por_contrato(tmp_path):
+    v1 = {"contrato__numero": "7", "x": 1}
+    v2 = {"contrato__numero": "7", "x": 2, "y": [1]}
+    outro = {"contrato__numero": "8"}
+    caminho = _escrever(tmp_path, "tabela.jsonl", _ndjson(
+        {"imobiliaria": "t", "numero_contrato": "7", "versao": 2, "formato": "delta",
+         "dados": None, "patch": versoes.diff(v1, v2)},
+        {"imobiliaria": "t", "numero_contrato": "8", "versao": 1, "formato": "snapshot", "dados": outro, "patch": None},
+        {"imobiliaria": "t", "numero_contrato": "7", "versao": 1, "formato": "snapshot", "dados": v1, "patch": None},
+    ))
+    entradas = {e["numero"]: e["dados"] for e in lote.ler_arquivo(caminho)}
+    assert entradas == {"7": v2, "8": outro}
+
+
+def test_json_lista_ou_objeto(tmp_path):
+    lista = _escrever(tmp_path, "l.json", json.dumps([{"contrato__numero": "1"}, {"contrato__numero": "2"}]))
+    unico = _escrever(tmp_path, "u.json", json.dumps({"contrato__numero": "3"}))
+    assert [e["numero"] for e in lote.ler_arquivo(lista)] == ["1", "2"]
+    assert [e["origem"] for e in lote.ler_arquivo(unico)] == ["u.json[0]"]
+
+
+def test_csv_colunas_e_celulas_json(tmp_path):
+    caminho = _escrever(tmp_path, "p.csv", (
+        "contrato__numero;vendedores;imovel__tipo\n"
+        'P1;"[{""nome"": ""Ana""}]";casa\n'
+        "P2;[texto solto;apartamento\n"
+    ))
+    a, b = lote.ler_arquivo(caminho)
+    assert a["origem"] == "p.csv:2"
+    assert a["dados"] == {"contrato__numero": "P1", "vendedores": [{"nome": "Ana"}], "imovel__tipo": "casa"}
+    assert b["dados"]["vendedores"] == "[texto solto"
+
+
+def test_csv_com_coluna_dados_vira_um_contrato_por_linha(tmp_path):
+    caminho = tmp_path / "d.csv"
+    with open(caminho, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["dados"])
+        w.writerow([json.dumps({"contrato__numero": "B1"})])
+        w.writerow([json.dumps({"contrato__numero": "B2"})])
+    assert [e["numero"] for e in lote.ler_arquivo(str(caminho))] == ["B1", "B2"]
+
+
+def test_arquivo_nao_suportado_e_linha_invalida(tmp_path):
+    with pytest.raises(ValueError):
+        lote.ler_arquivo(_escrever(tmp_path, "x.txt", "{}"))
+    with pytest.raises(ValueError):
+        lote.ler_arquivo(_escrever(tmp_path, "x.ndjson", "[1, 2]\n"))
+
+
+def test_gerar_lote_grava_arquivos_e_relatorio(tmp_path):
+    entradas = [
+        {"origem": "a", "numero": "N/1", "dados": {"contrato__numero": "N/1"}},
+        {"origem": "b", "numero": "N/1", "dados": {"contrato__numero": "N/1"}},
+        {"origem": "c", "numero": "", "dados": None},     # falha, mas não derruba o lote
+    ]
+    saida = str(tmp_path / "saida")
+    resultados = lote.gerar_lote(entradas, ["html", "txt"], saida, processos=1)
+
+    assert [r["status"] for r in resultados] == ["ok", "ok", "erro"]
+    assert sorted(p.name for p in (tmp_path / "saida").iterdir()) == ["N_1.html", "N_1.txt", "N_1_2.html", "N_1_2.txt"]
+    assert set(resultados[0]["tempos"]) == {"contrato", "html", "txt"}
+
+    relatorio = str(tmp_path / "relatorio.csv")
+    lote.gravar_relatorio(relatorio, entradas, resultados, ["html", "txt"])
+    with open(relatorio, encoding="utf-8") as f:
+        linhas = list(csv.DictReader(f))
+    assert [l["status"] for l in linhas] == ["ok", "ok", "erro"]
+    assert float(linhas[0]["total_ms"]) > 0 and linhas[2]["erro"]
+
+    r = lote.resumo(resultados, parede_s=1.0)
+    assert (r["documentos"], r["ok"], r["falhas"]) == (3, 2, 1)
+
+
+def _gerar_ou_derrubar(indice, nome, dados, formatos, saida):
+    if dados.get("contrato__numero") == "DERRUBA":
+        os._exit(9)   # processo morre como num OOM-kill
+    return lote.gerar_documento(indice, nome, dados, formatos, saida)
+
+
+def test_processo_que_morre_vira_erro_e_o_lote_continua(tmp_path, monkeypatch):
+    monkeypatch.setattr(lote, "gerar_documento", _gerar_ou_derrubar)
+    numeros = ["A", "B", "DERRUBA", "C", "D", "E"]
+    entradas = [{"origem": n, "numero": n, "dados": {"contrato__numero": n}} for n in numeros]
+    resultados = lote.gerar_lote(entradas, ["txt"], str(tmp_path), processos=2)
+
+    assert [r["status"] for r in resultados] == ["ok", "ok", "erro", "ok", "ok", "ok"]
+    assert "encerrado" in resultados[2]["erro"]
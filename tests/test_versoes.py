@@ -0,0 +1,96 @@
+"""
+Formato de armazenamento das versões: patch (diff/aplicar_patch),
+reconstrução e snapshot a cada INTERVALO_SNAPSHOT versões.
+"""
+
+import copy
+
+import pytest
+
+from gerador import persistencia, versoes
+from gerador.backend_memoria import SupabaseMemoria
+
+ANTES = {
+    "contrato__numero": "1981",
+    "imovel": {"endereco": {"rua": "A", "numero": "10"}, "tipo": "casa", "vagas": 1},
+    "vendedores": [{"nome": "Ana"}, {"nome": "Bia"}],
+    "a/b~c": "chave com / e ~",
+    "valor": 100,
+    "removido": {"x": 1},
+}
+
+
+@pytest.mark.parametrize("depois", [
+    # dicionário aninhado: troca, inclusão e remoção de chaves
+    {**ANTES, "imovel": {"endereco": {"rua": "B", "cep": "01001-000"}, "tipo": "casa", "vagas": 1}},
+    # lista alterada (item novo, item editado, ordem)
+    {**ANTES, "vendedores": [{"nome": "Bia"}, {"nome": "Ana", "cpf": "1"}, {"nome": "Caio"}]},
+    # remoção de chaves no topo
+    {k: v for k, v in ANTES.items() if k not in ("removido", "valor")},
+    # troca de tipo (dict -> lista, int -> str) e chaves que precisam de escape
+    {**ANTES, "removido": [1, 2], "valor": "100", "a/b~c": None, "novo~/": {"y": [1]}},
+    # nada muda
+    copy.deepcopy(ANTES),
+])
+def test_aplicar_patch_do_diff_reconstroi_o_depois(depois):
+    patch = versoes.diff(ANTES, depois)
+    assert versoes.aplicar_patch(ANTES, patch) == depois
+    assert ANTES["imovel"]["endereco"] == {"rua": "A", "numero": "10"}   # não altera a entrada
+
+
+def test_diff_sem_mudanca_e_vazio():
+    assert versoes.diff(ANTES, copy.deepcopy(ANTES)) == []
+
+
+def test_reconstruir_aplica_patches_e_recomeca_no_snapshot():
+    v1 = {"a": 1, "b": {"c": 2}}
+    v2 = {"a": 1, "b": {"c": 3}}
+    v3 = {"a": 5}
+    v4 = {"a": 5, "d": [1]}
+    linhas = [
+        {"formato": "snapshot", "dados": v1},
+        {"formato": "delta", "patch": versoes.diff(v1, v2)},
+        {"formato": "snapshot", "dados": v3},
+        {"formato": "delta", "patch": versoes.diff(v3, v4)},
+    ]
+    assert versoes.reconstruir(linhas) == v4
+    assert versoes.reconstruir(linhas[:2]) == v2
+
+
+def test_reconstruir_exige_snapshot_no_inicio():
+    with pytest.raises(ValueError):
+        versoes.reconstruir([{"formato": "delta", "patch": []}])
+
+
+def test_campos_persistidos_tira_cache_e_metadados():
+    dados = {"x": 1, "_cache": 2, "corretores_cadastrados": [1], "contrato__versao": 3, "contrato__versao_label": "v"}
+    assert versoes.campos_persistidos(dados) == {"x": 1}
+
+
+def test_snapshot_a_cada_intervalo_e_todas_as_versoes_reconstroem():
+    sb = SupabaseMemoria()
+    dados = {"contrato__numero": "7", "lista": [], "aninhado": {"n": 0}}
+    esperado = {}
+    base = None
+    total = versoes.INTERVALO_SNAPSHOT * 2 + 3
+    for i in range(total):
+        dados = copy.deepcopy(dados)
+        dados["lista"].append(i)
+        dados["aninhado"]["n"] = i
+        if i % 3 == 0:
+            dados.pop("opcional", None)
+        else:
+            dados["opcional"] = {"i": i}
+        res = persistencia.salvar_contrato_nova_versao(sb, "t", "7", dados, base=base)
+        base = res["base"]
+        esperado[res["versao"]] = versoes.campos_persistidos(dados)
+
+    linhas = sorted(sb._tabelas["contratos"], key=lambda r: r["versao"])
+    assert [r["versao"] for r in linhas] == list(range(1, total + 1))
+    for r in linhas:
+        # versões 1, 1 + INTERVALO, 1 + 2*INTERVALO... são snapshots
+        snapshot = (r["versao"] - 1) % versoes.INTERVALO_SNAPSHOT == 0
+        assert (r["formato"] == "snapshot") == snapshot, r["versao"]
+
+    for v, dados_v in esperado.items():
+        assert persistencia.obter_contrato_versao(sb, "t", "7", v)["dados"] == dados_v
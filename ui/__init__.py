@@ -0,0 +1,7 @@
+"""
+Camada Streamlit do gerador: estado da sessão, navegação, acesso aos
+dados da imobiliária e componentes de formulário.
+
+Os módulos são importados uma vez por processo; o app.py (re-executado
+a cada interação) fica só com as telas.
+"""
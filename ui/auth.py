@@ -0,0 +1,69 @@
+"""
+Login via Streamlit Secrets — usuário/senha por imobiliária.
+
+Secrets (Streamlit Cloud):
+[auth.users]
+monte_siao = "..."
+imobiliaria_x = "..."
+admin = "..."
+"""
+
+import streamlit as st
+
+
+def auth_users() -> dict:
+    """
+    Retorna o dicionário de usuários/senhas definido em st.secrets.
+
+    Formato esperado em Secrets (TOML):
+    [auth]
+    users = { reginaldo="senha", imobiliaria1="senha" }
+    """
+    try:
+        users = st.secrets.get("auth", {}).get("users", {})
+        return dict(users) if users else {}
+    except Exception:
+        return {}
+
+def validar_login(usuario: str, senha: str) -> bool:
+    """
+    Valida usuário e senha contra st.secrets['auth']['users'].
+    """
+    usuario = (usuario or "").strip()
+    senha = (senha or "").strip()
+    users = auth_users()
+    return bool(usuario) and (users.get(usuario) == senha)
+
+def is_logged_in() -> bool:
+    return bool(st.session_state.get("auth_ok", False))
+
+def do_logout():
+    st.session_state["auth_ok"] = False
+    st.session_state["auth_user"] = ""
+    st.rerun()
+
+def render_login():
+    st.title("🔐 Acesso restrito")
+    st.caption("Digite seu usuário e senha para acessar o sistema.")
+
+    users = auth_users()
+    if not users:
+        st.error("⚠️ Nenhum usuário configurado. Configure em Settings → Secrets no Streamlit Cloud.")
+        st.stop()
+
+    col1, col2 = st.columns(2)
+    with col1:
+        user = st.text_input("Usuário", key="login_user")
+    with col2:
+        pwd = st.text_input("Senha", type="password", key="login_pwd")
+
+    if st.button("Entrar", key="btn_login"):
+        user = (user or "").strip()
+        pwd = (pwd or "").strip()
+
+        if user in users and pwd == str(users[user]):
+            st.session_state["auth_ok"] = True
+            st.session_state["auth_user"] = user
+            st.rerun()
+        else:
+            st.error("Usuário ou senha inválidos.")
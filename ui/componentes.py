@@ -0,0 +1,705 @@
+"""
+Componentes de formulário reutilizáveis (endereço, PF, PJ, parte,
+corretores) e helpers de exibição de texto.
+
+Cada componente lê/grava o contrato via ui.estado e sincroniza os
+widgets pelas keys do st.session_state.
+"""
+
+import streamlit as st
+
+from gerador.consultas import (
+    endereco_da_empresa,
+    situacao_cnpj,
+    solicitar_empresa_por_cnpj,
+    solicitar_endereco_por_cep,
+)
+from gerador.mascaras import (
+    format_endereco_completo,
+    mask_cep,
+    mask_cnpj,
+    mask_cpf,
+    mask_percent,
+    so_digitos,
+)
+from gerador.render_html import html_caixa, html_centralizado, html_justificado
+from ui.estado import get, get_list, set_, set_list
+from ui.navegacao import abrir_cadastro_corretor
+from ui.repositorio import buscar_corretor_por_nome, buscar_corretores
+
+# ============================================================
+# CSS DO MENU LATERAL (radio com aparência de botões)
+# ============================================================
+CSS_MENU_LATERAL = """
+<style>
+/* ====== MENU (radio) com aparência de botões ====== */
+section[data-testid="stSidebar"] div[role="radiogroup"] label {
+    background: transparent;
+    border: 1px solid rgba(255,255,255,0.12);
+    border-radius: 10px;
+    padding: 10px 12px;
+    margin-bottom: 8px;
+    width: 100%;
+    display: flex;
+    align-items: center;
+}
+
+section[data-testid="stSidebar"] div[role="radiogroup"] label:hover {
+    border: 1px solid rgba(255,255,255,0.25);
+}
+
+/* esconde o bolinho do radio */
+section[data-testid="stSidebar"] div[role="radiogroup"] label input {
+    display: none;
+}
+
+/* texto */
+section[data-testid="stSidebar"] div[role="radiogroup"] label span {
+    font-weight: 600;
+    width: 100%;
+}
+
+/* ====== ITEM SELECIONADO = LARANJA ====== */
+section[data-testid="stSidebar"] div[role="radiogroup"] label:has(input:checked) {
+    background-color: #f57c00 !important;
+    border: 1px solid rgba(0,0,0,0.12) !important;
+}
+
+section[data-testid="stSidebar"] div[role="radiogroup"] label:has(input:checked) span {
+    color: white !important;
+}
+</style>
+"""
+
+
+# ============================================================
+# FRAGMENTOS (rerun só do bloco editado)
+# ============================================================
+
+def sincronizar_com_app(chave: str, valores: tuple):
+    """
+    Chamar no fim de um fragmento. Se ele rodou sozinho (rerun de
+    fragmento) e `valores` mudaram desde a última execução, dispara um
+    rerun completo para o restante da tela refletir a mudança.
+
+    O app.py incrementa "_app_run" a cada execução completa; o fragmento
+    guarda em qual execução rodou por último.
+    """
+    run = st.session_state.get("_app_run", 0)
+    marca = f"_fragmento__{chave}"
+    anterior = st.session_state.get(marca)
+    st.session_state[marca] = (run, valores)
+    if anterior and anterior[0] == run and anterior[1] != valores:
+        st.rerun(scope="app")
+
+
+# ============================================================
+# CALLBACKS DE MÁSCARA
+# ============================================================
+
+def cpf_callback_key(key: str):
+    st.session_state[key] = mask_cpf(st.session_state.get(key, ""))
+    set_(key, st.session_state[key])
+
+def linha_direita(texto: str):
+    st.markdown(
+        f"<div style='text-align:right; font-size:15px; margin: 18px 0;'>{texto}</div>",
+        unsafe_allow_html=True
+    )
+
+# ============================================================
+# COMPONENTE: ENDEREÇO REUTILIZÁVEL (CEP automático)
+# ============================================================
+CAMPOS_ENDERECO_CEP = {"logradouro": "logradouro", "bairro": "bairro", "cidade": "localidade", "uf": "uf"}
+
+
+def _preencher_endereco(prefix: str, data: dict):
+    for campo, origem in CAMPOS_ENDERECO_CEP.items():
+        st.session_state[f"{prefix}__{campo}"] = data.get(origem, "")
+        set_(f"{prefix}__{campo}", data.get(origem, ""))
+
+
+def endereco_callback(prefix: str):
+    cep_key = f"{prefix}__cep"
+    cep = mask_cep(st.session_state.get(cep_key, ""))
+    st.session_state[cep_key] = cep
+    set_(cep_key, cep)
+
+    # ✅ consulta em segundo plano: o resultado entra no próximo render_endereco
+    consulta = solicitar_endereco_por_cep(cep)
+    if consulta is None:
+        st.session_state.pop(f"_{prefix}__consulta_cep", None)
+        return
+    # guarda o que está nos campos agora: se o usuário editar antes do
+    # resultado chegar, a edição dele prevalece
+    atuais = {c: st.session_state.get(f"{prefix}__{c}", "") for c in CAMPOS_ENDERECO_CEP}
+    st.session_state[f"_{prefix}__consulta_cep"] = (cep, consulta, atuais)
+
+
+def _aplicar_consulta_cep(prefix: str):
+    """
+    Se a consulta do CEP terminou, preenche logradouro/bairro/cidade/UF.
+    Roda antes dos widgets do bloco de endereço.
+    """
+    pendente = st.session_state.get(f"_{prefix}__consulta_cep")
+    if not pendente or not pendente[1].done():
+        return
+    del st.session_state[f"_{prefix}__consulta_cep"]
+
+    cep, consulta, atuais = pendente
+    if so_digitos(st.session_state.get(f"{prefix}__cep", "")) != so_digitos(cep):
+        return  # CEP trocado enquanto a consulta rodava
+    if any(st.session_state.get(f"{prefix}__{c}", "") != v for c, v in atuais.items()):
+        return  # usuário já editou os campos
+
+    data = consulta.result()
+    if data:
+        _preencher_endereco(prefix, data)
+    elif not any(atuais.values()):
+        st.session_state[f"_{prefix}__aviso_cep"] = f"CEP {cep} não encontrado."
+
+
+@st.fragment(run_every=0.5)
+def _acompanhar_consulta(chave: str, mensagem):
+    """
+    Enquanto a consulta guardada em st.session_state[chave] roda, mostra
+    `mensagem` (texto ou função que devolve texto) sem travar o
+    formulário; quando termina, atualiza a tela para aplicar o resultado.
+    """
+    pendente = st.session_state.get(chave)
+    if not pendente:
+        return
+    if pendente[1].done():
+        st.rerun()
+    st.info(mensagem() if callable(mensagem) else mensagem)
+
+
+@st.fragment
+def render_endereco(prefix: str, titulo: str, sincronizar: tuple = ()):
+    """
+    Bloco de endereço como fragmento: digitar aqui re-executa só este bloco.
+    `sincronizar`: chaves de dados usadas fora do bloco (ex.: cidade do
+    imóvel -> cidade do cartório); se mudarem, a tela inteira é atualizada.
+    """
+    st.markdown(f"### 📍 {titulo}")
+
+    # ============================
+    # ✅ Inicialização correta
+    # ============================
+    keys = {
+        "cep": f"{prefix}__cep",
+        "logradouro": f"{prefix}__logradouro",
+        "numero": f"{prefix}__numero",
+        "complemento": f"{prefix}__complemento",
+        "bairro": f"{prefix}__bairro",
+        "cidade": f"{prefix}__cidade",
+        "uf": f"{prefix}__uf",
+        "texto": f"{prefix}__texto",
+    }
+
+    for k in keys.values():
+        if k not in st.session_state:
+            st.session_state[k] = get(k, "")
+
+    _aplicar_consulta_cep(prefix)
+
+    # ============================
+    # ✅ CEP com callback
+    # ============================
+    st.text_input(
+        "CEP",
+        key=keys["cep"],
+        on_change=lambda: endereco_callback(prefix),
+        placeholder="Ex.: 08663-040"
+    )
+    set_(keys["cep"], st.session_state[keys["cep"]])
+
+    aviso = st.session_state.pop(f"_{prefix}__aviso_cep", None)
+    if aviso:
+        st.warning(aviso)
+    if st.session_state.get(f"_{prefix}__consulta_cep"):
+        _acompanhar_consulta(f"_{prefix}__consulta_cep", "🔎 Buscando o CEP... pode continuar preenchendo.")
+
+    # ============================
+    # ✅ Inputs SEM value= (Streamlit usa session_state)
+    # ============================
+    st.text_input("Logradouro", key=keys["logradouro"])
+    st.text_input("Número", key=keys["numero"])
+    st.text_input("Complemento", key=keys["complemento"])
+    st.text_input("Bairro", key=keys["bairro"])
+    st.text_input("Cidade", key=keys["cidade"])
+    st.text_input("UF", key=keys["uf"])
+
+    # ============================
+    # ✅ Salvar em dados
+    # ============================
+    for campo in ["logradouro", "numero", "complemento", "bairro", "cidade", "uf"]:
+        set_(keys[campo], st.session_state[keys[campo]])
+
+    # ============================
+    # ✅ Gerar endereço completo
+    # ============================
+    endereco = format_endereco_completo(
+        st.session_state[keys["logradouro"]],
+        st.session_state[keys["numero"]],
+        st.session_state[keys["complemento"]],
+        st.session_state[keys["bairro"]],
+        st.session_state[keys["cidade"]],
+        st.session_state[keys["uf"]],
+        st.session_state[keys["cep"]],
+    )
+
+    # ✅ salva e mostra
+    st.session_state[keys["texto"]] = endereco
+    set_(keys["texto"], endereco)
+
+    # key própria: com 2+ endereços na tela o ID automático se repetia
+    st.text_area(
+        "Endereço completo (gerado)",
+        key=keys["texto"],
+        height=90,
+        disabled=True
+    )
+
+    sincronizar_com_app(prefix, tuple(get(k, "") for k in sincronizar))
+
+
+# ============================================================
+# COMPONENTE: PF
+# ============================================================
+NACIONALIDADES = [
+    "brasileiro", "brasileira",
+    "portuguesa", "português",
+    "italiana", "italiano",
+    "espanhola", "espanhol",
+    "argentina", "argentino",
+    "americana", "americano",
+    "alemã", "alemão",
+    "francesa", "francês",
+    "japonesa", "japonês",
+    "chinesa", "chinês",
+    "outra (escrever)"
+]
+
+def render_nacionalidade(prefix: str):
+    nat_key = f"{prefix}__nacionalidade"
+    if nat_key not in st.session_state:
+        st.session_state[nat_key] = get(nat_key, "brasileiro")
+
+    escolha = st.selectbox("Nacionalidade", NACIONALIDADES, key=nat_key, index=NACIONALIDADES.index(st.session_state[nat_key]) if st.session_state[nat_key] in NACIONALIDADES else 0)
+
+    if escolha == "outra (escrever)":
+        txt = st.text_input("Escreva a nacionalidade", value=get(f"{prefix}__nacionalidade_outra", ""), key=f"{prefix}__nacionalidade_outra")
+        set_(nat_key, txt)
+        set_(f"{prefix}__nacionalidade_outra", txt)
+        return txt
+    else:
+        set_(nat_key, escolha)
+        return escolha
+
+
+def cpf_callback(prefix: str):
+    k = f"{prefix}__cpf"
+    st.session_state[k] = mask_cpf(st.session_state.get(k, ""))
+    set_(k, st.session_state[k])
+
+
+def render_pf(prefix: str, permitir_conjuge=True, titulo="PESSOA FÍSICA"):
+    st.subheader(titulo)
+
+    nome = st.text_input("Nome completo", value=get(f"{prefix}__nome", ""), key=f"{prefix}__nome")
+    set_(f"{prefix}__nome", nome)
+
+    nacionalidade = render_nacionalidade(prefix)
+    set_(f"{prefix}__nacionalidade", nacionalidade)
+
+    rg = st.text_input("RG nº", value=get(f"{prefix}__rg", ""), key=f"{prefix}__rg")
+    set_(f"{prefix}__rg", rg)
+
+    if f"{prefix}__cpf" not in st.session_state:
+        st.session_state[f"{prefix}__cpf"] = get(f"{prefix}__cpf", "")
+
+    st.text_input("CPF n.º", key=f"{prefix}__cpf", on_change=lambda: cpf_callback(prefix), placeholder="000.000.000-00")
+
+    profissao = st.text_input("Profissão", value=get(f"{prefix}__profissao", ""), key=f"{prefix}__profissao")
+    set_(f"{prefix}__profissao", profissao)
+
+    estado_civil = st.selectbox(
+        "Estado civil",
+        ["solteiro(a)", "casado(a)", "união estável", "divorciado(a)", "viúvo(a)"],
+        index=["solteiro(a)", "casado(a)", "união estável", "divorciado(a)", "viúvo(a)"].index(get(f"{prefix}__estado_civil", "solteiro(a)")),
+        key=f"{prefix}__estado_civil"
+    )
+    set_(f"{prefix}__estado_civil", estado_civil)
+
+    # ✅ Regime de bens (somente se casado(a) ou união estável)
+    regime_key = f"{prefix}__regime_bens"
+    if regime_key not in st.session_state:
+        st.session_state[regime_key] = get(regime_key, "")
+
+    if estado_civil in ("casado(a)", "união estável"):
+        regime = st.selectbox(
+            "Regime de bens",
+            [
+                "comunhão parcial de bens",
+                "comunhão universal de bens",
+                "separação total de bens",
+                "participação final nos aquestos",
+                "outro (escrever)"
+            ],
+            key=regime_key
+        )
+
+        if regime == "outro (escrever)":
+            outro = st.text_input(
+                "Escreva o regime de bens",
+                value=get(f"{prefix}__regime_bens_outro", ""),
+                key=f"{prefix}__regime_bens_outro"
+            )
+            set_(regime_key, outro)
+            set_(f"{prefix}__regime_bens_outro", outro)
+        else:
+            set_(regime_key, regime)
+    else:
+        set_(regime_key, "")
+        set_(f"{prefix}__regime_bens_outro", "")
+
+    render_endereco(f"{prefix}__end", "Endereço")
+
+    if permitir_conjuge and estado_civil in ("casado(a)", "união estável"):
+        st.markdown("### 👥 Cônjuge / Companheiro(a)")
+
+        rotulo = "Nome do cônjuge" if estado_civil == "casado(a)" else "Nome do companheiro(a)"
+
+        nome_c = st.text_input(rotulo, value=get(f"{prefix}__conj_nome", ""), key=f"{prefix}__conj_nome")
+        set_(f"{prefix}__conj_nome", nome_c)
+
+        # ✅ Nacionalidade do cônjuge/companheiro(a)
+        st.markdown("**Nacionalidade**")
+        nat_conj_key = f"{prefix}__conj_nacionalidade"
+        if nat_conj_key not in st.session_state:
+            st.session_state[nat_conj_key] = get(nat_conj_key, "brasileiro")
+
+        nat_conj = st.selectbox(" ", NACIONALIDADES, key=nat_conj_key)
+        if nat_conj == "outra (escrever)":
+            txt = st.text_input(
+                "Escreva a nacionalidade do cônjuge/companheiro(a)",
+                value=get(f"{prefix}__conj_nacionalidade_outra", ""),
+                key=f"{prefix}__conj_nacionalidade_outra"
+            )
+            set_(nat_conj_key, txt)
+            set_(f"{prefix}__conj_nacionalidade_outra", txt)
+        else:
+            set_(nat_conj_key, nat_conj)
+
+        # ✅ Profissão do cônjuge/companheiro(a)
+        prof_c = st.text_input(
+            "Profissão do cônjuge/companheiro(a)",
+            value=get(f"{prefix}__conj_profissao", ""),
+            key=f"{prefix}__conj_profissao"
+        )
+        set_(f"{prefix}__conj_profissao", prof_c)
+
+        # ✅ RG do cônjuge/companheiro(a)
+        rg_c = st.text_input(
+            "RG do cônjuge/companheiro(a)",
+            value=get(f"{prefix}__conj_rg", ""),
+            key=f"{prefix}__conj_rg"
+        )
+        set_(f"{prefix}__conj_rg", rg_c)
+
+        # ✅ CPF do cônjuge/companheiro(a)
+        if f"{prefix}__conj_cpf" not in st.session_state:
+            st.session_state[f"{prefix}__conj_cpf"] = get(f"{prefix}__conj_cpf", "")
+
+        st.text_input(
+            "CPF n.º do cônjuge/companheiro(a)",
+            key=f"{prefix}__conj_cpf",
+            on_change=lambda: cpf_callback_key(f"{prefix}__conj_cpf"),
+            placeholder="000.000.000-00"
+        )
+        set_(f"{prefix}__conj_cpf", st.session_state.get(f"{prefix}__conj_cpf", ""))
+
+    # ============================================================
+    # ✅ VALIDAÇÃO OBRIGATÓRIA DO CÔNJUGE / COMPANHEIRO(A)
+    # ============================================================
+    obrigatorio_conjuge = estado_civil in ("casado(a)", "união estável")
+
+    if obrigatorio_conjuge:
+        if not get(f"{prefix}__conj_nome", "").strip():
+            st.error("⚠️ Para estado civil CASADO(A) ou UNIÃO ESTÁVEL, o preenchimento do cônjuge/companheiro(a) é obrigatório.")
+            set_(f"{prefix}__bloqueio_avancar", True)
+        else:
+            set_(f"{prefix}__bloqueio_avancar", False)
+    else:
+        set_(f"{prefix}__bloqueio_avancar", False)
+
+
+# ============================================================
+# COMPONENTE: PJ (CNPJ primeiro + busca Receita)
+# ============================================================
+def _aplicar_empresa(prefix: str, dados: dict):
+    razao = dados.get("nome", "")
+    set_(f"{prefix}__razao_social", razao)
+    st.session_state[f"{prefix}__razao_social"] = razao
+
+    # ✅ endereço direto da resposta da Receita (sem esperar outra consulta)
+    endereco = endereco_da_empresa(dados)
+    cep = mask_cep(endereco["cep"])
+    set_(f"{prefix}__end__cep", cep)
+    st.session_state[f"{prefix}__end__cep"] = cep
+    _preencher_endereco(f"{prefix}__end", endereco)
+
+    # número e complemento
+    numero = dados.get("numero", "")
+    comp = dados.get("complemento", "")
+    set_(f"{prefix}__end__numero", numero)
+    set_(f"{prefix}__end__complemento", comp)
+    st.session_state[f"{prefix}__end__numero"] = numero
+    st.session_state[f"{prefix}__end__complemento"] = comp
+
+    # ViaCEP em paralelo só para refinar a grafia (acentos); se o usuário
+    # editar antes, não sobrescreve
+    endereco_callback(f"{prefix}__end")
+
+
+def cnpj_callback(prefix: str):
+    k = f"{prefix}__cnpj"
+    st.session_state[k] = mask_cnpj(st.session_state.get(k, ""))
+    set_(k, st.session_state[k])
+
+    # ✅ não espera a ReceitaWS aqui: o resultado é aplicado no próximo render_pj
+    consulta = solicitar_empresa_por_cnpj(st.session_state[k])
+    if consulta is None:
+        st.session_state.pop(f"_{prefix}__consulta_cnpj", None)
+        return
+    st.session_state[f"_{prefix}__consulta_cnpj"] = (st.session_state[k], consulta)
+
+
+def _aplicar_consulta_cnpj(prefix: str):
+    """
+    Se a consulta do CNPJ terminou, preenche razão social e endereço.
+    Roda antes dos widgets do render_pj (senão o Streamlit não aceita
+    mudar o valor deles).
+    """
+    pendente = st.session_state.get(f"_{prefix}__consulta_cnpj")
+    if not pendente or not pendente[1].done():
+        return
+    del st.session_state[f"_{prefix}__consulta_cnpj"]
+
+    dados = pendente[1].result()
+    if dados:
+        _aplicar_empresa(prefix, dados)
+    else:
+        st.session_state[f"_{prefix}__aviso_cnpj"] = f"CNPJ {pendente[0]} não encontrado (ou ReceitaWS indisponível)."
+
+
+def _mensagem_consulta_cnpj(cnpj: str):
+    s = situacao_cnpj(cnpj)
+    if s and s["situacao"] == "fila":
+        return (f"⏳ CNPJ na fila da ReceitaWS ({s['posicao']} na frente, ~{s['espera_s']:.0f}s). "
+                "Pode continuar preenchendo.")
+    return "🔎 Consultando a ReceitaWS..."
+
+
+def render_pj(prefix: str, titulo="PESSOA JURÍDICA"):
+    st.subheader(titulo)
+
+    if f"{prefix}__cnpj" not in st.session_state:
+        st.session_state[f"{prefix}__cnpj"] = get(f"{prefix}__cnpj", "")
+
+    _aplicar_consulta_cnpj(prefix)
+
+    st.text_input("CNPJ nº (preencher primeiro)", key=f"{prefix}__cnpj", on_change=lambda: cnpj_callback(prefix), placeholder="00.000.000/0000-00")
+
+    aviso = st.session_state.pop(f"_{prefix}__aviso_cnpj", None)
+    if aviso:
+        st.warning(aviso)
+    pendente = st.session_state.get(f"_{prefix}__consulta_cnpj")
+    if pendente:
+        _acompanhar_consulta(f"_{prefix}__consulta_cnpj", lambda: _mensagem_consulta_cnpj(pendente[0]))
+
+    razao = st.text_input("Razão social (vinda da Receita)", value=get(f"{prefix}__razao_social", ""), key=f"{prefix}__razao_social", disabled=True)
+    set_(f"{prefix}__razao_social", razao)
+
+    render_endereco(f"{prefix}__end", "Endereço da empresa")
+
+    st.divider()
+    st.markdown("### 👤 Representante legal (quem assina)")
+
+    # Representante: só Nome + CPF
+    rep_nome = st.text_input("Nome do representante", value=get(f"{prefix}__rep_nome", ""), key=f"{prefix}__rep_nome")
+    set_(f"{prefix}__rep_nome", rep_nome)
+
+    if f"{prefix}__rep_cpf" not in st.session_state:
+        st.session_state[f"{prefix}__rep_cpf"] = get(f"{prefix}__rep_cpf", "")
+
+    st.text_input(
+        "CPF do representante",
+        key=f"{prefix}__rep_cpf",
+        on_change=lambda: cpf_callback_key(f"{prefix}__rep_cpf"),
+        placeholder="000.000.000-00"
+)
+
+# ============================================================
+# FORMULÁRIO DE PARTE (PF/PJ)
+# ============================================================
+@st.fragment
+def render_parte(prefix: str, titulo: str):
+    """
+    Card de uma parte como fragmento: editar uma parte não re-executa as
+    outras nem a sidebar. O rodapé depende do bloqueio do cônjuge, então
+    uma mudança nele atualiza a tela inteira.
+    """
+    st.header(titulo)
+
+    tipo_key = f"{prefix}__tipo"
+    if tipo_key not in st.session_state:
+        st.session_state[tipo_key] = get(tipo_key, "Pessoa Física")
+
+    tipo = st.radio("Esta parte é:", ["Pessoa Física", "Pessoa Jurídica"], horizontal=True, key=tipo_key)
+    set_(tipo_key, tipo)
+
+    st.divider()
+
+    if tipo == "Pessoa Física":
+        render_pf(prefix, permitir_conjuge=True)
+    else:
+        render_pj(prefix)
+
+    sincronizar_com_app(prefix, (tipo, get(f"{prefix}__bloqueio_avancar", False)))
+
+
+# ============================================================
+# DINÂMICOS: vendedores / compradores
+# ============================================================
+def ensure_min_one_party(list_key: str, base_prefix: str):
+    lst = get_list(list_key)
+    if len(lst) == 0:
+        lst.append(f"{base_prefix}01")
+        set_list(list_key, lst)
+
+
+def add_party(list_key: str, base_prefix: str):
+    lst = get_list(list_key)
+    nxt = len(lst) + 1
+    lst.append(f"{base_prefix}{nxt:02d}")
+    set_list(list_key, lst)
+
+
+def remove_last_party(list_key: str):
+    lst = get_list(list_key)
+    if len(lst) > 1:
+        lst.pop()
+        set_list(list_key, lst)
+
+
+# ============================================================
+# CORRETORES / CAPTADORES
+# ============================================================
+
+def ensure_agents():
+    # garante pelo menos 1 corretor em cada lista
+    if "corretores_venda" not in st.session_state.dados:
+        set_list("corretores_venda", ["corv01"])
+    if "corretores_captacao" not in st.session_state.dados:
+        set_list("corretores_captacao", ["corc01"])
+
+
+def percent_callback_key(key: str):
+    st.session_state[key] = mask_percent(st.session_state.get(key, ""))
+    set_(key, st.session_state[key])
+
+
+# máximo de nomes enviados ao navegador por seletor de corretor
+LIMITE_OPCOES_CORRETOR = 20
+
+
+def render_agente(prefix: str, titulo: str, pct_default: str):
+
+    # ✅ só os melhores resultados da busca vão para o selectbox
+    #    (antes: a lista inteira de corretores em cada seletor)
+    busca = st.text_input(
+        f"🔎 Buscar — {titulo}",
+        key=f"{prefix}__busca",
+        placeholder="Digite parte do nome",
+    )
+    opcoes = ["(selecionar)"] + buscar_corretores(busca, LIMITE_OPCOES_CORRETOR)
+
+    # mantém a escolha atual visível mesmo fora do resultado da busca
+    atual = st.session_state.get(f"{prefix}__select")
+    if atual and atual not in opcoes:
+        opcoes.insert(1, atual)
+
+    escolha = st.selectbox(
+        titulo,
+        opcoes,
+        key=f"{prefix}__select",
+        index=0
+    )
+
+    if escolha != "(selecionar)":
+        set_(f"{prefix}__nome", escolha)
+        st.session_state[f"{prefix}__nome"] = escolha
+
+        # salva dados completos em session_state (se precisar)
+        corretor = buscar_corretor_por_nome(escolha)
+        if corretor:
+            set_(f"{prefix}__cpf", corretor.get("cpf", ""))
+            set_(f"{prefix}__banco", corretor.get("banco", ""))
+            set_(f"{prefix}__agencia", corretor.get("agencia", ""))
+            set_(f"{prefix}__conta", corretor.get("conta", ""))
+            set_(f"{prefix}__pix", corretor.get("pix", ""))
+
+    # ✅ botão abre tela oculta de cadastro
+    if st.button("➕ Cadastrar novo corretor", key=f"{prefix}__novo"):
+        destino = "venda" if prefix.startswith("corv") else "captacao"
+        abrir_cadastro_corretor(destino, prefix)
+
+    # ✅ % com máscara automática
+    if f"{prefix}__pct" not in st.session_state:
+        st.session_state[f"{prefix}__pct"] = get(f"{prefix}__pct", pct_default)
+
+    st.text_input(
+        "% da comissão",
+        key=f"{prefix}__pct",
+        on_change=lambda: percent_callback_key(f"{prefix}__pct"),
+        placeholder=pct_default
+    )
+    set_(f"{prefix}__pct", st.session_state.get(f"{prefix}__pct", ""))
+
+
+# ============================================================
+# HELPERS DE FORMATAÇÃO (centralizado / justificado)
+# ============================================================
+
+def texto_centralizado(texto: str, tamanho_px: int = 18, negrito: bool = True):
+    """
+    Exibe texto centralizado no Streamlit, em caixa alta.
+    Use para títulos principais do contrato.
+    """
+    if not texto:
+        return
+    st.markdown(html_centralizado(texto, tamanho_px, negrito), unsafe_allow_html=True)
+
+def texto_justificado(texto: str, tamanho_px: int = 15):
+    """
+    Exibe texto justificado (alinhamento total).
+    Use para cláusulas e textos corridos.
+    """
+    if not texto:
+        return
+    st.markdown(html_justificado(texto, tamanho_px), unsafe_allow_html=True)
+
+# ============================================================
+# HELPERS DE FORMATAÇÃO (BOX COM BORDA)
+# ============================================================
+
+def box_texto_justificado(texto: str, tamanho_px: int = 15):
+    """
+    Exibe um bloco com borda externa, fundo leve e texto justificado.
+    Ideal para QUALIFICAÇÕES DAS PARTES no contrato.
+    """
+    if not texto:
+        return
+    st.markdown(html_caixa(texto, tamanho_px), unsafe_allow_html=True)
@@ -0,0 +1,63 @@
+"""
+Estado do contrato na sessão: get / set_ / get_list / set_list.
+
+Todo dado do contrato mora em st.session_state.dados. set_/set_list
+invalidam o cache de cláusulas da sessão pela chave alterada e marcam
+"contrato_dirty" (zerado ao salvar/carregar).
+"""
+
+import streamlit as st
+
+from gerador.clausulas import clausulas_padrao_entrega_chaves
+from gerador.memo import MemoDependencias
+
+
+def _ensure_dados():
+    if "dados" not in st.session_state:
+        st.session_state.dados = {}
+
+def memo_clausulas() -> MemoDependencias:
+    """
+    Cache das cláusulas da sessão, invalidado por chave em set_/set_list.
+    """
+    if "_memo_clausulas" not in st.session_state:
+        st.session_state["_memo_clausulas"] = MemoDependencias()
+    return st.session_state["_memo_clausulas"]
+
+def get(k, default=""):
+    _ensure_dados()
+    return st.session_state.dados.get(k, default)
+
+def set_(k, v):
+    _ensure_dados()
+    if k not in st.session_state.dados or st.session_state.dados[k] != v:
+        memo_clausulas().invalidar(k)
+        st.session_state["contrato_dirty"] = True
+    st.session_state.dados[k] = v
+
+def get_list(k):
+    _ensure_dados()
+    v = st.session_state.dados.get(k, [])
+    if not isinstance(v, list):
+        v = []
+        st.session_state.dados[k] = v
+    return v
+
+def set_list(k, v):
+    _ensure_dados()
+    # listas costumam ser alteradas no lugar (append/pop) -> sempre invalida
+    memo_clausulas().invalidar(k)
+    st.session_state["contrato_dirty"] = True
+    st.session_state.dados[k] = v
+
+
+# ============================================================
+# CLÁUSULAS: ENTREGA DE CHAVES (GERADOR + EDITOR)
+# ============================================================
+
+def ensure_clausulas_entrega_chaves():
+    """
+    Garante que o dicionário de cláusulas de entrega de chaves exista no st.session_state.dados.
+    """
+    if "clausulas_entrega_chaves" not in st.session_state.dados:
+        set_("clausulas_entrega_chaves", clausulas_padrao_entrega_chaves())
@@ -0,0 +1,143 @@
+"""
+Passos do wizard e navegação entre telas (inclusive as ocultas).
+"""
+
+from functools import lru_cache
+
+import streamlit as st
+
+from ui.estado import get, set_
+
+# ============================================================
+# WIZARD STEPS (dinâmico)
+# ============================================================
+WIZARD_STEPS_BASE = [
+    {"id": "localizar_contrato", "title": "Localizar contrato"},
+    {"id": "inicio", "title": "Iniciar novo Contrato"},
+    {"id": "imovel", "title": "Imóvel"},
+    {"id": "vendedores", "title": "Parte Vendedora"},
+    {"id": "compradores", "title": "Parte Compradora"},
+    {"id": "preco_chaves", "title": "Preço e Chaves"},
+    {"id": "parcelamento", "title": "Parcelamento (Detalhado)"},
+    {"id": "permutas_dacao", "title": "Permutas / Dação (Detalhado)"},
+    {"id": "clausulas", "title": "Prévia de Contrato"},
+
+    # ✅ TELAS OCULTAS
+    {"id": "cadastro_corretor", "title": "Cadastro de Corretor", "hidden": True},
+    {"id": "senha_admin", "title": "Senha Admin", "hidden": True},
+    {"id": "admin_corretores", "title": "Admin Corretores", "hidden": True},
+
+    # ✅ NOVA: ADMIN CLÁUSULAS (OCULTO)
+    {"id": "admin_clausulas", "title": "Admin de Cláusulas", "hidden": True},
+]
+
+@lru_cache(maxsize=None)
+def _tabela_navegacao(cadastro_corretor: bool, parcelamento: bool, permutas_dacao: bool) -> tuple:
+    """
+    Lista de passos para uma combinação das 3 flags que mostram/ocultam telas.
+    Só 8 combinações possíveis: cada uma é montada uma única vez por processo.
+    """
+    out = []
+    for s in WIZARD_STEPS_BASE:
+
+        # ✅ OCULTA A TELA CADASTRO CORRETOR NO MENU
+        if s["id"] == "cadastro_corretor" and not cadastro_corretor:
+            continue
+
+        if s["id"] == "parcelamento" and not parcelamento:
+            continue
+
+        if s["id"] == "permutas_dacao" and not permutas_dacao:
+            continue
+
+        out.append(s)
+
+    return tuple(out)
+
+def steps():
+    return _tabela_navegacao(
+        bool(get("cadastro_corretor_ativado", False)),
+        bool(get("parcelamento_ativado", False)),
+        bool(get("permutas_dacao_ativado", False)),
+    )
+
+def step():
+    return steps()[st.session_state.step_index]
+
+def go_next():
+    if st.session_state.step_index < len(steps()) - 1:
+        st.session_state.step_index += 1
+
+def go_prev():
+    if st.session_state.step_index > 0:
+        st.session_state.step_index -= 1
+
+def go_to_step(step_id: str):
+    ids = [s["id"] for s in steps()]
+    if step_id in ids:
+        st.session_state.step_index = ids.index(step_id)
+
+# ============================================================
+# NAVEGAÇÃO PARA TELAS OCULTAS (ADMIN CORRETORES)
+# ============================================================
+
+def abrir_admin_corretores():
+    st.session_state.step_index = steps().index(next(s for s in steps() if s["id"] == "admin_corretores"))
+
+def abrir_admin_corretores_com_senha(step_voltar=None):
+    # guarda de onde veio (para voltar depois)
+    st.session_state.voltar_step_preco_chaves = step_voltar
+    st.session_state.step_index = steps().index(next(s for s in steps() if s["id"] == "senha_admin"))
+
+def abrir_admin_clausulas_com_senha(step_voltar=None):
+    st.session_state.voltar_step_preco_chaves = step_voltar
+    set_("destino_admin", "admin_clausulas")  # ✅ diz que o destino é admin_clausulas
+    go_to_step("senha_admin")
+
+def abrir_admin_clausulas():
+    st.session_state.step_index = steps().index(next(s for s in steps() if s["id"] == "admin_clausulas"))
+
+def voltar_da_admin_para_origem():
+    # volta para a tela anterior (normalmente Preço e Chaves)
+    if st.session_state.voltar_step_preco_chaves is not None:
+        st.session_state.step_index = st.session_state.voltar_step_preco_chaves
+    else:
+        st.session_state.step_index = 0  # volta pro início se não tiver origem
+
+# ============================================================
+# TELA OCULTA: CADASTRO DE CORRETOR
+# ============================================================
+
+def abrir_cadastro_corretor(destino: str, prefix: str):
+    """
+    destino: 'venda' ou 'captacao'
+    prefix: corv01, corc01 etc
+    """
+
+    # ✅ Ativa tela oculta
+    set_("cadastro_corretor_ativado", True)
+
+    # define para onde voltar
+    set_("cadastro_corretor_destino", destino)
+    set_("cadastro_corretor_prefix", prefix)
+
+    # limpa campos
+    set_("novo_corretor_nome", "")
+    set_("novo_corretor_cpf", "")
+    set_("novo_corretor_banco", "")
+    set_("novo_corretor_agencia", "")
+    set_("novo_corretor_conta", "")
+    set_("novo_corretor_pix", "")
+
+    go_to_step("cadastro_corretor")
+
+
+def voltar_para_preco_chaves():
+    # ✅ Desativa tela oculta
+    set_("cadastro_corretor_ativado", False)
+
+    # limpa dados de destino
+    set_("cadastro_corretor_destino", "")
+    set_("cadastro_corretor_prefix", "")
+
+    go_to_step("preco_chaves")
@@ -0,0 +1,341 @@
+"""
+Supabase na sessão: cliente (1x por processo), imobiliária do usuário
+logado e a lista de corretores guardada em st.session_state.dados.
+
+As consultas em si ficam em gerador.persistencia.
+"""
+
+import os
+from typing import Optional
+
+import streamlit as st
+from supabase import Client
+
+from gerador import persistencia, versoes
+from gerador.backend_memoria import SupabaseMemoria
+from gerador.cache_corretores import CACHE_CORRETORES
+from gerador.indice_corretores import IndiceCorretores
+from ui.estado import get, memo_clausulas
+
+# ============================================================
+# SUPABASE (PERSISTÊNCIA) - CORRETORES (UNIFICADO)
+# ============================================================
+
+@st.cache_resource(show_spinner=False)
+def supabase_cliente() -> Optional[Client]:
+    """
+    Cria cliente Supabase usando Secrets (aceita 2 formatos):
+
+    Formato A (recomendado):
+      supabase_url = "..."
+      supabase_service_role_key = "..."
+
+    Formato B (alternativo):
+      [supabase]
+      url = "..."
+      service_role_key = "..."
+
+    Sem Secrets e com GERADOR_BACKEND=memoria no ambiente, usa o backend
+    em memória (gerador.backend_memoria) — para testes e desenvolvimento.
+    """
+    if os.environ.get("GERADOR_BACKEND", "").strip().lower() == "memoria":
+        return SupabaseMemoria()
+
+    try:
+        url = (st.secrets.get("supabase_url") or "").strip()
+        key = (st.secrets.get("supabase_service_role_key") or "").strip()
+
+        if not url or not key:
+            url = (st.secrets.get("supabase", {}).get("url") or "").strip()
+            key = (st.secrets.get("supabase", {}).get("service_role_key") or "").strip()
+
+        return persistencia.criar_cliente(url, key)
+    except Exception:
+        return None
+
+
+def tenant_imobiliaria() -> str:
+    """
+    Isola os dados por imobiliária/usuário logado.
+    """
+    u = (st.session_state.get("auth_user", "") or "").strip()
+    return u if u else "geral"
+
+
+def _cache_key_corretores() -> str:
+    return f"_corretores_versao__{tenant_imobiliaria()}"
+
+
+def carregar_corretores_supabase():
+    """
+    Aponta st.session_state.dados['corretores_cadastrados'] para a lista
+    compartilhada da imobiliária (CACHE_CORRETORES), junto com o índice
+    montado para essa versão. Só consulta o Supabase quando o cache
+    expirou ou foi invalidado por alguma gravação.
+    """
+    sb = supabase_cliente()
+    if sb is None:
+        st.session_state.dados["corretores_cadastrados"] = st.session_state.dados.get("corretores_cadastrados", [])
+        return
+
+    tenant = tenant_imobiliaria()
+
+    try:
+        versao, indice = CACHE_CORRETORES.obter(
+            tenant, lambda: IndiceCorretores(persistencia.listar_corretores(sb, tenant))
+        )
+    except Exception:
+        # Não derruba o app inteiro; mantém lista atual e mostra erro
+        st.session_state.dados["corretores_cadastrados"] = st.session_state.dados.get("corretores_cadastrados", [])
+        st.error("Erro ao consultar corretores no Supabase. Abra 'Manage app' → Logs para ver detalhes.")
+        return
+
+    ck = _cache_key_corretores()
+    if st.session_state.get(ck) != versao or "corretores_cadastrados" not in st.session_state.dados:
+        st.session_state.dados["corretores_cadastrados"] = indice.lista
+        st.session_state["_corretores_indice"] = indice
+        st.session_state[ck] = versao
+
+
+def ensure_corretores_carregados(forcar: bool = False):
+    """
+    Garante que a sessão enxerga a versão atual dos corretores da
+    imobiliária. Se forcar=True, descarta o cache da imobiliária antes.
+    """
+    if forcar:
+        CACHE_CORRETORES.invalidar(tenant_imobiliaria())
+    carregar_corretores_supabase()
+
+
+def indice_corretores() -> IndiceCorretores:
+    """
+    Índice (id / nome / CPF / nomes ordenados) da lista que a sessão
+    enxerga. Com Supabase vem pronto do cache; sem banco, é remontado só
+    quando a lista da sessão é trocada.
+    """
+    ensure_corretores_carregados()
+    base = st.session_state.dados.get("corretores_cadastrados", [])
+    indice = st.session_state.get("_corretores_indice")
+    if indice is None or indice.lista is not base:
+        indice = IndiceCorretores(base)
+        st.session_state["_corretores_indice"] = indice
+    return indice
+
+
+def listar_corretores_nomes():
+    # ✅ lista pré-ordenada do índice (não remonta a cada chamada)
+    return indice_corretores().nomes
+
+
+def buscar_corretores(termo: str, limite: int) -> list[str]:
+    """
+    Nomes para o seletor de corretor: no máximo `limite`, filtrados pelo
+    termo digitado (sem acento/caixa; prefixo e depois trigramas).
+    """
+    return indice_corretores().buscar(termo, limite)
+
+
+def buscar_corretor_por_nome(nome: str):
+    return indice_corretores().buscar_nome(nome)
+
+
+def salvar_corretor_supabase(nome, cpf, banco, agencia, conta, pix, corretor_id=None) -> str:
+    """
+    Insere/atualiza corretor no Supabase e retorna id.
+    """
+    sb = supabase_cliente()
+    if sb is None:
+        return str(corretor_id or "")
+    tenant = tenant_imobiliaria()
+    try:
+        return persistencia.salvar_corretor(sb, tenant, nome, cpf, banco, agencia, conta, pix, corretor_id=corretor_id)
+    finally:
+        CACHE_CORRETORES.invalidar(tenant)
+
+
+def excluir_corretor_supabase(corretor_id: str) -> bool:
+    sb = supabase_cliente()
+    if sb is None:
+        return False
+    tenant = tenant_imobiliaria()
+    try:
+        return persistencia.excluir_corretor(sb, tenant, corretor_id)
+    finally:
+        CACHE_CORRETORES.invalidar(tenant)
+
+
+def pagina_corretores(
+    pagina: int, por_pagina: int, filtro: str = "", campo_filtro: str = "nome", ordem: str = "nome", desc: bool = False
+) -> tuple[list[dict], int]:
+    """
+    Página (começando em 0) da grade do admin, filtrada e ordenada no
+    banco. A última página lida fica na sessão e só é consultada de novo
+    quando os parâmetros ou a versão do cache de corretores mudam.
+    """
+    sb = supabase_cliente()
+    if sb is None:
+        # sem banco: mesma paginação sobre a lista da sessão
+        base = st.session_state.dados.get("corretores_cadastrados", [])
+        termo = (filtro or "").strip().casefold()
+        linhas = [c for c in base if termo in (c.get(campo_filtro) or "").casefold()]
+        linhas.sort(key=lambda c: (c.get(ordem) or "").casefold(), reverse=desc)
+        inicio = pagina * por_pagina
+        return linhas[inicio:inicio + por_pagina], len(linhas)
+
+    tenant = tenant_imobiliaria()
+    chave = (tenant, CACHE_CORRETORES.versao(tenant), pagina, por_pagina, filtro, campo_filtro, ordem, desc)
+    cache = st.session_state.get("_admin_corretores_pagina")
+    if not cache or cache[0] != chave:
+        cache = (chave, persistencia.pagina_corretores(sb, tenant, pagina, por_pagina, filtro, campo_filtro, ordem, desc))
+        st.session_state["_admin_corretores_pagina"] = cache
+    return cache[1]
+
+
+def aplicar_alteracoes_corretores_supabase(gravar: list[dict], excluir: list[str]) -> dict:
+    """
+    Envia as alterações da grade do admin em lote (um upsert + um delete)
+    e invalida o cache de corretores da imobiliária.
+    """
+    sb = supabase_cliente()
+    if sb is None:
+        return {"gravados": 0, "excluidos": 0}
+    tenant = tenant_imobiliaria()
+    try:
+        return persistencia.aplicar_alteracoes_corretores(sb, tenant, gravar, excluir)
+    finally:
+        CACHE_CORRETORES.invalidar(tenant)
+
+
+def importar_corretores_supabase(corretores: list[dict], tamanho_lote: int, progresso=None) -> int:
+    """
+    Grava corretores já validados (importação de planilha) em lotes e
+    invalida o cache da imobiliária uma vez no final.
+    """
+    sb = supabase_cliente()
+    if sb is None:
+        return 0
+    tenant = tenant_imobiliaria()
+    try:
+        return persistencia.gravar_corretores_em_lotes(sb, tenant, corretores, tamanho_lote, progresso)
+    finally:
+        CACHE_CORRETORES.invalidar(tenant)
+
+
+def adicionar_corretor_completo(nome, cpf, banco, agencia, conta, pix):
+    """
+    Cadastra corretor e garante que a lista recarregue para aparecer imediatamente.
+    """
+    nome = (nome or "").strip()
+    if not nome:
+        return ""
+
+    # evita duplicidade por nome (na mesma imobiliária)
+    existente = indice_corretores().buscar_nome(nome)
+    if existente:
+        return existente.get("id", "") or ""
+
+    new_id = salvar_corretor_supabase(nome, cpf, banco, agencia, conta, pix, corretor_id=None)
+
+    # ✅ salvar já invalidou o cache da imobiliária: recarrega para aparecer na lista imediatamente
+    ensure_corretores_carregados()
+
+    return new_id
+
+
+# ============================================================
+# CONTRATOS
+# ============================================================
+
+def _base_da_sessao(numero: str):
+    """
+    Última versão salva/carregada nesta sessão (base para gravar só o delta),
+    se for do mesmo contrato e da mesma imobiliária.
+    """
+    base = st.session_state.get("_contrato_base")
+    if base and base["numero"] == numero and base["tenant"] == tenant_imobiliaria():
+        return base
+    return None
+
+
+def _guardar_base(numero: str, base: dict):
+    st.session_state["_contrato_base"] = {"numero": numero, "tenant": tenant_imobiliaria(), **base}
+
+
+def sb_salvar_contrato_nova_versao():
+    """
+    Salva o contrato (st.session_state.dados) no Supabase em public.contratos
+    como NOVA versão — delta contra a última versão conhecida pela sessão,
+    ou snapshot.
+
+    Sem alteração em relação à ÚLTIMA versão do banco (mesmo hash), a
+    função do banco não grava nada e devolve a versão existente
+    ("inalterado": True). A comparação fica no banco: a versão que a
+    sessão carregou pode não ser mais a última (outro corretor salvou).
+    """
+    sb = supabase_cliente()
+    if sb is None:
+        raise RuntimeError("Supabase não configurado (ver Secrets).")
+
+    numero = (get("contrato__numero", "") or "").strip()
+    if not numero:
+        raise RuntimeError("Número do contrato está vazio. Preencha em 'Início'.")
+
+    res = persistencia.salvar_contrato_nova_versao(
+        sb, tenant_imobiliaria(), numero, st.session_state.dados, base=_base_da_sessao(numero)
+    )
+    _guardar_base(numero, res["base"])
+    st.session_state["contrato_dirty"] = False
+
+    st.session_state.dados["contrato__versao"] = res["versao"]
+    st.session_state.dados["contrato__versao_label"] = res["label"]
+    return res
+
+
+def sb_obter_contrato_versao(imobiliaria: str, numero_contrato: str, versao=None):
+    """
+    Retorna a versão pedida do contrato (None = última), já reconstruída,
+    para a imobiliária logada e número informado.
+    """
+    sb = supabase_cliente()
+    if not sb:
+        return None
+    return persistencia.obter_contrato_versao(sb, imobiliaria, numero_contrato, versao)
+
+
+def sb_obter_contrato_ultima_versao(imobiliaria: str, numero_contrato: str):
+    """
+    Retorna a última versão do contrato (versão mais alta)
+    para a imobiliária logada e número informado.
+    """
+    return sb_obter_contrato_versao(imobiliaria, numero_contrato)
+
+
+def carregar_contrato_no_estado(contrato: dict):
+    """
+    Carrega o JSON salvo no Supabase para o estado do Streamlit.
+    """
+    if not contrato or "dados" not in contrato:
+        raise RuntimeError("Contrato inválido ou sem dados.")
+
+    st.session_state.dados = contrato["dados"]
+    memo_clausulas().limpar()
+
+    # Sincroniza campos para inputs que usam key direta
+    for k, v in contrato["dados"].items():
+        st.session_state[k] = v
+
+    # base do próximo save (se não for a última versão, o banco recusa o
+    # delta e o save é refeito como snapshot)
+    campos = versoes.campos_persistidos(contrato["dados"])
+    _guardar_base(contrato["numero_contrato"], {
+        "versao": contrato["versao"],
+        "label": contrato["numero_versao_label"],
+        "hash": versoes.hash_conteudo(campos),
+        "dados": campos,
+    })
+    st.session_state["contrato_dirty"] = False
+
+    # Metadados do contrato carregado
+    st.session_state.dados["contrato__numero"] = contrato["numero_contrato"]
+    st.session_state.dados["contrato__versao"] = contrato["versao"]
+    st.session_state.dados["contrato__versao_label"] = contrato["numero_versao_label"]
@@ -0,0 +1,98 @@
+"""
+Resumo em texto do contrato preenchido (conferência rápida dos dados).
+"""
+
+from ui.estado import get, get_list
+
+
+# ============================================================
+# RESUMO
+# ============================================================
+def resumo_endereco(prefix: str):
+    return get(f"{prefix}__texto", "")
+
+
+def resumo_parte(prefix: str):
+    tipo = get(f"{prefix}__tipo", "Pessoa Física")
+    out = []
+
+    if tipo == "Pessoa Física":
+        out.append(f"{get(f'{prefix}__nome','')}")
+        out.append(f"Nacionalidade: {get(f'{prefix}__nacionalidade','')}")
+        out.append(f"CPF: {get(f'{prefix}__cpf','')}")
+        if get(f"{prefix}__rg"):
+            out.append(f"RG: {get(f'{prefix}__rg')}")
+        if get(f"{prefix}__profissao"):
+            out.append(f"Profissão: {get(f'{prefix}__profissao')}")
+        out.append(f"Estado civil: {get(f'{prefix}__estado_civil','')}")
+        out.append(f"Endereço: {resumo_endereco(f'{prefix}__end')}")
+
+        if get(f"{prefix}__estado_civil") in ("casado(a)", "união estável"):
+            out.append(f"Cônjuge: {get(f'{prefix}__conj_nome','')} CPF: {get(f'{prefix}__conj_cpf','')}")
+
+    else:
+        out.append(f"{get(f'{prefix}__razao_social','')}")
+        out.append(f"CNPJ: {get(f'{prefix}__cnpj','')}")
+        out.append(f"Endereço: {resumo_endereco(f'{prefix}__end')}")
+        out.append(f"Representante: {get(f'{prefix}__rep_nome','')} CPF: {get(f'{prefix}__rep_cpf','')}")
+
+    return "\n".join([x for x in out if x.strip()])
+
+
+def resumo_completo():
+    linhas = []
+
+    linhas.append("=== CONTRATO ===")
+    linhas.append(f"Nº: {get('contrato__numero','')}")
+    linhas.append(f"Tipo: {get('contrato__tipo','')}")
+    linhas.append(f"E-mail solicitante: {get('contrato__email_solicitante','')}")
+    linhas.append("")
+
+    linhas.append("=== IMÓVEL ===")
+    linhas.append(f"Tipo: {get('imovel__tipo','')}")
+    linhas.append(f"Matrícula: {get('imovel__matricula','')}")
+    linhas.append(f"Cartório: {get('imovel__cartorio','')}")
+    linhas.append(f"Cidade do cartório: {get('imovel__cidade_cartorio','')}")
+    linhas.append(f"Contribuinte: {get('imovel__contribuinte','')}")
+    linhas.append(f"Endereço: {get('imovel__end__texto','')}")
+    if get("imovel__descricao_matricula"):
+        linhas.append("Descrição: " + get("imovel__descricao_matricula"))
+    linhas.append("")
+
+    linhas.append("=== VENDEDORES ===")
+    for i, pfx in enumerate(get_list("vendedores"), start=1):
+        linhas.append(f"\n--- VENDEDOR {i} ---")
+        linhas.append(resumo_parte(pfx))
+
+    linhas.append("\n=== COMPRADORES ===")
+    for i, pfx in enumerate(get_list("compradores"), start=1):
+        linhas.append(f"\n--- COMPRADOR {i} ---")
+        linhas.append(resumo_parte(pfx))
+
+    linhas.append("\n=== PREÇO / CHAVES / COMISSÃO ===")
+    linhas.append(f"Preço total: {get('preco_total','')}")
+    linhas.append(f"Entrega de chaves: {get('entrega_chaves','')}")
+    linhas.append(f"Quem paga comissão: {get('quem_paga_comissao','')}")
+    linhas.append(f"Valor comissão: {get('valor_comissao','')}")
+    linhas.append(f"Momento pgto: {get('momento_pagto','')}")
+    linhas.append("")
+
+    linhas.append("Corretores de venda:")
+    for pfx in get_list("corretores_venda"):
+        linhas.append(f"- {get(pfx+'__nome','')} ({get(pfx+'__pct','')}%)")
+
+    linhas.append("\nCorretores de captação:")
+    for pfx in get_list("corretores_captacao"):
+        linhas.append(f"- {get(pfx+'__nome','')} ({get(pfx+'__pct','')}%)")
+
+    if get("parcelamento_ativado", False):
+        linhas.append("\n=== PARCELAMENTO ===")
+        linhas.append(get("parcelamento_descricao", ""))
+
+    if get("permutas_dacao_ativado", False):
+        linhas.append("\n=== PERMUTAS / DAÇÃO ===")
+        linhas.append(get("dacao_descricao", ""))
+        if get("dacao_imovel", "NÃO") == "SIM":
+            linhas.append(f"Endereço do imóvel da dação: {get('dacao_imovel__end__texto','')}")
+
+    return "\n".join(linhas)
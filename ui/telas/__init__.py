@@ -0,0 +1,30 @@
+"""
+Uma tela do wizard por módulo (ui/telas/<id>.py), cada uma com render().
+
+O módulo só é importado quando a tela é aberta pela primeira vez; a
+partir daí fica em sys.modules e o rerun executa apenas a tela ativa.
+"""
+
+import importlib
+
+# telas com módulo próprio (admin_clausulas ainda não tem conteúdo)
+TELAS = {
+    "localizar_contrato",
+    "inicio",
+    "imovel",
+    "vendedores",
+    "compradores",
+    "preco_chaves",
+    "cadastro_corretor",
+    "parcelamento",
+    "permutas_dacao",
+    "senha_admin",
+    "admin_corretores",
+    "clausulas",
+}
+
+
+def render_tela(step_id: str):
+    if step_id not in TELAS:
+        return
+    importlib.import_module(f"ui.telas.{step_id}").render()
@@ -0,0 +1,225 @@
+"""
+TELA OCULTA: ADMIN CORRETORES (LISTA / EDITAR / EXCLUIR)
+"""
+
+import math
+
+import pandas as pd
+import streamlit as st
+
+from gerador.importacao_corretores import ler_planilha, preparar_importacao
+from gerador.persistencia import CAMPOS_CORRETOR, TAMANHO_LOTE_IMPORTACAO
+from ui.navegacao import go_to_step, voltar_da_admin_para_origem
+from ui.repositorio import (
+    aplicar_alteracoes_corretores_supabase,
+    carregar_corretores_supabase,
+    importar_corretores_supabase,
+    indice_corretores,
+    pagina_corretores,
+)
+
+ROTULOS = {
+    "nome": "Nome",
+    "cpf": "CPF",
+    "banco": "Banco",
+    "agencia": "Agência",
+    "conta": "Conta",
+    "pix": "PIX",
+}
+POR_PAGINA_OPCOES = (25, 50, 100)
+
+
+# ============================================================
+# ALTERAÇÕES DA GRADE
+# ============================================================
+
+def _voltar_para_primeira_pagina():
+    st.session_state["adm_pagina"] = 1
+
+
+def _alteracoes_da_grade(estado: dict, linhas: list[dict]) -> tuple[list[dict], list[str]]:
+    """
+    Converte o estado do st.data_editor (edited_rows / added_rows /
+    deleted_rows, por posição na página) em (gravar, excluir).
+    """
+    excluidas = set(estado.get("deleted_rows", []))
+    gravar = [
+        {**linhas[int(i)], **{c: v for c, v in mudancas.items() if c in CAMPOS_CORRETOR}}
+        for i, mudancas in estado.get("edited_rows", {}).items()
+        if int(i) not in excluidas
+    ]
+    gravar += [{c: (nova.get(c) or "") for c in CAMPOS_CORRETOR} for nova in estado.get("added_rows", [])]
+    excluir = [linhas[i]["id"] for i in excluidas]
+    return gravar, excluir
+
+
+# ============================================================
+# IMPORTAÇÃO (CSV / XLSX)
+# ============================================================
+
+def _registros_do_arquivo(arquivo) -> list[dict]:
+    """
+    Lê a planilha enviada uma vez só (guardada na sessão pelo file_id).
+    """
+    cache = st.session_state.get("_adm_importacao")
+    if not cache or cache[0] != arquivo.file_id:
+        cache = (arquivo.file_id, ler_planilha(arquivo.name, arquivo.getvalue()))
+        st.session_state["_adm_importacao"] = cache
+    return cache[1]
+
+
+def render_importacao(rev: int):
+    with st.expander("📥 Importar corretores de planilha (CSV / XLSX)", expanded=False):
+        st.caption("Colunas reconhecidas: Nome, CPF, Banco, Agência, Conta, PIX (a ordem não importa).")
+
+        arquivo = st.file_uploader("Planilha", type=["csv", "xlsx"], key=f"adm_import_arquivo_{rev}")
+        tamanho_lote = st.number_input(
+            "Corretores por lote", min_value=50, max_value=2000, step=50,
+            value=TAMANHO_LOTE_IMPORTACAO, key="adm_import_lote",
+        )
+        if arquivo is None:
+            return
+
+        try:
+            registros = _registros_do_arquivo(arquivo)
+        except ValueError as e:
+            st.error(str(e))
+            return
+
+        prep = preparar_importacao(registros, indice_corretores())
+        novos, duplicados, invalidos = prep["novos"], prep["duplicados"], prep["invalidos"]
+
+        st.write(f"**{len(novos)}** novo(s) · {len(duplicados)} duplicado(s) · {len(invalidos)} inválido(s)")
+        if duplicados or invalidos:
+            st.dataframe(
+                pd.DataFrame(
+                    [(l, "duplicado", m) for l, m in duplicados] + [(l, "inválido", m) for l, m in invalidos],
+                    columns=["Linha", "Situação", "Motivo"],
+                ).sort_values("Linha"),
+                hide_index=True,
+            )
+
+        if st.button(f"📥 Importar {len(novos)} corretor(es)", key="adm_import_ok", disabled=not novos):
+            barra = st.progress(0.0, text="Importando...")
+
+            def progresso(feitos, total):
+                barra.progress(feitos / total, text=f"Importando... {feitos}/{total}")
+
+            try:
+                gravados = importar_corretores_supabase(novos, int(tamanho_lote), progresso)
+            except Exception:
+                st.error("A importação parou no meio (erro no Supabase). Os lotes anteriores foram gravados; "
+                         "envie a planilha de novo para importar o restante.")
+                carregar_corretores_supabase()
+                return
+
+            carregar_corretores_supabase()
+            st.session_state["adm_grade_rev"] = rev + 1
+            st.toast(f"✅ {gravados} corretor(es) importado(s).")
+            st.rerun()
+
+
+# ============================================================
+# TELA
+# ============================================================
+
+def render():
+
+    if not st.session_state.get("admin_corretores_liberado", False):
+        st.error("⛔ Acesso negado.")
+        if st.button("⬅️ Voltar"):
+            voltar_da_admin_para_origem()
+        st.stop()
+
+    st.subheader("🧑‍💼 Corretores Cadastrados (Admin)")
+
+    # ---------------- filtro / ordenação (no banco) ----------------
+    c1, c2, c3, c4 = st.columns([3, 1.2, 1.2, 1])
+    with c1:
+        filtro = st.text_input("Filtrar", key="adm_filtro", placeholder="Parte do texto",
+                               on_change=_voltar_para_primeira_pagina)
+    with c2:
+        campo = st.selectbox("Campo", CAMPOS_CORRETOR, key="adm_campo", format_func=ROTULOS.get,
+                             on_change=_voltar_para_primeira_pagina)
+    with c3:
+        ordem = st.selectbox("Ordenar por", CAMPOS_CORRETOR, key="adm_ordem", format_func=ROTULOS.get,
+                             on_change=_voltar_para_primeira_pagina)
+    with c4:
+        desc = st.checkbox("Decrescente", key="adm_desc", on_change=_voltar_para_primeira_pagina)
+
+    por_pagina = st.session_state.get("adm_por_pagina", POR_PAGINA_OPCOES[0])
+    pagina = max(1, int(st.session_state.get("adm_pagina", 1)))
+
+    linhas, total = pagina_corretores(pagina - 1, por_pagina, filtro, campo, ordem, desc)
+    total_paginas = max(1, math.ceil(total / por_pagina))
+    if pagina > total_paginas:
+        # filtro/exclusão encolheu o resultado: vai para a última página
+        pagina = total_paginas
+        linhas, total = pagina_corretores(pagina - 1, por_pagina, filtro, campo, ordem, desc)
+    st.session_state["adm_pagina"] = pagina
+
+    if total == 0:
+        st.warning("Nenhum corretor encontrado." if filtro else "Nenhum corretor cadastrado ainda.")
+
+    st.divider()
+
+    # ---------------- grade (só a página atual) ----------------
+    # ✅ antes: um expander com 6 text_input por corretor, todos recriados a cada clique
+    rev = st.session_state.get("adm_grade_rev", 0)
+    chave_grade = f"adm_grade_{rev}_{pagina}_{por_pagina}_{campo}_{ordem}_{int(desc)}_{filtro}"
+
+    st.data_editor(
+        pd.DataFrame(linhas, columns=["id", *CAMPOS_CORRETOR]),
+        key=chave_grade,
+        hide_index=True,
+        num_rows="dynamic",
+        column_config={
+            "id": None,
+            **{c: st.column_config.TextColumn(ROTULOS[c]) for c in CAMPOS_CORRETOR},
+        },
+    )
+
+    p1, p2, p3 = st.columns([1, 1, 2])
+    with p1:
+        st.number_input("Página", min_value=1, max_value=total_paginas, step=1, key="adm_pagina")
+    with p2:
+        st.selectbox("Por página", POR_PAGINA_OPCOES, key="adm_por_pagina", on_change=_voltar_para_primeira_pagina)
+    with p3:
+        st.caption(f"{total} corretor(es) · página {pagina} de {total_paginas}. "
+                   "Alterações não salvas são descartadas ao trocar de página ou filtro.")
+
+    # ---------------- alterações em lote ----------------
+    gravar, excluir = _alteracoes_da_grade(st.session_state.get(chave_grade, {}), linhas)
+    sem_nome = [c for c in gravar if not (c.get("nome") or "").strip()]
+    pendentes = len(gravar) + len(excluir)
+
+    if pendentes:
+        st.info(f"Alterações pendentes: {len(gravar)} para gravar, {len(excluir)} para excluir.")
+    if sem_nome:
+        st.error("Há corretores sem nome na grade. Preencha o nome antes de salvar.")
+
+    colA, colB = st.columns(2)
+
+    with colA:
+        if st.button("💾 Salvar alterações", key="adm_salvar", disabled=not pendentes or bool(sem_nome)):
+            try:
+                r = aplicar_alteracoes_corretores_supabase(gravar, excluir)
+            except Exception:
+                st.error("Não foi possível gravar no Supabase (verifique permissões da tabela corretores).")
+            else:
+                carregar_corretores_supabase()
+                st.session_state["adm_grade_rev"] = rev + 1
+                st.toast(f"✅ {r['gravados']} gravado(s), {r['excluidos']} excluído(s).")
+                st.rerun()
+
+    with colB:
+        if st.button("↩️ Descartar alterações", key="adm_descartar", disabled=not pendentes):
+            st.session_state["adm_grade_rev"] = rev + 1
+            st.rerun()
+
+    st.divider()
+    render_importacao(rev)
+
+    if st.button("⬅️ Voltar", key="btn_admin_voltar"):
+        go_to_step("preco_chaves")
+        st.rerun()
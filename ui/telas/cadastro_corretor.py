@@ -0,0 +1,80 @@
+"""
+TELA EXTRA: CADASTRO DE CORRETOR (oculta)
+"""
+
+import streamlit as st
+
+from ui.componentes import cpf_callback_key
+from ui.estado import get, set_
+from ui.navegacao import voltar_para_preco_chaves
+from ui.repositorio import adicionar_corretor_completo
+
+
+def render():
+    st.subheader("🧑‍💼 Cadastro de Corretor")
+
+    nome = st.text_input("Nome completo", value=get("novo_corretor_nome", ""), key="novo_corretor_nome")
+    set_("novo_corretor_nome", nome)
+
+    if "novo_corretor_cpf" not in st.session_state:
+        st.session_state["novo_corretor_cpf"] = get("novo_corretor_cpf", "")
+
+    st.text_input(
+        "CPF",
+        key="novo_corretor_cpf",
+        on_change=lambda: cpf_callback_key("novo_corretor_cpf"),
+        placeholder="000.000.000-00"
+    )
+    set_("novo_corretor_cpf", st.session_state["novo_corretor_cpf"])
+
+    st.divider()
+    st.markdown("### 💳 Dados bancários")
+
+    banco = st.text_input("Banco", value=get("novo_corretor_banco", ""), key="novo_corretor_banco")
+    agencia = st.text_input("Agência", value=get("novo_corretor_agencia", ""), key="novo_corretor_agencia")
+    conta = st.text_input("Conta", value=get("novo_corretor_conta", ""), key="novo_corretor_conta")
+    pix = st.text_input("Chave PIX", value=get("novo_corretor_pix", ""), key="novo_corretor_pix")
+
+    set_("novo_corretor_banco", banco)
+    set_("novo_corretor_agencia", agencia)
+    set_("novo_corretor_conta", conta)
+    set_("novo_corretor_pix", pix)
+
+    st.divider()
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if st.button("✅ Concluir cadastro"):
+            if nome.strip():
+
+                novo_id = adicionar_corretor_completo(
+                    nome=nome.strip(),
+                    cpf=get("novo_corretor_cpf", ""),
+                    banco=banco.strip(),
+                    agencia=agencia.strip(),
+                    conta=conta.strip(),
+                    pix=pix.strip()
+                )
+
+                # define automaticamente no agente que chamou
+                prefix = get("cadastro_corretor_prefix", "")
+                if prefix:
+                    set_(f"{prefix}__nome", nome)
+                    st.session_state[f"{prefix}__nome"] = nome
+                    st.session_state[f"{prefix}__select"] = nome
+
+                    # salva os dados completos no agente
+                    set_(f"{prefix}__cpf", get("novo_corretor_cpf", ""))
+                    set_(f"{prefix}__banco", banco)
+                    set_(f"{prefix}__agencia", agencia)
+                    set_(f"{prefix}__conta", conta)
+                    set_(f"{prefix}__pix", pix)
+
+                voltar_para_preco_chaves()
+            else:
+                st.error("⚠️ Informe o nome completo do corretor.")
+
+    with col2:
+        if st.button("⬅️ Voltar sem cadastrar"):
+            voltar_para_preco_chaves()
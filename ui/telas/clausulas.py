@@ -0,0 +1,137 @@
+"""
+TELA: CLÁUSULAS (VISUALIZAÇÃO - ENTREGA DE CHAVES)
+"""
+
+import streamlit as st
+
+from gerador import gerar_contrato
+from gerador.documento import montar_documento
+from gerador.exportacao import FORMATOS
+from gerador.fila_documentos import FILA_DOCUMENTOS, FilaCheia, id_trabalho
+from gerador.render_html import documento_html, hash_contrato
+from ui.estado import ensure_clausulas_entrega_chaves, get, memo_clausulas
+
+# formatos oferecidos para download (a prévia já é o HTML)
+FORMATOS_TELA = ("docx", "pdf", "txt")
+
+
+# ============================================================
+# PRÉVIA: DOCUMENTO ÚNICO
+# ============================================================
+
+def previa_html(contrato: dict) -> str:
+    """
+    HTML da prévia guardado na sessão junto com o hash do contrato.
+    Só remonta o documento quando o hash muda; reruns sem alteração
+    reutilizam a mesma string.
+    """
+    h = hash_contrato(contrato)
+    cache = st.session_state.get("_previa_html")
+    if not cache or cache[0] != h:
+        cache = (h, documento_html(montar_documento(contrato), tamanho_px=15))
+        st.session_state["_previa_html"] = cache
+    return cache[1]
+
+
+# ============================================================
+# EXPORTAÇÃO (fila de documentos em processos separados)
+# ============================================================
+
+def _arquivo_pronto(formato: str, tid: str):
+    """
+    Arquivo do trabalho `tid`, guardado na sessão assim que fica pronto
+    (a fila só guarda os mais recentes de todas as sessões).
+    """
+    guardados = st.session_state.setdefault("_exportacoes", {})
+    atual = guardados.get(formato)
+    if atual and atual[0] == tid:
+        return atual[1]
+    conteudo = FILA_DOCUMENTOS.resultado(tid)
+    if conteudo is not None:
+        guardados[formato] = (tid, conteudo)
+    return conteudo
+
+
+def _pedir_arquivo(formato: str):
+    try:
+        FILA_DOCUMENTOS.submeter(st.session_state.dados, formato)
+    except FilaCheia as e:
+        st.session_state["_aviso_exportacao"] = str(e)
+
+
+@st.fragment(run_every=0.5)
+def _acompanhar_exportacao(tids: tuple):
+    """
+    Enquanto algum arquivo está na fila/rodando, mostra o andamento sem
+    travar a tela; quando todos terminam, atualiza para oferecer o download.
+    """
+    situacoes = [FILA_DOCUMENTOS.situacao(t) for t in tids]
+    if not any(s and s["estado"] in ("fila", "rodando") for s in situacoes):
+        st.rerun()
+    na_frente = max((s["posicao"] for s in situacoes if s), default=0)
+    espera = f" ({na_frente} na frente)" if na_frente else ""
+    st.info(f"⏳ Gerando arquivo{espera}... pode continuar usando o sistema.")
+
+
+def render_exportacao():
+    numero = (get("contrato__numero", "") or "").strip() or "novo"
+    pendentes = []
+
+    for col, formato in zip(st.columns(len(FORMATOS_TELA)), FORMATOS_TELA):
+        cfg = FORMATOS[formato]
+        ext = cfg["extensao"]
+        tid = id_trabalho(st.session_state.dados, formato)
+
+        with col:
+            conteudo = _arquivo_pronto(formato, tid)
+            if conteudo is not None:
+                st.download_button(
+                    f"📄 Baixar contrato (.{ext})",
+                    data=conteudo,
+                    file_name=f"contrato_{numero}.{ext}",
+                    mime=cfg["mime"],
+                    key=f"baixar_{formato}",
+                )
+                continue
+
+            s = FILA_DOCUMENTOS.situacao(tid)
+            if s and s["estado"] in ("fila", "rodando"):
+                pendentes.append(tid)
+                st.button(f"⏳ Gerando .{ext}...", key=f"gerar_{formato}", disabled=True)
+            else:
+                if s and s["estado"] == "erro":
+                    st.caption(f"⚠️ Falhou: {s['erro']}")
+                st.button(f"⚙️ Gerar .{ext}", key=f"gerar_{formato}", on_click=_pedir_arquivo, args=(formato,))
+
+    aviso = st.session_state.pop("_aviso_exportacao", None)
+    if aviso:
+        st.warning(aviso)
+    if pendentes:
+        _acompanhar_exportacao(tuple(pendentes))
+
+
+# ============================================================
+# TELA
+# ============================================================
+
+def render():
+
+    ensure_clausulas_entrega_chaves()
+
+    # ✅ contrato gerado pelo motor (sem depender do session_state)
+    contrato = gerar_contrato(st.session_state.dados, memo=memo_clausulas())
+
+    if not contrato["qualificacao_vendedores"]:
+        st.warning("Nenhuma PARTE VENDEDORA/CEDENTE cadastrada na etapa 'Parte Vendedora'.")
+    if not contrato["qualificacao_compradores"]:
+        st.warning("Nenhuma PARTE COMPRADORA/CESSIONÁRIA cadastrada na etapa 'Parte Compradora'.")
+    if not contrato["intermediadora"]:
+        st.warning("Texto da intermediadora não definido.")
+    if not contrato["objeto"]:
+        st.warning("Texto do OBJETO DO CONTRATO não definido.")
+
+    # ✅ arquivos gerados na fila em segundo plano (não travam a sessão)
+    render_exportacao()
+
+    # ✅ prévia inteira em UM elemento (antes: centenas de st.markdown por rerun)
+    st.markdown(previa_html(contrato), unsafe_allow_html=True)
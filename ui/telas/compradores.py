@@ -0,0 +1,30 @@
+"""
+TELA 4: COMPRADORES
+"""
+
+import streamlit as st
+
+from ui.componentes import add_party, ensure_min_one_party, remove_last_party, render_parte
+from ui.estado import get_list
+
+
+def render():
+    st.subheader("👥 Parte Compradora")
+
+    ensure_min_one_party("compradores", "comp")
+    compradores = get_list("compradores")
+
+    c1, c2 = st.columns(2)
+    with c1:
+        if st.button("➕ Adicionar comprador"):
+            add_party("compradores", "comp")
+            st.rerun()
+    with c2:
+        if st.button("🗑️ Remover último comprador", disabled=(len(compradores) <= 1)):
+            remove_last_party("compradores")
+            st.rerun()
+
+    st.divider()
+    for i, pfx in enumerate(compradores, start=1):
+        with st.expander(f"Parte Compradora {i}", expanded=(i == 1)):
+            render_parte(pfx, f"PARTE COMPRADORA {i}")
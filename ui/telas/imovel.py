@@ -0,0 +1,205 @@
+"""
+TELA 2: IMÓVEL
+"""
+
+import streamlit as st
+
+from gerador.mascaras import mask_ordinal_cartorio
+from ui.componentes import render_endereco
+from ui.estado import get, set_
+
+
+TIPOS_IMOVEL = [
+    "imóvel",
+    "apartamento",
+    "apartamento (matrícula em área maior)",
+    "sobrado",
+    "sobrado em condomínio",
+    "sobrado em condomínio (matrícula em área maior)",
+    "casa",
+    "casa em condomínio",
+    "casa em condomínio (matrícula em área maior)",
+    "terreno",
+    "outro",
+]
+
+
+def render():
+    st.subheader("🏠 Dados do Imóvel")
+
+
+    colA, colB = st.columns([1.1, 1.2])
+
+    # ============================================================
+    # COLUNA A — ENDEREÇO DO IMÓVEL
+    # ============================================================
+    with colA:
+        # cidade/UF alimentam a cidade do cartório na coluna ao lado
+        render_endereco("imovel__end", "Endereço do imóvel", sincronizar=("imovel__end__cidade", "imovel__end__uf"))
+
+    # ============================================================
+    # COLUNA B — IDENTIFICAÇÃO + CONDIÇÕES
+    # ============================================================
+    with colB:
+        st.markdown("### 📌 Identificação")
+
+        tipo_imovel = st.selectbox(
+            "Tipo do imóvel",
+            TIPOS_IMOVEL,
+            index=TIPOS_IMOVEL.index(get("imovel__tipo", "imóvel"))
+            if get("imovel__tipo", "imóvel") in TIPOS_IMOVEL
+            else 0,
+            key="imovel__tipo"
+        )
+        set_("imovel__tipo", tipo_imovel)
+
+        matricula = st.text_input(
+            "N.º matrícula",
+            value=get("imovel__matricula", ""),
+            key="imovel__matricula"
+        )
+        set_("imovel__matricula", matricula)
+
+        # Cartório ordinal no campo (via callback)
+        def cartorio_cb():
+            st.session_state["imovel__cartorio"] = mask_ordinal_cartorio(
+                st.session_state.get("imovel__cartorio", "")
+            )
+            set_("imovel__cartorio", st.session_state["imovel__cartorio"])
+
+        if "imovel__cartorio" not in st.session_state:
+            st.session_state["imovel__cartorio"] = get("imovel__cartorio", "")
+
+        st.text_input(
+            "N.º do cartório",
+            key="imovel__cartorio",
+            on_change=cartorio_cb,
+            placeholder="Ex.: 2"
+        )
+
+        # ✅ Autopreenchimento da cidade do cartório com a cidade do imóvel (ViaCEP)
+        cidade_auto = st.session_state.get("imovel__end__cidade", "").strip()
+        uf_auto = st.session_state.get("imovel__end__uf", "").strip()
+
+        if uf_auto == "SP" and cidade_auto:
+            st.session_state["imovel__cidade_cartorio"] = cidade_auto
+            set_("imovel__cidade_cartorio", cidade_auto)
+
+        cidade_cartorio = st.text_input(
+            "Cidade do cartório",
+            value=st.session_state.get("imovel__cidade_cartorio", ""),
+            key="imovel__cidade_cartorio"
+        )
+        set_("imovel__cidade_cartorio", cidade_cartorio)
+
+        contribuinte = st.text_input(
+            "Nº do contribuinte",
+            value=get("imovel__contribuinte", ""),
+            key="imovel__contribuinte"
+        )
+        set_("imovel__contribuinte", contribuinte)
+
+        # ============================================================
+        # ✅ Informações adicionais
+        # ============================================================
+
+        # --- ANTES dos checkboxes (logo no início do bloco "Informações adicionais") ---
+        if "imovel__parcelamento_ativado" not in st.session_state:
+            st.session_state["imovel__parcelamento_ativado"] = bool(get("parcelamento_ativado", False))
+        
+        if "imovel__permutas_ativado" not in st.session_state:
+            st.session_state["imovel__permutas_ativado"] = bool(get("permutas_dacao_ativado", False))
+        
+        # --- CHECKBOXES (SEM value=) ---
+        st.checkbox("Ativar tela de Parcelamento detalhado", key="imovel__parcelamento_ativado")
+        set_("parcelamento_ativado", st.session_state["imovel__parcelamento_ativado"])
+        
+        st.checkbox("Ativar tela de Permutas / Dação em pagamento", key="imovel__permutas_ativado")
+        set_("permutas_dacao_ativado", st.session_state["imovel__permutas_ativado"])
+
+        
+        st.divider()
+        st.markdown("### Informações adicionais")
+        
+        c1, c2, c3, c4 = st.columns(4)
+                
+        with c1:
+            par_far = st.radio(
+                "Imóvel do PAR ou FAR?",
+                ["NÃO", "SIM"],
+                horizontal=True,
+                index=0,
+                key="imovel__par_far"
+            )
+            set_("imovel__par_far", par_far)
+
+        with c2:
+            alienado = st.radio(
+                "Alienado fiduciariamente?",
+                ["NÃO", "SIM"],
+                horizontal=True,
+                index=0,
+                key="imovel__alienado"
+            )
+            set_("imovel__alienado", alienado)
+        
+        with c3:
+            alugado = st.radio(
+                "O imóvel está locado a terceiros?",
+                ["NÃO", "SIM"],
+                horizontal=True,
+                index=0,
+                key="imovel__alugado"
+            )
+            set_("imovel__alugado", alugado)
+        
+        if alugado == "SIM":
+            locacao = st.text_area(
+                "O inquilino vai desocupar o imóvel ou a Parte Compradora vai assumir a locação?",
+                value=get("imovel__locacao", ""),
+                height=140,
+                key="imovel__locacao"
+            )
+            set_("imovel__locacao", locacao)
+        else:
+            set_("imovel__locacao", "")
+            
+        with c4:
+            ficara_bens = st.radio(
+                "Ficará bens no imóvel?",
+                ["NÃO", "SIM"],
+                horizontal=True,
+                index=0,
+                key="imovel__ficara_bens"
+            )
+            set_("imovel__ficara_bens", ficara_bens)
+            
+        if ficara_bens == "SIM":
+            bens = st.text_area(
+                "O que ficará no imóvel? (indicar somente os bens - Exemplo.: armário, sofá, etc.)",
+                value=get("imovel__bens", ""),
+                height=140,
+                key="imovel__bens"
+            )
+            set_("imovel__bens", bens)
+        else:
+            set_("imovel__bens", "")
+
+    # ============================================================
+    # DESCRIÇÃO DO IMÓVEL NA MATRÍCULA
+    # ============================================================
+    st.divider()
+
+    nao_lancar_descricao = "matrícula em área maior" in (tipo_imovel or "").lower()
+
+    if nao_lancar_descricao:
+        st.warning("🟡 Regra aplicada: NÃO lançar descrição do imóvel (matrícula em área maior).")
+        set_("imovel__descricao_matricula", "")
+    else:
+        descricao = st.text_area(
+            "📝 Descrição do imóvel na matrícula",
+            value=get("imovel__descricao_matricula", ""),
+            height=180,
+            key="imovel__descricao_matricula"
+        )
+        set_("imovel__descricao_matricula", descricao)
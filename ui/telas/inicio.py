@@ -0,0 +1,41 @@
+"""
+TELA 1: INÍCIO (renomear título depois, conforme você quer)
+"""
+
+import streamlit as st
+
+from ui.estado import get, set_
+
+
+def render():
+    st.subheader("📝 Dados iniciais do contrato")
+
+    c1, c2, c3 = st.columns([1, 1, 1])
+
+    with c1:
+        numero = st.text_input(
+            "Número do contrato",
+            value=get("contrato__numero", ""),
+            key="contrato__numero_input",
+            placeholder="Ex.: 1981"
+        )
+        set_("contrato__numero", numero)
+
+    with c2:
+        tipo = st.selectbox(
+            "Tipo de contrato",
+            ["Compromisso de Venda e Compra de Imóvel", "Cessão de Posse e Direitos sobre Imóvel"],
+            index=0 if get("contrato__tipo", "Compromisso de Venda e Compra de Imóvel")
+                    == "Compromisso de Venda e Compra de Imóvel" else 1,
+            key="contrato__tipo_select",
+        )
+        set_("contrato__tipo", tipo)
+
+    with c3:
+        email = st.text_input(
+            "E-mail do solicitante do contrato",
+            value=get("contrato__email_solicitante", ""),
+            key="contrato__email_solicitante_input",
+            placeholder="ex: cliente@cliente.com.br"
+        )
+        set_("contrato__email_solicitante", email)
@@ -0,0 +1,33 @@
+"""
+TELA: LOCALIZAR CONTRATO (OCULTA)
+"""
+
+import streamlit as st
+
+from ui.navegacao import go_to_step
+from ui.repositorio import (
+    carregar_contrato_no_estado,
+    sb_obter_contrato_versao,
+    tenant_imobiliaria,
+)
+
+
+def render():
+    st.header("🔎 Localizar contrato")
+
+    numero = st.text_input("Número do contrato")
+    versao = st.number_input("Versão (0 = última)", min_value=0, step=1, value=0)
+
+    if st.button("Buscar contrato"):
+        contrato = sb_obter_contrato_versao(
+            tenant_imobiliaria(),
+            numero.strip(),
+            int(versao) or None,
+        )
+
+        if contrato:
+            carregar_contrato_no_estado(contrato)
+            go_to_step("inicio")
+            st.rerun()
+        else:
+            st.error("Contrato não encontrado.")
@@ -0,0 +1,13 @@
+"""
+TELA 6: PARCELAMENTO (detalhado)
+"""
+
+import streamlit as st
+
+from ui.estado import get, set_
+
+
+def render():
+    st.subheader("📆 Parcelamento (Detalhado)")
+    desc = st.text_area("Descreva o parcelamento (parcelas, datas, forma)", value=get("parcelamento_descricao", ""), height=220, key="parcelamento_descricao")
+    set_("parcelamento_descricao", desc)
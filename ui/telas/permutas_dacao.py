@@ -0,0 +1,27 @@
+"""
+TELA 7: PERMUTAS / DAÇÃO (detalhado)
+"""
+
+import streamlit as st
+
+from ui.componentes import render_endereco
+from ui.estado import get, set_
+
+
+def render():
+    st.subheader("🔁 Permutas / Dação em Pagamento (Detalhado)")
+
+    d_veic = st.selectbox("Há dação em VEÍCULO?", ["NÃO", "SIM"], key="dacao_veiculo")
+    set_("dacao_veiculo", d_veic)
+
+    d_imov = st.selectbox("Há dação em IMÓVEL?", ["NÃO", "SIM"], key="dacao_imovel")
+    set_("dacao_imovel", d_imov)
+
+    if d_imov == "SIM":
+        render_endereco("dacao_imovel__end", "Imóvel dado em pagamento")
+
+    if d_imov == "SIM" or d_veic == "SIM":
+        desc = st.text_area("Descreva a dação/permutas (bem, valor, condições)", value=get("dacao_descricao", ""), height=220, key="dacao_descricao")
+        set_("dacao_descricao", desc)
+    else:
+        set_("dacao_descricao", "")
@@ -0,0 +1,185 @@
+"""
+TELA 5: PREÇO E CHAVES
+"""
+
+import streamlit as st
+
+from gerador.mascaras import mask_money_br
+from ui.componentes import ensure_agents, render_agente
+from ui.estado import get, get_list, set_, set_list
+from ui.navegacao import abrir_admin_corretores_com_senha
+
+
+# ============================================================
+# FUNÇÃO AUXILIAR PARA INPUT DE DINHEIRO COM MÁSCARA
+# ============================================================
+def money_input(label: str, key: str, placeholder="R$ 0,00"):
+    if key not in st.session_state:
+        st.session_state[key] = get(key, "")
+
+    def _cb():
+        st.session_state[key] = mask_money_br(st.session_state.get(key, ""))
+        set_(key, st.session_state[key])
+
+    st.text_input(label, key=key, on_change=_cb, placeholder=placeholder)
+    set_(key, st.session_state.get(key, ""))
+
+    return st.session_state.get(key, "")
+
+
+def render():
+    st.subheader("💰 Preço / Chaves / Comissão")
+    st.caption("Preencha a composição do preço. Os valores serão formatados automaticamente.")
+
+    colL, colR = st.columns([1.1, 1.0])
+
+    # ==========================================================
+    # COLUNA ESQUERDA — COMPOSIÇÃO DO PREÇO
+    # ==========================================================
+    with colL:
+        st.markdown("### 🧾 Composição do Preço")
+
+        preco_total = money_input("PREÇO TOTAL", "preco_total")
+
+        financiamento = money_input("🏦 FINANCIAMENTO", "preco_financiamento")
+        fgts = money_input("📌 FGTS", "preco_fgts")
+        entrada = money_input("💵 ENTRADA", "preco_entrada")
+        sinal = money_input("✍️ SINAL", "preco_sinal")
+        recurso_proprio = money_input("👤 RECURSO PRÓPRIO", "preco_recurso_proprio")
+        carta_credito = money_input("📄 CARTA DE CRÉDITO", "preco_carta_credito")
+        subsidio = money_input("🎯 SUBSÍDIO", "preco_subsidio")
+
+        # Parcelamento Total (valor total parcelado)
+        parc_total = money_input("🧾 PARCELAMENTO (VALOR TOTAL PARCELADO)", "preco_parcelamento_total")
+
+        outros = money_input("➕ OUTROS (valor total)", "preco_outros")
+        outros_desc = st.text_area("Descreva OUTROS (se houver)", value=get("preco_outros_descricao", ""), height=100, key="preco_outros_descricao")
+        set_("preco_outros_descricao", outros_desc)
+
+        st.divider()
+
+        # ==========================================================
+        # ATIVA TELAS DETALHADAS
+        # ==========================================================
+        ativar_parc = st.checkbox(
+            "Ativar tela de Parcelamento detalhado",
+            value=bool(get("parcelamento_ativado", False) or parc_total.strip()),
+            key="parcelamento_ativado_chk"
+        )
+        set_("parcelamento_ativado", ativar_parc)
+
+        ativar_dacao = st.checkbox(
+            "Ativar tela de Permutas / Dação em pagamento",
+            value=get("permutas_dacao_ativado", False),
+            key="permutas_dacao_chk"
+        )
+        set_("permutas_dacao_ativado", ativar_dacao)
+
+    # ==========================================================
+    # COLUNA DIREITA — CHAVES / COMISSÃO + CORRETORES
+    # ==========================================================
+    with colR:
+        st.markdown("### 🔑 Chaves / Comissão")
+
+        entrega = st.selectbox(
+            "Entrega de chaves",
+            [
+                "30 dias após crédito em conta",
+                "30 dias após assinatura no Banco",
+                "30 dias após assinatura do CCV",
+                "No ato da assinatura no Banco",
+                "No ato da assinatura do CCV",
+                "24 horas do crédito em conta",
+                "Escrever no contrato",
+            ],
+            key="entrega_chaves"
+        )
+        set_("entrega_chaves", entrega)
+
+        if entrega == "Escrever no contrato":
+            txt = st.text_area(
+                "Texto exato para o CCV final",
+                value=get("entrega_chaves_texto", ""),
+                key="entrega_chaves_texto",
+                height=110
+            )
+            set_("entrega_chaves_texto", txt)
+        else:
+            set_("entrega_chaves_texto", "")
+
+        quem = st.selectbox(
+            "Quem paga a comissão?",
+            ["PARTE VENDEDORA", "PARTE COMPRADORA", "AMBAS", "TERCEIRO", "NÃO SE APLICA"],
+            key="quem_paga_comissao"
+        )
+        set_("quem_paga_comissao", quem)
+
+        valor_comissao = money_input("Valor da comissão", "valor_comissao")
+
+        momento = st.selectbox(
+            "Momento do pagamento",
+            ["NA ESCRITURA", "NA ASSINATURA DO CONTRATO", "NA LIBERAÇÃO DE VALORES NA CONTA DO VENDEDOR"],
+            key="momento_pagto"
+        )
+        set_("momento_pagto", momento)
+
+        st.divider()
+        
+        # 🔐 botão para abrir ADMIN com senha
+        if st.button("🔐 Gerenciar Corretores (senha)", key="btn_admin_corretores"):
+            abrir_admin_corretores_com_senha(step_voltar=st.session_state.step_index)
+        
+        st.markdown("### 👔 Corretores")
+
+        ensure_agents()
+
+        # ----------------------------
+        # Corretores de venda
+        # ----------------------------
+        st.markdown("#### Corretores(as) de Venda")
+        corv = get_list("corretores_venda")
+
+        # ✅ Primeiro mostra os corretores
+        for i, pfx in enumerate(corv, start=1):
+            render_agente(pfx, f"Corretor de venda {i}", "30")
+
+        # ✅ Agora os botões ficam embaixo
+        colA, colB = st.columns(2)
+
+        with colA:
+            if st.button("➕ Adicionar mais um(a) corretor(a) de venda", key="add_corv"):
+                corv.append(f"corv{len(corv)+1:02d}")
+                set_list("corretores_venda", corv)
+                st.rerun()
+
+        with colB:
+            if st.button("🗑️ Remover último corretor de venda", disabled=(len(corv) <= 1), key="rem_corv"):
+                corv.pop()
+                set_list("corretores_venda", corv)
+                st.rerun()
+
+
+        # ----------------------------
+        # Corretores de captação
+        # ----------------------------
+        st.markdown("#### Corretores(as) de Captação")
+        corc = get_list("corretores_captacao")
+
+        # ✅ Primeiro mostra os corretores
+        for i, pfx in enumerate(corc, start=1):
+            render_agente(pfx, f"Corretor de captação {i}", "15")
+
+        # ✅ Botões embaixo
+        colA, colB = st.columns(2)
+
+        with colA:
+            if st.button("➕ Adicionar mais um(a) corretor(a) de captação", key="add_corc"):
+                corc.append(f"corc{len(corc)+1:02d}")
+                set_list("corretores_captacao", corc)
+                st.rerun()
+
+        with colB:
+            if st.button("🗑️ Remover último corretor de captação", disabled=(len(corc) <= 1), key="rem_corc"):
+                corc.pop()
+                set_list("corretores_captacao", corc)
+                st.rerun()
@@ -0,0 +1,42 @@
+"""
+TELA OCULTA: LOGIN (Admin / Imobiliárias)
+"""
+
+import streamlit as st
+
+from ui.auth import validar_login
+from ui.estado import get
+from ui.navegacao import abrir_admin_clausulas, abrir_admin_corretores, go_to_step
+
+
+def render():
+    st.subheader("🔐 Acesso restrito")
+    st.info("Informe usuário e senha para acessar as áreas restritas.")
+
+    usuario = st.text_input("Usuário", key="auth_usuario")
+    senha = st.text_input("Senha", type="password", key="auth_senha")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if st.button("✅ Entrar", key="btn_auth_entrar"):
+            if validar_login(usuario, senha):
+                # salva o usuário logado (imobiliária)
+                st.session_state["auth_user"] = usuario.strip()
+
+                # libera admin (se for admin) e também libera as telas restritas
+                st.session_state.admin_liberado = (usuario.strip() == "admin")
+                st.session_state.admin_corretores_liberado = True
+
+                destino = get("destino_admin", "admin_corretores")
+                if destino == "admin_clausulas":
+                    abrir_admin_clausulas()
+                else:
+                    abrir_admin_corretores()
+            else:
+                st.error("❌ Usuário ou senha incorretos.")
+
+    with col2:
+        if st.button("⬅️ Voltar", key="btn_auth_voltar"):
+            go_to_step("preco_chaves")  # mantém seu fluxo atual
+            st.rerun()
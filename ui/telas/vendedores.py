@@ -0,0 +1,30 @@
+"""
+TELA 3: VENDEDORES
+"""
+
+import streamlit as st
+
+from ui.componentes import add_party, ensure_min_one_party, remove_last_party, render_parte
+from ui.estado import get_list
+
+
+def render():
+    st.subheader("👥 Parte Vendedora")
+
+    ensure_min_one_party("vendedores", "vend")
+    vendedores = get_list("vendedores")
+
+    c1, c2 = st.columns(2)
+    with c1:
+        if st.button("➕ Adicionar vendedor"):
+            add_party("vendedores", "vend")
+            st.rerun()
+    with c2:
+        if st.button("🗑️ Remover último vendedor", disabled=(len(vendedores) <= 1)):
+            remove_last_party("vendedores")
+            st.rerun()
+
+    st.divider()
+    for i, pfx in enumerate(vendedores, start=1):
+        with st.expander(f"Parte Vendedora {i}", expanded=(i == 1)):
+            render_parte(pfx, f"PARTE VENDEDORA {i}")